@@ -0,0 +1,275 @@
+# Filename: BlockedList.py
+
+'''
+Blocked List: A list stored as many small lists (blocks) of at most 2 * LOAD items instead of one big array.
+
+Cheap Middle Edits: insert(), pop(i), remove() and del only shift the items of one block, not everything after the position, so editing the middle of a long list stops being O(n).
+
+Fenwick Tree Index: A Fenwick (binary indexed) tree over the block lengths finds the block that holds position i in O(log n) and is updated in O(log n) when a block grows or shrinks.
+
+Splitting and Merging: A block that grows past 2 * LOAD is split in two, a block that shrinks below LOAD / 4 is merged with its neighbour, so the number of blocks stays around n / LOAD.
+
+Slicing: A slice with step 1 finds its first block once and then copies only the k requested items, O(log n + k).
+
+List API: append, extend, insert, remove, pop, clear, sort, reverse, count, index, copy, len(), 'in', indexing, slicing and iteration behave like on a normal list.
+'''
+
+from collections.abc import MutableSequence, Sequence
+from itertools import chain, islice
+
+LOAD = 512
+
+
+class BlockedList(MutableSequence):
+    def __init__(self, iterable=(), load=LOAD):
+        if load < 1:
+            raise ValueError("load must be at least 1")
+        self._load = load
+        self._blocks = []
+        self._length = 0
+        self._tree = []
+        self.extend(iterable)
+
+    # 1. The Fenwick Tree Over Block Lengths
+    # _tree[k] (1-based) holds the total length of a range of blocks ending at block k.
+    def _rebuild_tree(self):
+        tree = [0] + [len(block) for block in self._blocks]
+        size = len(tree)
+        for k in range(1, size):
+            parent = k + (k & -k)
+            if parent < size:
+                tree[parent] += tree[k]
+        self._tree = tree
+
+    def _tree_add(self, block_number, delta):
+        k = block_number + 1
+        size = len(self._tree)
+        while k < size:
+            self._tree[k] += delta
+            k += k & -k
+
+    # Returns (block number, offset in the block) of a position 0 <= index < len(self).
+    def _locate(self, index):
+        tree = self._tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            next_position = position + step
+            if next_position < len(tree) and tree[next_position] <= index:
+                position = next_position
+                index -= tree[position]
+            step >>= 1
+        return position, index
+
+    def _normalize(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("list index out of range")
+        return index
+
+    # 2. Keeping Blocks Balanced
+    def _split(self, block_number):
+        block = self._blocks[block_number]
+        if len(block) > 2 * self._load:
+            self._blocks.insert(block_number + 1, block[self._load:])
+            del block[self._load:]
+            self._rebuild_tree()
+
+    def _shrink(self, block_number):
+        block = self._blocks[block_number]
+        if not block:
+            del self._blocks[block_number]
+            self._rebuild_tree()
+        elif len(block) < self._load // 4 and len(self._blocks) > 1:
+            neighbour = block_number + 1 if block_number + 1 < len(self._blocks) else block_number - 1
+            first, second = sorted((block_number, neighbour))
+            self._blocks[first].extend(self._blocks[second])
+            del self._blocks[second]
+            self._rebuild_tree()
+            self._split(first)
+
+    # 3. Reading
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self):
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._get_slice(index)
+        block_number, offset = self._locate(self._normalize(index))
+        return self._blocks[block_number][offset]
+
+    def _get_slice(self, index):
+        start, stop, step = index.indices(self._length)
+        count = len(range(start, stop, step))
+        if count == 0:
+            return BlockedList(load=self._load)
+        if step > 0:
+            block_number, offset = self._locate(start)
+            blocks = self._blocks
+            later_blocks = (blocks[i] for i in range(block_number + 1, len(blocks)))
+            items = chain(islice(blocks[block_number], offset, None), chain.from_iterable(later_blocks))
+            return BlockedList(islice(items, 0, (count - 1) * step + 1, step), load=self._load)
+        return BlockedList((self[i] for i in range(start, stop, step)), load=self._load)
+
+    def __contains__(self, value):
+        return any(value in block for block in self._blocks)
+
+    def count(self, value):
+        return sum(block.count(value) for block in self._blocks)
+
+    def index(self, value, start=0, stop=None):
+        start, stop, _ = slice(start, stop).indices(self._length)
+        position = 0
+        for block in self._blocks:
+            end = position + len(block)
+            if end > start and position < stop:
+                try:
+                    return position + block.index(value, max(start - position, 0), min(stop - position, len(block)))
+                except ValueError:
+                    pass
+            position = end
+        raise ValueError(f"{value!r} is not in list")
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f"BlockedList({list(self)!r})"
+
+    # 4. Writing
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            items = list(self)
+            items[index] = value
+            self._reset(items)
+            return
+        block_number, offset = self._locate(self._normalize(index))
+        self._blocks[block_number][offset] = value
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            items = list(self)
+            del items[index]
+            self._reset(items)
+            return
+        block_number, offset = self._locate(self._normalize(index))
+        del self._blocks[block_number][offset]
+        self._length -= 1
+        self._tree_add(block_number, -1)
+        self._shrink(block_number)
+
+    def insert(self, index, value):
+        if index < 0:
+            index = max(index + self._length, 0)
+        if index >= self._length:
+            self.append(value)
+            return
+        block_number, offset = self._locate(index)
+        self._blocks[block_number].insert(offset, value)
+        self._length += 1
+        self._tree_add(block_number, 1)
+        self._split(block_number)
+
+    def append(self, value):
+        if not self._blocks:
+            self._blocks.append([value])
+            self._length = 1
+            self._rebuild_tree()
+            return
+        self._blocks[-1].append(value)
+        self._length += 1
+        self._tree_add(len(self._blocks) - 1, 1)
+        self._split(len(self._blocks) - 1)
+
+    def extend(self, iterable):
+        if iterable is self:
+            iterable = list(iterable)
+        iterator = iter(iterable)
+        if self._blocks:
+            last = self._blocks[-1]
+            room = 2 * self._load - len(last)
+            before = len(last)
+            last.extend(islice(iterator, room))
+            self._length += len(last) - before
+        while True:
+            block = list(islice(iterator, self._load))
+            if not block:
+                break
+            self._blocks.append(block)
+            self._length += len(block)
+        self._rebuild_tree()
+
+    def pop(self, index=-1):
+        if not self._length:
+            raise IndexError("pop from empty list")
+        value = self[index]
+        del self[index]
+        return value
+
+    def remove(self, value):
+        del self[self.index(value)]
+
+    def clear(self):
+        self._reset([])
+
+    def _reset(self, items):
+        self._blocks = []
+        self._length = 0
+        self.extend(items)
+
+    def sort(self, key=None, reverse=False):
+        self._reset(sorted(self, key=key, reverse=reverse))
+
+    def reverse(self):
+        self._blocks.reverse()
+        for block in self._blocks:
+            block.reverse()
+        self._rebuild_tree()
+
+    def copy(self):
+        new = BlockedList(load=self._load)
+        new._blocks = [block[:] for block in self._blocks]
+        new._length = self._length
+        new._rebuild_tree()
+        return new
+
+    __copy__ = copy
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+
+# Example usage of the blocked list (same steps as ListOperations.py):
+if __name__ == "__main__":
+    my_list = BlockedList([1, 2, 3, 4, 5])
+    my_list[1] = 20
+    my_list.append(6)
+    my_list.insert(2, 30)
+    my_list.remove(20)
+    removed_element = my_list.pop(2)
+    print(my_list, removed_element)  # Output: BlockedList([1, 30, 4, 5, 6]) 3
+
+    my_list = BlockedList([1, 2, 3])
+    my_list.extend([4, 5, 6])
+    print(my_list[1:4])  # Output: BlockedList([2, 3, 4])
+    my_list.sort(reverse=True)
+    my_list.reverse()
+    print(my_list, 3 in my_list, my_list.count(5), my_list.index(5))  # Output: BlockedList([1, 2, 3, 4, 5, 6]) True 1 4
+
+    # Editing the middle of a million-element list
+    big = BlockedList(range(1_000_000))
+    for i in range(10_000):
+        big.insert(500_000, -i)
+        big.pop(250_000)
+    print(len(big), big[0], big[-1])  # Output: 1000000 0 999999
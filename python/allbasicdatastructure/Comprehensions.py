@@ -93,6 +93,28 @@ print(flattened)  # Output: [1, 2, 3, 4, 5, 6]
 combinations_dict = {x: y for x in range(2) for y in range(3)}
 print(combinations_dict)  # Output: {1: 2}
 
+# 7. Vectorized Comprehensions (see VectorizedComprehensions.py)
+# For very large ranges the numeric comprehensions above can be computed with NumPy arrays instead (falls back to pure Python).
+
+from VectorizedComprehensions import squares_dict as vectorized_squares_dict
+
+print(vectorized_squares_dict(5))  # Output: {0: 0, 1: 1, 2: 4, 3: 9, 4: 16}
+
+# 8. Streaming Nested Comprehensions (see StreamingComprehensions.py)
+# Generators yield the flattened items and cartesian pairs one at a time (or in blocks of N) instead of building whole lists.
+
+from StreamingComprehensions import iter_flatten, cartesian_chunks
+
+print(list(iter_flatten(matrix)))  # Output: [1, 2, 3, 4, 5, 6]
+print(list(cartesian_chunks(range(2), range(3), size=4)))  # Output: [[(0, 0), (0, 1), (0, 2), (1, 0)], [(1, 1), (1, 2)]]
+
+# 9. Integer Sets as Bitmaps (see SetOperations.py)
+# Sets of non-negative integers can be stored as compressed bitmaps; &, |, - and ^ then work chunk by chunk.
+
+from SetOperations import RoaringBitmap
+
+print(RoaringBitmap(squares_set) & RoaringBitmap(even_set))  # Output: RoaringBitmap([0, 4])
+
 # Example outputs for each comprehension type:
 print(f"List of squares: {squares}")
 print(f"Tuple of even numbers: {even_numbers_tuple}")
@@ -106,6 +106,41 @@ values_list = list(my_dict.values())  # Converts values to a list. Result: ['Ali
 # You can sort a dictionary by its keys using the sorted() function.
 sorted_dict = dict(sorted(my_dict.items()))  # Returns a dictionary sorted by keys.
 
+# 16. Compact Record Types (see RecordTypes.py)
+# Many dictionaries with the same keys can be replaced by a __slots__ record type, or stored column by column in a RecordTable.
+from RecordTypes import make_record_type, RecordTable
+
+Person = make_record_type("Person", {"name": str, "age": int})
+person = Person(nested_dict["person2"])  # Works like a dict with fixed keys. Result: Person({'name': 'Bob', 'age': 25})
+people = RecordTable(Person, nested_dict.values())  # Names in a list, ages packed in an array('q')
+oldest_age = max(people.column("age"))  # Result: 30
+
+# 17. Persistent Dictionaries (see PersistentDict.py)
+# A PersistentDict is never modified; assoc() and merge() return new versions that share structure with the old ones.
+from PersistentDict import PersistentDict
+
+base_config = PersistentDict(original_dict)
+request_config = base_config.assoc("b", 20).merge({"c": 3})  # No copy of base_config is made. Result: {'a': 1, 'b': 20, 'c': 3}
+
+# 18. Sorted Dictionaries (see SortedDict.py)
+# A SortedDict keeps its keys ordered on every insert, so the sorted() call of section 15 is not needed.
+from SortedDict import SortedDict
+
+sorted_ages = SortedDict({"person2": 25, "person1": 30})
+sorted_ages["person0"] = 41  # Inserted in order. Keys: ['person0', 'person1', 'person2']
+closest_person = sorted_ages.floor_key("person1z")  # Largest key <= 'person1z'. Result: 'person1'
+
+# 19. Disk-Backed Dictionaries (see DiskDictionary.py)
+# A DiskDict supports the same operations but keeps its entries in a memory-mapped file, so it can be larger than RAM.
+import os
+import tempfile
+from DiskDictionary import DiskDict
+
+with tempfile.TemporaryDirectory() as disk_dir:  # Removed again, with the file, at the end of the block
+    with DiskDict(os.path.join(disk_dir, "people.ddict")) as disk_dict:
+        disk_dict.update(nested_dict)  # Written to the file
+        disk_person = disk_dict.get("person2")  # Read back from the file. Result: {'name': 'Bob', 'age': 25}
+
 # Example dictionary printout after operations:
 print(f"Original dictionary: {my_dict}")
 print(f"Name: {name}")
@@ -120,4 +155,11 @@ print(f"Copied dictionary: {copied_dict}")
 print(f"Nested dictionary access: {person1_name}")
 print(f"Keys list: {keys_list}")
 print(f"Values list: {values_list}")
-print(f"Sorted dictionary by keys: {sorted_dict}")
\ No newline at end of file
+print(f"Sorted dictionary by keys: {sorted_dict}")
+print(f"Person record: {person}")
+print(f"Oldest age in the table: {oldest_age}")
+print(f"Base config: {base_config.sorted_items()}")
+print(f"Request config: {request_config.sorted_items()}")
+print(f"Sorted dictionary: {sorted_ages}")
+print(f"Floor key of 'person1z': {closest_person}")
+print(f"Person read from disk: {disk_person}")
\ No newline at end of file
@@ -0,0 +1,371 @@
+# Filename: DiskDictionary.py
+
+'''
+Disk-Backed Dictionary: DiskDict behaves like a dict ([] access, 'in', get(), pop(), update(), iteration, len(), keys()/values()/items() views) but keeps its entries in a file instead of RAM.
+
+Memory-Mapped File: The file is opened with mmap, so reading an entry is a memory access; the operating system loads only the pages that are actually used and keeps them in its page cache.
+
+Hash File Layout: A fixed header, then a table of slots (8-byte hash + 8-byte offset) using open addressing with linear probing, then the data region where every entry is appended as (key length, value length, key bytes, value bytes).
+
+Sharing Between Processes: Several worker processes can open the same file with readonly=True; they all read the same page-cache pages instead of loading private copies.
+
+Bulk Load: DiskDict.bulk_load() writes a new file in one sequential pass with a table already sized for all entries.
+
+Compaction: Overwritten and deleted entries leave dead bytes behind; compact() rewrites the file with only the live entries.
+
+Keys and Values: Both are stored with pickle. Keys must pickle to the same bytes whenever they are equal (str, bytes, int and tuples of them do); 1 and 1.0 are different keys here.
+'''
+
+import mmap
+import os
+import pickle
+import struct
+from collections.abc import ItemsView, MutableMapping
+from hashlib import blake2b
+
+MAGIC = b"PYDDICT1"
+HEADER = struct.Struct("<8sQQQQQ")  # magic, slots, count, data_end, tombstones, garbage
+HEADER_SIZE = 64
+SLOT = struct.Struct("<QQ")  # key hash, record offset
+RECORD = struct.Struct("<II")  # key length, value length
+
+EMPTY = 0
+DELETED = 1  # Real offsets are always past the header, so 0 and 1 are free to use as markers.
+
+MIN_SLOTS = 64
+MAX_LOAD = 0.7
+
+
+def _key_bytes(key):
+    return pickle.dumps(key, protocol=4)
+
+
+def _key_hash(data):
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), "little")
+
+
+def _slots_for(count):
+    # Smallest power of two that keeps the table below MAX_LOAD.
+    slots = MIN_SLOTS
+    while count >= slots * MAX_LOAD:
+        slots *= 2
+    return slots
+
+
+# 1. Creating an Empty File
+def _create_file(path, slots):
+    data_start = HEADER_SIZE + slots * SLOT.size
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, slots, 0, data_start, 0, 0).ljust(HEADER_SIZE, b"\0"))
+        f.truncate(data_start)
+
+
+# 2. The DiskDict Class
+# A view like dict.items() (len(), 'in', set operations, iterating it again), but iterating reads each record
+# once instead of looking every key up again.
+class _ItemsView(ItemsView):
+    def __iter__(self):
+        disk_dict = self._mapping
+        for offset in disk_dict._live_offsets():
+            yield pickle.loads(disk_dict._read_key_bytes(offset)), disk_dict._read_value(offset)
+
+
+class DiskDict(MutableMapping):
+    def __init__(self, path, readonly=False):
+        self.path = path
+        self.readonly = readonly
+        if not os.path.exists(path):
+            if readonly:
+                raise FileNotFoundError(path)
+            _create_file(path, MIN_SLOTS)
+        self._open()
+
+    # The magic is checked before the file is mapped, so a file that is not a DiskDict is never written to.
+    def _open(self):
+        self._map = None
+        self._file = open(self.path, "rb" if self.readonly else "r+b")
+        if self._file.read(len(MAGIC)) != MAGIC:
+            self._file.close()
+            raise ValueError(f"{self.path} is not a DiskDict file")
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._map = mmap.mmap(self._file.fileno(), 0, access=access)
+        _, self._slots, self._count, self._data_end, self._tombstones, self._garbage = HEADER.unpack_from(self._map, 0)
+
+    def close(self):
+        if self._map is not None:
+            if not self.readonly:
+                self._write_header()
+                self._map.flush()
+            self._map.close()
+            self._file.close()
+            self._map = None
+
+    def flush(self):
+        self._write_header()
+        self._map.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # The header in the map is updated after every change, so a writer that never calls close() still leaves a
+    # consistent file behind: the operating system writes the mapped pages back even if the process exits.
+    def _write_header(self):
+        HEADER.pack_into(self._map, 0, MAGIC, self._slots, self._count, self._data_end, self._tombstones, self._garbage)
+
+    # 3. Probing the Slot Table
+    # Returns (slot of the key or None, first reusable slot, record offset of the key or None).
+    def _probe(self, data, h):
+        mask = self._slots - 1
+        index = h & mask
+        reusable = None
+        while True:
+            position = HEADER_SIZE + index * SLOT.size
+            slot_hash, offset = SLOT.unpack_from(self._map, position)
+            if offset == EMPTY:
+                return None, reusable if reusable is not None else index, None
+            if offset == DELETED:
+                if reusable is None:
+                    reusable = index
+            elif slot_hash == h and self._read_key_bytes(offset) == data:
+                return index, reusable, offset
+            index = (index + 1) & mask
+
+    def _read_key_bytes(self, offset):
+        key_length, _ = RECORD.unpack_from(self._map, offset)
+        start = offset + RECORD.size
+        return self._map[start:start + key_length]
+
+    def _read_value(self, offset):
+        key_length, value_length = RECORD.unpack_from(self._map, offset)
+        start = offset + RECORD.size + key_length
+        return pickle.loads(self._map[start:start + value_length])
+
+    def _set_slot(self, index, h, offset):
+        SLOT.pack_into(self._map, HEADER_SIZE + index * SLOT.size, h, offset)
+
+    # 4. Appending Records
+    # The file grows by doubling, which needs a fresh mmap of the new size.
+    def _append_record(self, key_data, value_data):
+        size = RECORD.size + len(key_data) + len(value_data)
+        offset = self._data_end
+        if offset + size > len(self._map):
+            self._grow(offset + size)
+        RECORD.pack_into(self._map, offset, len(key_data), len(value_data))
+        start = offset + RECORD.size
+        self._map[start:start + len(key_data)] = key_data
+        self._map[start + len(key_data):start + size - RECORD.size] = value_data
+        self._data_end = offset + size
+        # Recorded before the slot points at the record, so the next writer can't append over it.
+        self._write_header()
+        return offset
+
+    def _grow(self, needed):
+        new_size = max(needed, len(self._map) * 2)
+        self._map.close()
+        self._file.truncate(new_size)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE)
+
+    def _check_writable(self):
+        if self.readonly:
+            raise PermissionError("DiskDict was opened with readonly=True")
+
+    # 5. Dictionary Operations
+    def __getitem__(self, key):
+        data = _key_bytes(key)
+        _, _, offset = self._probe(data, _key_hash(data))
+        if offset is None:
+            raise KeyError(key)
+        return self._read_value(offset)
+
+    def __contains__(self, key):
+        data = _key_bytes(key)
+        return self._probe(data, _key_hash(data))[2] is not None
+
+    def __setitem__(self, key, value):
+        self._check_writable()
+        data = _key_bytes(key)
+        h = _key_hash(data)
+        index, reusable, old_offset = self._probe(data, h)
+        new_offset = self._append_record(data, pickle.dumps(value, protocol=4))
+        if old_offset is not None:
+            self._garbage += self._record_size(old_offset)
+            self._set_slot(index, h, new_offset)
+            self._write_header()
+            return
+        if SLOT.unpack_from(self._map, HEADER_SIZE + reusable * SLOT.size)[1] == DELETED:
+            self._tombstones -= 1
+        self._set_slot(reusable, h, new_offset)
+        self._count += 1
+        self._write_header()
+        if self._count + self._tombstones >= self._slots * MAX_LOAD:
+            self.compact()
+
+    def __delitem__(self, key):
+        self._check_writable()
+        data = _key_bytes(key)
+        h = _key_hash(data)
+        index, _, offset = self._probe(data, h)
+        if offset is None:
+            raise KeyError(key)
+        self._garbage += self._record_size(offset)
+        self._set_slot(index, 0, DELETED)
+        self._count -= 1
+        self._tombstones += 1
+        self._write_header()
+
+    def _record_size(self, offset):
+        key_length, value_length = RECORD.unpack_from(self._map, offset)
+        return RECORD.size + key_length + value_length
+
+    def __len__(self):
+        return self._count
+
+    def _live_offsets(self):
+        for index in range(self._slots):
+            _, offset = SLOT.unpack_from(self._map, HEADER_SIZE + index * SLOT.size)
+            if offset > DELETED:
+                yield offset
+
+    def __iter__(self):
+        for offset in self._live_offsets():
+            yield pickle.loads(self._read_key_bytes(offset))
+
+    def items(self):
+        return _ItemsView(self)
+
+    def __repr__(self):
+        return f"DiskDict({self.path!r}, {self._count} entries)"
+
+    # 6. Compaction
+    # Copies the live records into a new file, then swaps the files. The new table is sized for twice the live
+    # entries, so the next compaction is again a long way of inserts and deletes off.
+    def compact(self):
+        self._check_writable()
+        temp_path = self.path + ".compact"
+        records = ((self._read_key_bytes(offset), self._raw_value(offset)) for offset in self._live_offsets())
+        _write_temp_file(temp_path, records, 2 * self._count)
+        self._map.close()
+        self._file.close()
+        os.replace(temp_path, self.path)
+        self._open()
+
+    def _raw_value(self, offset):
+        key_length, value_length = RECORD.unpack_from(self._map, offset)
+        start = offset + RECORD.size + key_length
+        return self._map[start:start + value_length]
+
+    @property
+    def garbage_bytes(self):
+        return self._garbage
+
+    # 7. Bulk Loading
+    @classmethod
+    def bulk_load(cls, path, items, expected_size=None):
+        if isinstance(items, dict):
+            items = items.items()
+        if expected_size is None:
+            if not hasattr(items, "__len__"):
+                items = list(items)
+            expected_size = len(items)
+        records = ((_key_bytes(key), pickle.dumps(value, protocol=4)) for key, value in items)
+        # Written next to the target and renamed at the end, so an error leaves any existing file untouched.
+        temp_path = path + ".bulk"
+        _write_temp_file(temp_path, records, expected_size)
+        os.replace(temp_path, path)
+        return cls(path)
+
+
+# Writes a complete file from (key bytes, value bytes) pairs in one sequential pass.
+# The slot table is built in memory and written at the end.
+def _write_file(path, records, expected_size):
+    slots = _slots_for(expected_size)
+    table = bytearray(slots * SLOT.size)
+    mask = slots - 1
+    data_start = HEADER_SIZE + len(table)
+    count = garbage = 0
+    with open(path, "w+b") as f:
+        f.seek(data_start)
+        offset = data_start
+        for key_data, value_data in records:
+            h = _key_hash(key_data)
+            index = h & mask
+            while True:
+                slot_hash, slot_offset = SLOT.unpack_from(table, index * SLOT.size)
+                if slot_offset == EMPTY:
+                    count += 1
+                    break
+                if slot_hash == h and _same_key_on_disk(f, slot_offset, key_data):
+                    # Duplicate key in the input: the later value wins, like dict().
+                    garbage += _record_size_on_disk(f, slot_offset)
+                    break
+                index = (index + 1) & mask
+            if count >= slots * MAX_LOAD:
+                raise ValueError("more items than expected_size")
+            SLOT.pack_into(table, index * SLOT.size, h, offset)
+            f.write(RECORD.pack(len(key_data), len(value_data)))
+            f.write(key_data)
+            f.write(value_data)
+            offset += RECORD.size + len(key_data) + len(value_data)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, slots, count, offset, 0, garbage).ljust(HEADER_SIZE, b"\0"))
+        f.write(table)
+        f.truncate(max(offset, data_start))
+
+
+# Removes the unfinished file if writing it fails.
+def _write_temp_file(temp_path, records, expected_size):
+    try:
+        _write_file(temp_path, records, expected_size)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+# Helpers that read back an already written record, then return to the end of the file.
+def _same_key_on_disk(f, offset, key_data):
+    position = f.tell()
+    f.seek(offset)
+    key_length, _ = RECORD.unpack(f.read(RECORD.size))
+    same = key_length == len(key_data) and f.read(key_length) == key_data
+    f.seek(position)
+    return same
+
+
+def _record_size_on_disk(f, offset):
+    position = f.tell()
+    f.seek(offset)
+    key_length, value_length = RECORD.unpack(f.read(RECORD.size))
+    f.seek(position)
+    return RECORD.size + key_length + value_length
+
+
+# Example usage of the disk-backed dictionary:
+if __name__ == "__main__":
+    import tempfile
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "people.ddict")
+
+    with DiskDict(path) as my_dict:
+        my_dict.update({"name": "Alice", "age": 30, "city": "New York"})
+        my_dict["age"] = 31
+        print(my_dict["name"], my_dict.get("salary", "Not specified"))  # Output: Alice Not specified
+        print("city" in my_dict, len(my_dict))  # Output: True 3
+        print(my_dict.pop("city"), sorted(my_dict))  # Output: New York ['age', 'name']
+
+    # Another process (or the same one) can open the file read-only and share its pages
+    with DiskDict(path, readonly=True) as shared:
+        print(dict(shared.items()) == {"name": "Alice", "age": 31})  # Output: True
+
+    # Bulk loading a large lookup table, then compacting after updates
+    table = DiskDict.bulk_load(os.path.join(directory, "squares.ddict"), ((x, x * x) for x in range(100_000)), expected_size=100_000)
+    print(table[12_345], len(table))  # Output: 152399025 100000
+    for x in range(50_000):
+        del table[x]
+    table.compact()
+    print(len(table), table.garbage_bytes)  # Output: 50000 0
+    table.close()
@@ -0,0 +1,145 @@
+# Filename: ExternalSort.py
+
+'''
+External Merge Sort: Sorts data that does not fit in memory. The input is read in runs that fit in a memory budget, each run is sorted with sorted() and written (spilled) to a temporary file.
+
+K-Way Merge: The sorted run files are merged with heapq.merge(), which keeps only one item per run in memory at a time.
+
+Same API as sorted(): external_sorted(iterable, key=None, reverse=False) accepts the same key= and reverse= arguments and is stable, like sorted().
+
+Streaming Output: The result is a generator, so the sorted data can be written out or processed without ever holding it all in memory.
+
+Memory Budget: memory_limit (bytes) decides how large a run may grow; the size of the items is estimated with sys.getsizeof(). max_open_files limits how many runs are merged at once, larger merges happen in several passes.
+
+Temporary Files: Runs are pickled into temporary files that are deleted when the generator finishes or is closed, and also when an error (for example from key) stops a merge pass.
+'''
+
+import heapq
+import os
+import pickle
+import sys
+import tempfile
+from itertools import islice
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+DEFAULT_MAX_OPEN_FILES = 64
+
+# Items are pickled in batches to keep the per-item overhead of pickle small.
+BATCH_SIZE = 1000
+
+
+# 1. Writing and Reading Runs
+def _write_run(items, directory):
+    handle, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    try:
+        with os.fdopen(handle, "wb") as f:
+            iterator = iter(items)
+            while True:
+                batch = list(islice(iterator, BATCH_SIZE))
+                if not batch:
+                    break
+                pickle.dump(batch, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except BaseException:  # A half-written run is of no use.
+        _remove_runs([path])
+        raise
+    return path
+
+
+def _remove_runs(paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _read_run(path):
+    with open(path, "rb") as f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+
+# 2. Splitting the Input Into Sorted Runs
+# A run grows until the estimated size of its items reaches memory_limit. Spilled run files are added to runs.
+def _make_runs(iterable, key, reverse, memory_limit, directory, runs):
+    run = []
+    used = 0
+    for item in iterable:
+        run.append(item)
+        used += sys.getsizeof(item) + 8  # + 8 for the list slot
+        if used >= memory_limit:
+            run.sort(key=key, reverse=reverse)
+            runs.append(_write_run(run, directory))
+            run = []
+            used = 0
+    return run
+
+
+# 3. Merging Runs
+# heapq.merge keeps equal items in run order, and runs are in input order, so the sort stays stable.
+# runs is updated in place after every pass, so the caller can always delete the files that are left.
+def _merge_passes(runs, key, reverse, max_open_files, directory):
+    while len(runs) > max_open_files:
+        merged_runs = []
+        complete = False
+        try:
+            for start in range(0, len(runs), max_open_files):
+                group = runs[start:start + max_open_files]
+                if len(group) == 1:  # Only the last group can be this small, it is carried over as it is.
+                    merged_runs.append(group[0])
+                    continue
+                merged = heapq.merge(*(_read_run(path) for path in group), key=key, reverse=reverse)
+                merged_runs.append(_write_run(merged, directory))
+            complete = True
+        finally:
+            # A complete pass deletes the runs it merged, a failed one the runs it wrote.
+            kept = set(merged_runs) if complete else set(runs)
+            _remove_runs([path for path in runs + merged_runs if path not in kept])
+        runs[:] = merged_runs
+
+
+# 4. The Public Function
+def external_sorted(iterable, key=None, reverse=False, memory_limit=DEFAULT_MEMORY_LIMIT,
+                    max_open_files=DEFAULT_MAX_OPEN_FILES, directory=None):
+    if max_open_files < 2:
+        raise ValueError("max_open_files must be at least 2")
+    runs = []
+    try:
+        last_run = _make_runs(iterable, key, reverse, memory_limit, directory, runs)
+        last_run.sort(key=key, reverse=reverse)
+        if not runs:
+            # Everything fitted in memory, nothing was spilled.
+            yield from last_run
+            return
+        _merge_passes(runs, key, reverse, max_open_files, directory)
+        yield from heapq.merge(*(_read_run(path) for path in runs), iter(last_run), key=key, reverse=reverse)
+    finally:
+        _remove_runs(runs)
+
+
+# Like list.sort(), but for data on disk: sorts the lines of a text file into another file.
+def external_sort_file(input_path, output_path, key=None, reverse=False, memory_limit=DEFAULT_MEMORY_LIMIT):
+    with open(input_path) as source, open(output_path, "w") as target:
+        lines = (line if line.endswith("\n") else line + "\n" for line in source)
+        target.writelines(external_sorted(lines, key=key, reverse=reverse, memory_limit=memory_limit))
+
+
+# Example usage of the external sort:
+if __name__ == "__main__":
+    import random
+
+    my_list = [6, 5, 4, 3, 2, 1]
+    print(list(external_sorted(my_list)))  # Output: [1, 2, 3, 4, 5, 6]
+    print(list(external_sorted(my_list, reverse=True)))  # Output: [6, 5, 4, 3, 2, 1]
+
+    # A tiny memory budget forces the data to be spilled into many runs and merged from disk
+    words = ["banana", "Apple", "cherry", "apple", "Banana"]
+    print(list(external_sorted(words, key=str.lower, memory_limit=100, max_open_files=2)))  # Output: ['Apple', 'apple', 'banana', 'Banana', 'cherry']
+
+    numbers = [random.randint(0, 1000) for _ in range(200_000)]
+    result = external_sorted(numbers, memory_limit=1_000_000)  # Spilled into about 8 runs
+    print(list(result) == sorted(numbers))  # Output: True
@@ -0,0 +1,238 @@
+# Filename: IndexedSequence.py
+
+'''
+Hash Index: Next to the items, an indexed sequence keeps a dictionary value -> sorted list of positions where the value appears.
+
+Constant-Time Lookups: 'in', index() and count() become dictionary lookups instead of scanning the whole sequence, so q lookups on n items cost O(n + q) instead of O(n * q).
+
+IndexedTuple: A real tuple subclass whose index is built once, when the tuple is created (tuples never change).
+
+IndexedList: A list whose index follows every change. append(), item assignment, insert(), pop(), remove() and del of one item keep it in sync: shifted positions are logged and each value's positions catch up on its next lookup. Slice assignment, sort() and reverse() reorder everything, so the index is rebuilt in one pass on the next lookup.
+
+Hashable Values: The items have to be hashable, like dictionary keys.
+'''
+
+from bisect import bisect_left, insort
+from itertools import islice
+from math import isqrt
+from collections.abc import MutableSequence
+
+
+# 1. Building an Index
+def build_index(items):
+    positions = {}
+    for position, value in enumerate(items):
+        found = positions.get(value)
+        if found is None:
+            positions[value] = [position]
+        else:
+            found.append(position)
+    return positions
+
+
+def _first_position(positions, value, start, stop, length):
+    found = positions.get(value)
+    if found:
+        start, stop, _ = slice(start, stop).indices(length)
+        i = bisect_left(found, start) if start else 0
+        if i < len(found) and found[i] < stop:
+            return found[i]
+    raise ValueError(f"{value!r} is not in sequence")
+
+
+# 2. IndexedTuple
+class IndexedTuple(tuple):
+    def __new__(cls, iterable=()):
+        self = super().__new__(cls, iterable)
+        self._positions = build_index(self)
+        return self
+
+    def __contains__(self, value):
+        return value in self._positions
+
+    def index(self, value, start=0, stop=None):
+        return _first_position(self._positions, value, start, stop, len(self))
+
+    def count(self, value):
+        return len(self._positions.get(value, ()))
+
+    def __repr__(self):
+        return f"IndexedTuple({tuple.__repr__(self)})"
+
+
+# 3. IndexedList
+# Edits that shift positions (insert, pop(i), remove, del) are not applied to every value's positions at once.
+# They are logged as (first shifted position, +1 or -1), and each value's positions catch up with the log the next
+# time that value is looked up or changed. The log is dropped and the index rebuilt once it grows past about
+# sqrt(n) entries, so an edit costs O(log n + sqrt(n)) amortized instead of O(n).
+MIN_SHIFTS = 64
+
+
+class IndexedList(MutableSequence):
+    def __init__(self, iterable=()):
+        self._items = list(iterable)
+        self._reset(build_index(self._items))
+
+    def _reset(self, positions):
+        self._positions = positions  # None while the index is stale
+        self._shifts = []
+        self._synced = {}  # value -> number of logged shifts already applied to its positions (0 if missing)
+
+    # Lookups rebuild a stale index.
+    def _index(self):
+        if self._positions is None:
+            self._reset(build_index(self._items))
+        return self._positions
+
+    # Applies the shifts logged since the last sync to the positions of one value.
+    def _synced_positions(self, value):
+        found = self._positions.get(value)
+        if found is None:
+            return None
+        shifts = self._shifts
+        for first, delta in islice(shifts, self._synced.get(value, 0), None):
+            i = bisect_left(found, first)
+            if i < len(found):
+                found[i:] = [position + delta for position in found[i:]]
+        self._synced[value] = len(shifts)
+        return found
+
+    def _add_position(self, value, position):
+        found = self._synced_positions(value)
+        if found is None:
+            self._positions[value] = [position]
+            self._synced[value] = len(self._shifts)
+        else:
+            insort(found, position)
+
+    def _remove_position(self, value, position):
+        found = self._synced_positions(value)
+        found.pop(bisect_left(found, position))
+        if not found:
+            del self._positions[value]
+            self._synced.pop(value, None)
+
+    # Returns False when the log got too long and the index was made stale instead.
+    def _log_shift(self, first, delta):
+        self._shifts.append((first, delta))
+        if len(self._shifts) > max(MIN_SHIFTS, isqrt(len(self._items))):
+            self._positions = None
+            return False
+        return True
+
+    # Lookups
+    def __contains__(self, value):
+        return value in self._index()
+
+    def index(self, value, start=0, stop=None):
+        positions = self._index()
+        self._synced_positions(value)
+        return _first_position(positions, value, start, stop, len(self._items))
+
+    def count(self, value):
+        return len(self._index().get(value, ()))
+
+    # Plain list behaviour
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return IndexedList(self._items[index])
+        return self._items[index]
+
+    def __eq__(self, other):
+        if isinstance(other, IndexedList):
+            return self._items == other._items
+        if isinstance(other, list):
+            return self._items == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"IndexedList({self._items!r})"
+
+    # Changes the index follows
+    def append(self, value):
+        if self._positions is not None:
+            self._add_position(value, len(self._items))
+        self._items.append(value)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._items[index] = value
+            self._positions = None
+            return
+        position = range(len(self._items))[index]
+        old = self._items[position]
+        self._items[position] = value
+        if self._positions is not None:
+            self._remove_position(old, position)
+            self._add_position(value, position)
+
+    # The removed value's own later positions catch up through the logged shift, like everyone else's.
+    def pop(self, index=-1):
+        position = range(len(self._items))[index]
+        value = self._items.pop(position)
+        if self._positions is not None:
+            self._remove_position(value, position)
+            if position < len(self._items):
+                self._log_shift(position + 1, -1)
+        return value
+
+    def insert(self, index, value):
+        length = len(self._items)
+        position = min(max(index + length if index < 0 else index, 0), length)
+        self._items.insert(position, value)
+        if self._positions is not None and (position == length or self._log_shift(position, 1)):
+            self._add_position(value, position)
+
+    def __delitem__(self, index):
+        if not isinstance(index, slice):
+            self.pop(index)
+            return
+        del self._items[index]
+        self._positions = None
+
+    def remove(self, value):
+        del self[self.index(value)]
+
+    def extend(self, iterable):
+        for value in iterable:
+            self.append(value)
+
+    # Changes that reorder everything make the index stale
+    def clear(self):
+        self._items.clear()
+        self._reset({})
+
+    def sort(self, key=None, reverse=False):
+        self._items.sort(key=key, reverse=reverse)
+        self._positions = None
+
+    def reverse(self):
+        self._items.reverse()
+        self._positions = None
+
+    def copy(self):
+        return IndexedList(self._items)
+
+
+# Example usage of the indexed sequences:
+if __name__ == "__main__":
+    my_tuple = IndexedTuple((1, 2, 3, 4, 5, 4))
+    print(3 in my_tuple, my_tuple.index(4), my_tuple.count(4))  # Output: True 3 2
+    print(isinstance(my_tuple, tuple), my_tuple[1:3])  # Output: True (2, 3)
+
+    my_list = IndexedList([1, 2, 3, 4, 5])
+    my_list.append(5)
+    print(my_list.count(5), my_list.index(5))  # Output: 2 4
+    my_list.insert(0, 5)  # Positions shift, the positions of 5 catch up on the next lookup
+    print(my_list.index(5), my_list.count(5), 6 in my_list)  # Output: 0 3 False
+
+    # Many membership checks against a large sequence
+    big = IndexedList(range(1_000_000))
+    hits = sum(1 for q in range(0, 2_000_000, 7) if q in big)
+    print(hits)  # Output: 142858
@@ -0,0 +1,226 @@
+# Filename: InternedTuples.py
+
+'''
+Hash-Consing: A TupleStore keeps exactly one shared instance for every distinct tuple value. Asking it for (1, 2) twice returns the very same object, so millions of duplicate keys cost the memory of one.
+
+Nested Tuples: Inner tuples are canonicalized first (without recursion, so any depth works), so (1, 2, (3, 4)) and every other tuple containing (3, 4) share the same inner object.
+
+Fast Equality: Two interned tuples with the same items are the same object, so == is usually an identity check or a hash mismatch instead of an element-by-element comparison. The hash is computed once and cached.
+
+Exact Values: The store tells apart items that compare equal but differ in type or sign, so interning (True, 2.0) after (1, 2), or (-0.0,) after (0.0,), gives back the values that were passed in. Such tuples are different objects that still compare equal.
+
+Weak Table: The store only holds weak references. When no one uses an interned tuple anymore it is removed from the store automatically.
+
+InternedTuple: Plain tuples cannot be weakly referenced, so interned values are InternedTuple objects. They behave like tuples: indexing, slicing, len(), 'in', iteration, +, *, comparisons, and they are equal to (and hash like) the plain tuple with the same items.
+
+Pickling: An InternedTuple is pickled as a plain tuple and interned into default_store when it is loaded, not into the store it came from.
+'''
+
+import weakref
+from collections.abc import Sequence
+
+
+# 1. The Interned Tuple Type
+class InternedTuple(Sequence):
+    __slots__ = ("_items", "_hash", "_store", "__weakref__")
+
+    def __init__(self, items, store):
+        self._items = items
+        self._hash = hash(items)
+        self._store = store
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._store.intern(self._items[index])
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, value):
+        return value in self._items
+
+    def __hash__(self):
+        return self._hash
+
+    # The same items give the same instance, so most checks end at 'is' or at the cached hashes.
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, InternedTuple):
+            return self._hash == other._hash and self._items == other._items
+        if isinstance(other, tuple):
+            return self._items == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def _compare_items(self, other):
+        if isinstance(other, InternedTuple):
+            return other._items
+        if isinstance(other, tuple):
+            return other
+        return None
+
+    def __lt__(self, other):
+        items = self._compare_items(other)
+        return NotImplemented if items is None else self._items < items
+
+    def __le__(self, other):
+        items = self._compare_items(other)
+        return NotImplemented if items is None else self._items <= items
+
+    def __gt__(self, other):
+        items = self._compare_items(other)
+        return NotImplemented if items is None else self._items > items
+
+    def __ge__(self, other):
+        items = self._compare_items(other)
+        return NotImplemented if items is None else self._items >= items
+
+    # Concatenation and repetition give interned results too.
+    def __add__(self, other):
+        items = self._compare_items(other)
+        return NotImplemented if items is None else self._store.intern(self._items + items)
+
+    def __radd__(self, other):
+        items = self._compare_items(other)
+        return NotImplemented if items is None else self._store.intern(items + self._items)
+
+    def __mul__(self, count):
+        return self._store.intern(self._items * count)
+
+    __rmul__ = __mul__
+
+    def __repr__(self):
+        return f"InternedTuple({self.to_tuple()!r})"
+
+    # Converts back to plain (nested) tuples.
+    def to_tuple(self):
+        return tuple(item.to_tuple() if isinstance(item, InternedTuple) else item for item in self._items)
+
+    # Unpickling interns into default_store, a TupleStore itself is not pickled.
+    def __reduce__(self):
+        return intern_tuple, (self.to_tuple(),)
+
+
+# 2. The Store
+# The table key tags every item with its type, because 1, 1.0 and True (or 0.0 and -0.0) are equal as dict keys
+# but must not come back as one another. Inner tuples are already canonical, so they are keyed by identity.
+def _key_item(item):
+    if isinstance(item, InternedTuple):
+        return InternedTuple, id(item)
+    if isinstance(item, (float, complex)):  # repr() tells -0.0 from 0.0
+        return type(item), item, repr(item)
+    return type(item), item
+
+
+def _key(items):
+    return tuple(map(_key_item, items))
+
+
+class TupleStore:
+    def __init__(self):
+        self._table = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._table)
+
+    def __contains__(self, value):
+        return self._needs_interning(value) and self._walk(value, create=False) is not None
+
+    # Returns None for a tuple that is not in the store when create is False.
+    def _canonical(self, items, create=True):
+        key = _key(items)
+        found = self._table.get(key)
+        if found is not None or not create:
+            if found is not None and create:
+                self.hits += 1
+            return found
+        self.misses += 1
+        interned = InternedTuple(items, self)
+        self._table[key] = interned
+        return interned
+
+    def _needs_interning(self, value):
+        return isinstance(value, tuple) or (isinstance(value, InternedTuple) and value._store is not self)
+
+    # Returns the shared instance for a (possibly nested) tuple; other values are returned unchanged.
+    def intern(self, value):
+        if not self._needs_interning(value):
+            return value
+        return self._walk(value, create=True)
+
+    # Inner tuples are handled with an explicit stack instead of recursion.
+    def _walk(self, value, create):
+        stack = [(iter(value), [])]
+        while True:
+            children, built = stack[-1]
+            for child in children:
+                if self._needs_interning(child):
+                    stack.append((iter(child), []))
+                    break
+                built.append(child)
+            else:
+                stack.pop()
+                result = self._canonical(tuple(built), create)
+                if result is None or not stack:
+                    return result
+                stack[-1][1].append(result)
+
+    def concat(self, *tuples):
+        items = ()
+        for value in tuples:
+            items += value._items if isinstance(value, InternedTuple) else tuple(value)
+        return self.intern(items)
+
+    def repeat(self, value, count):
+        return self.intern(tuple(value) * count)
+
+
+# A shared default store for code that does not need its own.
+default_store = TupleStore()
+
+
+def intern_tuple(value):
+    return default_store.intern(value)
+
+
+# Example usage of interned tuples (same data as TupleOperations.py):
+if __name__ == "__main__":
+    import gc
+
+    store = TupleStore()
+    nested_tuple = store.intern((1, 2, (3, 4), (5, 6)))
+    same_tuple = store.intern((1, 2, (3, 4), (5, 6)))
+    print(nested_tuple is same_tuple, nested_tuple[2][1])  # Output: True 4
+
+    # Inner tuples are shared between different outer tuples
+    other = store.intern(((3, 4), "x"))
+    print(other[0] is nested_tuple[2])  # Output: True
+
+    # Still equal to (and hashing like) plain tuples
+    print(nested_tuple == (1, 2, (3, 4), (5, 6)), hash(store.intern((1, 2))) == hash((1, 2)))  # Output: True True
+
+    # Equal values of another type or sign are kept apart, interning never changes the values
+    print(store.intern((True, 2.0)), store.intern((-0.0,)) == store.intern((0.0,)))  # Output: InternedTuple((True, 2.0)) True
+
+    # Concatenation and repetition are interned too
+    my_tuple = store.intern((1, 2, 3, 4, 5))
+    print((my_tuple + (6, 7, 8)) is store.intern((1, 2, 3, 4, 5, 6, 7, 8)), my_tuple * 2 is my_tuple * 2)  # Output: True True
+
+    # A million duplicate keys share a handful of objects
+    keys = [store.intern((i % 10, (i % 3, "key"))) for i in range(1_000_000)]
+    print(len({id(key) for key in keys}))  # Output: 30
+
+    # Unused entries disappear from the store
+    del keys, nested_tuple, same_tuple, other, my_tuple
+    gc.collect()
+    print(len(store))  # Output: 0
@@ -99,6 +99,35 @@ count_of_five = my_list.count(5)  # Result: 1 (5 appears once)
 # Returns the index of the first occurrence of an element. Raises an error if not found.
 index_of_five = my_list.index(5)  # Result: 4 (index starts at 0)
 
+# 18. Blocked Lists for Middle Edits (see BlockedList.py)
+# insert() and pop(i) on a normal list move every element after i. A BlockedList only moves the elements of one small block.
+from BlockedList import BlockedList
+
+blocked_list = BlockedList(my_list)  # Same API as a list
+blocked_list.insert(3, 35)  # Result: [1, 2, 3, 35, 4, 5, 6]
+blocked_element = blocked_list.pop(1)  # Removes 2. Result: [1, 3, 35, 4, 5, 6]
+
+# 19. Typed Numeric Lists (see NumericList.py)
+# A NumericList keeps the numbers in one array.array buffer (8 bytes each) and supports elementwise math.
+from NumericList import NumericList
+
+numeric_list = NumericList(my_list)  # Same numbers, stored as 8-byte machine ints
+numeric_squared = numeric_list ** 2  # Elementwise, like the squared_list comprehension. Result: [1, 4, 9, 16, 25, 36]
+
+# 20. Indexed Lists for Repeated Lookups (see IndexedSequence.py)
+# An IndexedList keeps a value -> positions index in sync with the list, so 'in', index() and count() are dictionary lookups.
+from IndexedSequence import IndexedList
+
+indexed_list = IndexedList(my_list)
+indexed_list.append(5)  # The index follows the change. List becomes [1, 2, 3, 4, 5, 6, 5]
+indexed_count_of_five = indexed_list.count(5)  # Result: 2
+
+# 21. Sorting Data Larger Than Memory (see ExternalSort.py)
+# external_sorted() takes the same key= and reverse= arguments as sorted(), but spills sorted runs to disk and merges them.
+from ExternalSort import external_sorted
+
+externally_sorted = list(external_sorted(indexed_list, reverse=True, memory_limit=1024 * 1024))  # Result: [6, 5, 5, 4, 3, 2, 1]
+
 # Example list printout after operations:
 print(f"Final list: {my_list}")
 print(f"Sublist (1:4): {sub_list}")
@@ -107,4 +136,8 @@ print(f"Length of list: {length}")
 print(f"Does 3 exist in list?: {exists}")
 print(f"Copied list: {list_copy}")
 print(f"Count of 5: {count_of_five}")
-print(f"Index of 5: {index_of_five}")
\ No newline at end of file
+print(f"Index of 5: {index_of_five}")
+print(f"Blocked list: {list(blocked_list)}")
+print(f"Numeric squared list: {list(numeric_squared)}")
+print(f"Count of 5 (indexed list): {indexed_count_of_five}")
+print(f"Externally sorted list: {externally_sorted}")
\ No newline at end of file
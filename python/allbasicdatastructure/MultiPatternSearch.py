@@ -0,0 +1,260 @@
+# Filename: MultiPatternSearch.py
+
+'''
+Many Patterns, One Pass: 'in', find(), count() and replace() look for one pattern per scan of the text, so searching for 300 keywords means 300 scans. A MultiPatternMatcher finds all of them in a single scan.
+
+Aho-Corasick Automaton: The patterns are stored in a trie (a tree with one character per edge). Every node also gets a "failure link" to the longest suffix of its text that is a prefix of some pattern, so after a mismatch the scan continues from there instead of going back in the text. Each character of the text is read exactly once.
+
+Skipping: While no pattern is partly matched, a regular expression jumps straight to the next character that can start a pattern.
+
+Overlapping Matches: finditer() and count() report every occurrence, overlapping ones included (like searching for each pattern separately). With overlapping=False they report leftmost-longest, non-overlapping matches instead, the same ones replace() uses.
+
+Streaming: Every method also accepts an iterable of chunks (for example the lines or blocks of a file) instead of one string. Matches that cross a chunk boundary are found, because the automaton state is carried over. replace_chunks() yields the replaced text piece by piece and keeps at most one pattern length of text back.
+
+Str and Bytes: Patterns and text can both be str, or both be bytes-like (bytes, bytearray, memoryview).
+'''
+
+import re
+from collections import Counter, namedtuple
+from heapq import heappop, heappush
+
+Match = namedtuple("Match", ["start", "end", "pattern"])
+
+# Size of the blocks read_chunks() reads from a file.
+CHUNK_SIZE = 1 << 20
+
+
+def read_chunks(file, size=CHUNK_SIZE):
+    while True:
+        chunk = file.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+# 1. Choosing Leftmost-Longest Matches
+# Matches arrive ordered by their end. A start position is settled once no later match can start there
+# or earlier, i.e. when the scan is more than the longest pattern length past it.
+class _LeftmostLongest:
+    def __init__(self, lengths, max_length):
+        self._lengths = lengths
+        self._max_length = max_length
+        self._longest = {}  # start -> (end, pattern index) of the longest match starting there
+        self._starts = []   # heap of the unsettled starts
+        self._last_end = 0
+
+    def add(self, end, index):
+        start = end - self._lengths[index]
+        if start >= self._last_end:
+            found = self._longest.get(start)
+            if found is None:
+                self._longest[start] = (end, index)
+                heappush(self._starts, start)
+            elif end > found[0]:
+                self._longest[start] = (end, index)
+        return self.settle(end - 1)
+
+    # Settles every start whose longest possible match would end at or before limit.
+    def settle(self, limit):
+        settled = []
+        starts = self._starts
+        while starts and starts[0] + self._max_length <= limit:
+            start = heappop(starts)
+            end, index = self._longest.pop(start)
+            if start >= self._last_end:
+                settled.append((start, end, index))
+                self._last_end = end
+        return settled
+
+
+# 2. The Matcher
+class MultiPatternMatcher:
+    def __init__(self, patterns):
+        self.patterns = []
+        self._goto = [{}]    # state -> {character: next state}
+        self._fail = [0]     # state -> failure link
+        self._output = [()]  # state -> indexes of the patterns that end in this state
+        seen = set()
+        for pattern in patterns:
+            if not pattern:
+                raise ValueError("patterns must not be empty")
+            if self.patterns and type(pattern) is not type(self.patterns[0]):
+                raise TypeError("patterns must be all str or all bytes")
+            if pattern not in seen:
+                seen.add(pattern)
+                self._add(pattern)
+        self._lengths = [len(pattern) for pattern in self.patterns]
+        self.max_length = max(self._lengths, default=0)
+        self._link()
+        self._jump = self._first_character_search()
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def _add(self, pattern):
+        state = 0
+        for character in pattern:
+            next_state = self._goto[state].get(character)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][character] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = (len(self.patterns),)
+        self.patterns.append(pattern)
+
+    # Failure links, breadth first: a node's link is found by following its parent's links.
+    def _link(self):
+        goto, fail, output = self._goto, self._fail, self._output
+        queue = list(goto[0].values())
+        for state in queue:
+            for character, child in goto[state].items():
+                link = fail[state]
+                while link and character not in goto[link]:
+                    link = fail[link]
+                fail[child] = goto[link].get(character, 0)
+                output[child] += output[fail[child]]
+                queue.append(child)
+
+    def _first_character_search(self):
+        if not self.patterns:
+            return None
+        if isinstance(self.patterns[0], str):
+            return re.compile("[" + "".join(map(re.escape, self._goto[0])) + "]").search
+        return re.compile(b"[" + b"".join(re.escape(bytes([c])) for c in self._goto[0]) + b"]").search
+
+    # Yields (end, pattern index) for every match, and (offset, None) at the end of every chunk.
+    def _scan(self, chunks):
+        goto, fail, output, jump = self._goto, self._fail, self._output, self._jump
+        state = 0
+        offset = 0
+        for chunk in chunks:
+            length = len(chunk)
+            i = 0
+            while i < length:
+                if state == 0:
+                    found = jump(chunk, i) if jump else None
+                    if found is None:
+                        break
+                    i = found.start()
+                character = chunk[i]
+                while state and character not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(character, 0)
+                i += 1
+                for index in output[state]:
+                    yield offset + i, index
+            offset += length
+            yield offset, None
+
+    @staticmethod
+    def _as_chunks(text):
+        if isinstance(text, (str, bytes, bytearray, memoryview)):
+            return (text,)
+        return text
+
+    # 3. Searching and Counting
+    def finditer(self, text, overlapping=True):
+        patterns, lengths = self.patterns, self._lengths
+        if overlapping:
+            for end, index in self._scan(self._as_chunks(text)):
+                if index is not None:
+                    yield Match(end - lengths[index], end, patterns[index])
+            return
+        chooser = _LeftmostLongest(lengths, self.max_length)
+        for end, index in self._scan(self._as_chunks(text)):
+            for start, stop, chosen in (chooser.settle(end) if index is None else chooser.add(end, index)):
+                yield Match(start, stop, patterns[chosen])
+        for start, stop, chosen in chooser.settle(float("inf")):
+            yield Match(start, stop, patterns[chosen])
+
+    def findall(self, text, overlapping=True):
+        return list(self.finditer(text, overlapping))
+
+    # The leftmost (longest) match, or None.
+    def search(self, text):
+        return next(self.finditer(text, overlapping=False), None)
+
+    def count(self, text, overlapping=True):
+        counts = Counter(dict.fromkeys(self.patterns, 0))
+        counts.update(match.pattern for match in self.finditer(text, overlapping))
+        return counts
+
+    # 4. Replacing
+    # replacements is one string for all patterns, a dictionary pattern -> string, or a function pattern -> string.
+    @staticmethod
+    def _replacement_for(replacements):
+        if isinstance(replacements, (str, bytes)):
+            return lambda pattern: replacements
+        if callable(replacements):
+            return replacements
+        return replacements.__getitem__
+
+    def replace_chunks(self, chunks, replacements):
+        replacement_for = self._replacement_for(replacements)
+        chooser = _LeftmostLongest(self._lengths, self.max_length)
+        keep = max(self.max_length - 1, 0)
+        buffer = None     # text that has been scanned but not yet written
+        buffer_start = 0  # position of buffer[0] in the whole text
+        written = 0       # everything before this position has been written
+
+        def reading():
+            nonlocal buffer
+            for chunk in chunks:
+                if buffer is None:
+                    buffer = bytes(chunk) if isinstance(chunk, memoryview) else chunk
+                else:
+                    buffer += chunk
+                yield chunk
+
+        for end, index in self._scan(reading()):
+            chosen = chooser.settle(end) if index is None else chooser.add(end, index)
+            for start, stop, pattern_index in chosen:
+                yield buffer[written - buffer_start:start - buffer_start]
+                yield replacement_for(self.patterns[pattern_index])
+                written = stop
+            if index is None:
+                # No match can start before end - keep any more, so that text can be written now.
+                flush_to = max(written, end - keep)
+                yield buffer[written - buffer_start:flush_to - buffer_start]
+                buffer = buffer[flush_to - buffer_start:]
+                buffer_start = written = flush_to
+        if buffer is None:
+            return
+        for start, stop, pattern_index in chooser.settle(float("inf")):
+            yield buffer[written - buffer_start:start - buffer_start]
+            yield replacement_for(self.patterns[pattern_index])
+            written = stop
+        yield buffer[written - buffer_start:]
+
+    def replace(self, text, replacements):
+        pieces = list(self.replace_chunks(self._as_chunks(text), replacements))
+        if not pieces or isinstance(pieces[0], str):
+            return "".join(pieces)
+        return b"".join(pieces)
+
+
+# Example usage of the matcher (same data as StringOperations.py):
+if __name__ == "__main__":
+    my_string = "Hello, World!"
+    matcher = MultiPatternMatcher(["World", "l", "Hello"])
+
+    print(matcher.search(my_string))  # Output: Match(start=0, end=5, pattern='Hello')
+    print(dict(matcher.count(my_string)))  # Output: {'World': 1, 'l': 3, 'Hello': 1}
+    print(dict(matcher.count(my_string, overlapping=False)))  # Output: {'World': 1, 'l': 0, 'Hello': 1}
+    print(matcher.replace(my_string, {"World": "Python", "Hello": "Hi", "l": "L"}))  # Output: Hi, Python!
+
+    # Leftmost-longest: "he" and "she" overlap, the match that starts first wins
+    print(MultiPatternMatcher(["he", "she", "hers"]).replace("ushers", "*"))  # Output: u*rs
+
+    # Streaming: a match split across chunks is still found
+    chunks = ["Hel", "lo, Wo", "rld!"]
+    print([match.start for match in matcher.finditer(chunks, overlapping=False)])  # Output: [0, 7]
+    print("".join(matcher.replace_chunks(chunks, "_")))  # Output: _, _!
+
+    # Hundreds of keywords, one pass over the log
+    keywords = [f"error{i:03}" for i in range(300)]
+    log = "".join(f"request {i} ok\n" if i % 50 else f"request {i} error{i % 300:03}\n" for i in range(100_000))
+    print(sum(MultiPatternMatcher(keywords).count(log).values()))  # Output: 2000
@@ -0,0 +1,306 @@
+# Filename: NumericList.py
+
+'''
+Typed Numeric List: NumericList stores numbers in an array.array of one machine type (for example 'q' = 8-byte int, 'd' = 8-byte float) instead of a list of boxed Python objects.
+
+Less Memory: A list of ints costs about 36 bytes per number (8-byte pointer + 28-byte int object), a NumericList 'q' costs 8, an 'i' list 4.
+
+List API: append, extend, insert, pop, remove, sort, reverse, count, index, 'in', len(), indexing and iteration behave like on a normal list.
+
+Zero-Copy Slices: my_list[1:4] returns a memoryview into the same buffer, no numbers are copied. While such a view is alive the list cannot grow or shrink (Python raises BufferError).
+
+Elementwise Operations: +, -, *, /, //, %, ** and unary - work element by element with a number or another sequence of the same length, like NumPy arrays. NumPy is used for them when it is installed and gives the same result; overflow, division by zero and float results for an int list raise the same errors with and without NumPy.
+
+Buffer Protocol: memoryview(), to_numpy() (zero-copy) and tofile() hand the raw buffer to other code without converting it.
+'''
+
+import operator
+from array import array
+from collections.abc import MutableSequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up the elementwise operations.
+    np = None
+
+
+class NumericList(MutableSequence):
+    def __init__(self, iterable=(), typecode="q"):
+        if isinstance(iterable, NumericList):
+            iterable = iterable._data
+        if isinstance(iterable, array) and iterable.typecode == typecode:
+            self._data = array(typecode, iterable)
+        elif isinstance(iterable, list):
+            self._data = array(typecode)
+            self._data.fromlist(iterable)
+        else:
+            self._data = array(typecode, iterable)
+
+    @property
+    def typecode(self):
+        return self._data.typecode
+
+    @property
+    def nbytes(self):
+        return len(self._data) * self._data.itemsize
+
+    # 1. Reading
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __reversed__(self):
+        return reversed(self._data)
+
+    def __contains__(self, value):
+        return value in self._data
+
+    # An int gives a number, a slice gives a zero-copy memoryview of the buffer.
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return memoryview(self._data)[index]
+        return self._data[index]
+
+    def count(self, value):
+        return self._data.count(value)
+
+    def index(self, value, start=0, stop=None):
+        if stop is None:
+            stop = len(self._data)
+        return self._data.index(value, start, stop)
+
+    def __eq__(self, other):
+        if isinstance(other, NumericList):
+            return self._data == other._data
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self._data, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"NumericList({self._data.tolist()!r}, typecode={self.typecode!r})"
+
+    # 2. Writing
+    def __setitem__(self, index, value):
+        if isinstance(index, slice) and not isinstance(value, array):
+            value = array(self.typecode, value)
+        self._data[index] = value
+
+    def __delitem__(self, index):
+        del self._data[index]
+
+    def insert(self, index, value):
+        self._data.insert(index, value)
+
+    def append(self, value):
+        self._data.append(value)
+
+    def extend(self, iterable):
+        if isinstance(iterable, NumericList):
+            iterable = iterable._data
+        if isinstance(iterable, array) and iterable.typecode == self.typecode:
+            self._data.extend(iterable)
+        elif isinstance(iterable, list):
+            self._data.fromlist(iterable)
+        else:
+            self._data.extend(iterable)
+
+    def pop(self, index=-1):
+        return self._data.pop(index)
+
+    def remove(self, value):
+        self._data.remove(value)
+
+    def clear(self):
+        del self._data[:]
+
+    def reverse(self):
+        self._data.reverse()
+
+    # array.array has no sort(), so the numbers are sorted and written back into the same buffer.
+    def sort(self, key=None, reverse=False):
+        if np is not None and key is None:
+            values = self.to_numpy()
+            values.sort()
+            if reverse:
+                values[:] = values[::-1].copy()
+            return
+        self._data[:] = array(self.typecode, sorted(self._data, key=key, reverse=reverse))
+
+    def copy(self):
+        return NumericList(self._data, self.typecode)
+
+    # 3. Buffer Protocol
+    def memoryview(self):
+        return memoryview(self._data)
+
+    def __buffer__(self, flags):  # Python 3.12+: memoryview(numeric_list) works directly.
+        return memoryview(self._data)
+
+    def to_numpy(self):
+        if np is None:
+            raise ImportError("to_numpy() requires NumPy to be installed")
+        return np.frombuffer(self._data, dtype=self._data.typecode)
+
+    def tofile(self, file):
+        self._data.tofile(file)
+
+    def tobytes(self):
+        return self._data.tobytes()
+
+    # 4. Elementwise Operations
+    # The result type follows the operation: true division always gives floats ('d').
+    def _elementwise(self, other, op, reflected=False, typecode=None):
+        typecode = typecode or self.typecode
+        if isinstance(other, NumericList):
+            other = other._data
+        scalar = not hasattr(other, "__len__")
+        if not scalar and len(other) != len(self._data):
+            raise ValueError(f"length mismatch: {len(self._data)} and {len(other)}")
+        if np is not None:
+            result = self._numpy_elementwise(other, op, reflected, typecode)
+            if result is not None:
+                return result
+        if scalar:
+            values = (op(other, a) for a in self._data) if reflected else (op(a, other) for a in self._data)
+        else:
+            values = map(op, other, self._data) if reflected else map(op, self._data, other)
+        return NumericList(values, typecode)
+
+    # NumPy is only used when it gives exactly what the Python loop gives. Division by zero, any other floating
+    # point error, float results for an integer typecode and integer results that might not fit the typecode
+    # return None, and the Python loop then raises the same errors a list would (or gives the same inf).
+    # Float powers and int / int beyond 2**53 are rounded differently by NumPy, so they also use the loop.
+    def _numpy_elementwise(self, other, op, reflected, typecode):
+        left = np.frombuffer(self._data, dtype=self.typecode)
+        right = np.asarray(other)
+        if len(left) == 0 or right.dtype.kind not in "biuf":
+            return None
+        a, b = (right, left) if reflected else (left, right)
+        if op in (operator.truediv, operator.floordiv, operator.mod) and not b.all():
+            return None
+        if op is operator.pow and (a.dtype.kind == "f" or b.dtype.kind == "f"):
+            return None  # NumPy's float power can be 1 ulp away from Python's
+        if op is operator.truediv and a.dtype.kind in "iu" and b.dtype.kind in "iu" and max(
+                _largest_abs(a), _largest_abs(b)) > _EXACT_FLOAT_INT:
+            return None  # NumPy rounds both ints to float first, Python rounds the exact quotient once
+        integer_result = np.dtype(typecode).kind in "iu"
+        if integer_result:
+            if right.dtype.kind == "f":
+                return None
+            limits = _integer_range(op, a, b)
+            info = np.iinfo(np.dtype(typecode))
+            if limits is None or limits[0] < info.min or limits[1] > info.max:
+                return None
+        try:
+            with np.errstate(all="raise"):
+                result = op(a, b)
+        except FloatingPointError:
+            return None
+        if integer_result and result.dtype.kind not in "biu":  # For example int64 mixed with uint64 gives floats
+            return None
+        return NumericList(array(typecode, result.astype(typecode).tobytes()), typecode)
+
+    def __add__(self, other):
+        return self._elementwise(other, operator.add)
+
+    def __radd__(self, other):
+        return self._elementwise(other, operator.add, reflected=True)
+
+    def __sub__(self, other):
+        return self._elementwise(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._elementwise(other, operator.sub, reflected=True)
+
+    def __mul__(self, other):
+        return self._elementwise(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._elementwise(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other):
+        return self._elementwise(other, operator.truediv, typecode="d")
+
+    def __floordiv__(self, other):
+        return self._elementwise(other, operator.floordiv)
+
+    def __mod__(self, other):
+        return self._elementwise(other, operator.mod)
+
+    def __pow__(self, other):
+        return self._elementwise(other, operator.pow)
+
+    def __neg__(self):
+        return self._elementwise(-1, operator.mul)
+
+    # In-place list concatenation keeps list semantics: my_list += [7, 8] extends.
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+
+# Ints up to 2**53 convert to float exactly.
+_EXACT_FLOAT_INT = 2 ** 53
+
+
+def _largest_abs(values):
+    return max(-int(values.min()), int(values.max()))
+
+
+# Smallest and largest possible integer result of op(a, b), worked out from the smallest and largest operands
+# with Python ints (which can't overflow), or None when it can't be bounded cheaply.
+def _integer_range(op, a, b):
+    a_low, a_high = int(a.min()), int(a.max())
+    b_low, b_high = int(b.min()), int(b.max())
+    if op is operator.add:
+        return a_low + b_low, a_high + b_high
+    if op is operator.sub:
+        return a_low - b_high, a_high - b_low
+    if op is operator.mul:
+        corners = (a_low * b_low, a_low * b_high, a_high * b_low, a_high * b_high)
+        return min(corners), max(corners)
+    largest = max(-a_low, a_high, 1)
+    if op is operator.floordiv:  # b is never 0 here, so |a // b| <= |a|
+        return -largest, largest
+    if op is operator.mod:  # Between 0 and b
+        return min(0, b_low), max(0, b_high)
+    if op is operator.pow:  # A negative exponent gives floats
+        if b_low < 0 or largest.bit_length() * b_high > 64:
+            return None
+        largest **= b_high
+        return -largest, largest
+    return None
+
+
+# Example usage of the numeric list (same steps as ListOperations.py):
+if __name__ == "__main__":
+    import sys
+
+    my_list = NumericList([1, 2, 3, 4, 5])
+    my_list[1] = 20
+    my_list.append(6)
+    my_list.insert(2, 30)
+    my_list.remove(20)
+    print(my_list.pop(2), list(my_list))  # Output: 3 [1, 30, 4, 5, 6]
+
+    my_list = NumericList([1, 2, 3])
+    my_list.extend([4, 5, 6])
+    sub_list = my_list[1:4]  # A zero-copy view
+    print(sub_list.tolist())  # Output: [2, 3, 4]
+    sub_list.release()  # Release the view before the list changes size again
+
+    my_list.sort(reverse=True)
+    print(list(my_list))  # Output: [6, 5, 4, 3, 2, 1]
+    squared_list = my_list ** 2
+    print(list(squared_list))  # Output: [36, 25, 16, 9, 4, 1]
+    print(list(my_list + squared_list), list(my_list / 2)[:2])  # Output: [42, 30, 20, 12, 6, 2] [3.0, 2.5]
+    print(3 in my_list, my_list.count(5), my_list.index(5))  # Output: True 1 1
+
+    # A million ints: 8 MB in the array versus ~36 MB as a list of int objects
+    big_list = list(range(1_000_000))
+    big_numeric = NumericList(big_list)
+    list_bytes = sys.getsizeof(big_list) + sum(sys.getsizeof(x) for x in big_list)
+    print(big_numeric.nbytes, list_bytes > 4 * big_numeric.nbytes)  # Output: 8000000 True
@@ -0,0 +1,392 @@
+# Filename: PersistentDict.py
+
+'''
+Persistent Dictionary: A PersistentDict never changes. assoc(), dissoc(), pop(), setdefault() and merge() return a new dictionary and leave the old one as it was.
+
+Structural Sharing: The new dictionary reuses every part of the old one that did not change, so an update costs O(log n) instead of the O(n) of dict.copy() + update().
+
+Hash Array Mapped Trie (HAMT): Keys are placed in a tree by their hash, 5 bits per level, so each node has up to 32 children and the tree is at most 13 levels deep.
+
+Cheap Snapshots: Because nothing is ever modified, keeping an old version around (a snapshot) is free; it is just another reference.
+
+Merging: merge() combines two tries node by node, subtrees present in only one input are reused as they are, from either side.
+
+Dictionary Operations: get(), [], 'in', len(), keys(), values(), items(), iteration and sorted_items() work like on a normal dict.
+'''
+
+from collections.abc import ItemsView, Mapping, ValuesView
+from itertools import chain
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+HASH_MASK = (1 << 64) - 1  # hash() can be negative, the trie works on the unsigned 64-bit value.
+
+_MISSING = object()
+
+
+def _hash(key):
+    return hash(key) & HASH_MASK
+
+
+def _bit(h, shift):
+    return 1 << ((h >> shift) & MASK)
+
+
+def _index(bitmap, bit):
+    return (bitmap & (bit - 1)).bit_count()
+
+
+# 1. Trie Nodes
+# A BitmapNode keeps only the children that exist; bit i of the bitmap tells whether child i is present.
+# Each entry is either a leaf tuple (hash, key, value) or another node.
+class _BitmapNode:
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap, entries):
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+# Keys whose full 64-bit hashes are equal end up together in a CollisionNode.
+class _CollisionNode:
+    __slots__ = ("hash", "items")
+
+    def __init__(self, h, items):
+        self.hash = h
+        self.items = items  # tuple of (key, value)
+
+
+_EMPTY = _BitmapNode(0, ())
+
+
+def _same_key(a, b):
+    return a is b or a == b
+
+
+def _leaves_node(shift, leaf1, leaf2):
+    h1, h2 = leaf1[0], leaf2[0]
+    if h1 == h2:
+        return _CollisionNode(h1, ((leaf1[1], leaf1[2]), (leaf2[1], leaf2[2])))
+    bit1, bit2 = _bit(h1, shift), _bit(h2, shift)
+    if bit1 == bit2:
+        return _BitmapNode(bit1, (_leaves_node(shift + BITS, leaf1, leaf2),))
+    if bit1 < bit2:
+        return _BitmapNode(bit1 | bit2, (leaf1, leaf2))
+    return _BitmapNode(bit1 | bit2, (leaf2, leaf1))
+
+
+# 2. Lookup
+def _find(node, h, key):
+    shift = 0
+    while True:
+        if type(node) is _CollisionNode:
+            if node.hash == h:
+                for k, v in node.items:
+                    if _same_key(k, key):
+                        return v
+            return _MISSING
+        bit = _bit(h, shift)
+        if not node.bitmap & bit:
+            return _MISSING
+        entry = node.entries[_index(node.bitmap, bit)]
+        if type(entry) is tuple:
+            return entry[2] if entry[0] == h and _same_key(entry[1], key) else _MISSING
+        node = entry
+        shift += BITS
+
+
+# 3. Insert / Replace
+# Returns (new_node, added). Only the nodes on the path to the key are copied.
+# With overwrite=False an existing key keeps its value (used by merge() when the other side wins).
+def _assoc(node, shift, leaf, overwrite=True):
+    h = leaf[0]
+    if type(node) is _CollisionNode:
+        if node.hash != h:
+            # Push the collision node one level down and insert next to it.
+            wrapper = _BitmapNode(_bit(node.hash, shift), (node,))
+            return _assoc(wrapper, shift, leaf, overwrite)
+        for i, (k, v) in enumerate(node.items):
+            if _same_key(k, leaf[1]):
+                if not overwrite or v is leaf[2]:
+                    return node, False
+                return _CollisionNode(h, node.items[:i] + ((k, leaf[2]),) + node.items[i + 1:]), False
+        return _CollisionNode(h, node.items + ((leaf[1], leaf[2]),)), True
+
+    bit = _bit(h, shift)
+    index = _index(node.bitmap, bit)
+    entries = node.entries
+    if not node.bitmap & bit:
+        return _BitmapNode(node.bitmap | bit, entries[:index] + (leaf,) + entries[index:]), True
+
+    entry = entries[index]
+    if type(entry) is tuple:
+        if entry[0] == h and _same_key(entry[1], leaf[1]):
+            if not overwrite or entry[2] is leaf[2]:
+                return node, False
+            new_entry, added = (h, entry[1], leaf[2]), False
+        else:
+            new_entry, added = _leaves_node(shift + BITS, entry, leaf), True
+    else:
+        new_entry, added = _assoc(entry, shift + BITS, leaf, overwrite)
+        if new_entry is entry:
+            return node, False
+    return _BitmapNode(node.bitmap, entries[:index] + (new_entry,) + entries[index + 1:]), added
+
+
+# 4. Delete
+# Returns (new_node, removed_value); removed_value is _MISSING when the key was not there.
+# A child left with a single leaf is replaced by that leaf, so the trie stays as shallow as possible.
+def _dissoc(node, shift, h, key):
+    if type(node) is _CollisionNode:
+        if node.hash == h:
+            for i, (k, v) in enumerate(node.items):
+                if _same_key(k, key):
+                    items = node.items[:i] + node.items[i + 1:]
+                    if len(items) == 1:
+                        return (h, items[0][0], items[0][1]), v
+                    return _CollisionNode(h, items), v
+        return node, _MISSING
+
+    bit = _bit(h, shift)
+    if not node.bitmap & bit:
+        return node, _MISSING
+    index = _index(node.bitmap, bit)
+    entries = node.entries
+    entry = entries[index]
+    if type(entry) is tuple:
+        if entry[0] != h or not _same_key(entry[1], key):
+            return node, _MISSING
+        return _BitmapNode(node.bitmap & ~bit, entries[:index] + entries[index + 1:]), entry[2]
+
+    new_entry, removed = _dissoc(entry, shift + BITS, h, key)
+    if removed is _MISSING:
+        return node, _MISSING
+    if type(new_entry) is _BitmapNode and len(new_entry.entries) == 1 and type(new_entry.entries[0]) is tuple:
+        new_entry = new_entry.entries[0]
+    return _BitmapNode(node.bitmap, entries[:index] + (new_entry,) + entries[index + 1:]), removed
+
+
+# 5. Iteration
+# Depth-first walk with an explicit stack; the order follows the key hashes, not insertion.
+def _iter_leaves(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if type(node) is _CollisionNode:
+            for k, v in node.items:
+                yield node.hash, k, v
+            continue
+        for entry in node.entries:
+            if type(entry) is tuple:
+                yield entry
+            else:
+                stack.append(entry)
+
+
+# 6. Merge
+# Returns (new_node, duplicates). Values from right win, like dict.update(). Subtrees that exist on only
+# one side are reused without copying.
+def _merge(left, right, shift):
+    if left is right:
+        return left, _count(left)
+    if type(left) is _CollisionNode or type(right) is _CollisionNode:
+        # Rare: fold the leaves of one side into the other.
+        duplicates = 0
+        if type(right) is _CollisionNode:
+            node = left
+            for leaf in _iter_leaves(right):
+                node, added = _assoc(node, shift, leaf, overwrite=True)
+                duplicates += not added
+        else:
+            node = right
+            for leaf in _iter_leaves(left):
+                node, added = _assoc(node, shift, leaf, overwrite=False)
+                duplicates += not added
+        return node, duplicates
+
+    bitmap = left.bitmap | right.bitmap
+    entries = []
+    duplicates = 0
+    for i in range(WIDTH):
+        bit = 1 << i
+        if not bitmap & bit:
+            continue
+        if not right.bitmap & bit:
+            entries.append(left.entries[_index(left.bitmap, bit)])
+            continue
+        if not left.bitmap & bit:
+            entries.append(right.entries[_index(right.bitmap, bit)])
+            continue
+        a = left.entries[_index(left.bitmap, bit)]
+        b = right.entries[_index(right.bitmap, bit)]
+        if type(a) is tuple and type(b) is tuple:
+            if a[0] == b[0] and _same_key(a[1], b[1]):
+                entries.append(b)
+                duplicates += 1
+            else:
+                entries.append(_leaves_node(shift + BITS, a, b))
+        elif type(b) is tuple:
+            node, added = _assoc(a, shift + BITS, b, overwrite=True)
+            entries.append(node)
+            duplicates += not added
+        elif type(a) is tuple:
+            node, added = _assoc(b, shift + BITS, a, overwrite=False)
+            entries.append(node)
+            duplicates += not added
+        else:
+            node, child_duplicates = _merge(a, b, shift + BITS)
+            entries.append(node)
+            duplicates += child_duplicates
+    return _BitmapNode(bitmap, tuple(entries)), duplicates
+
+
+def _count(node):
+    return sum(1 for _ in _iter_leaves(node))
+
+
+# 7. Views
+# items() and values() walk the trie directly instead of looking every key up again.
+class _ItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        for _, key, value in _iter_leaves(self._mapping._root):
+            yield key, value
+
+
+class _ValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        for _, _, value in _iter_leaves(self._mapping._root):
+            yield value
+
+
+# 8. The PersistentDict Class
+class PersistentDict(Mapping):
+    __slots__ = ("_root", "_length")
+
+    def __init__(self, mapping=(), **kwargs):
+        root, length = _EMPTY, 0
+        items = mapping.items() if isinstance(mapping, Mapping) else mapping
+        for key, value in chain(items, kwargs.items()):
+            root, added = _assoc(root, 0, (_hash(key), key, value))
+            length += added
+        self._root = root
+        self._length = length
+
+    @classmethod
+    def _make(cls, root, length):
+        new = cls.__new__(cls)
+        new._root = root
+        new._length = length
+        return new
+
+    # Reading
+    def __getitem__(self, key):
+        value = _find(self._root, _hash(key), key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return _find(self._root, _hash(key), key) is not _MISSING
+
+    def get(self, key, default=None):
+        value = _find(self._root, _hash(key), key)
+        return default if value is _MISSING else value
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for _, key, _ in _iter_leaves(self._root):
+            yield key
+
+    def items(self):
+        return _ItemsView(self)
+
+    def values(self):
+        return _ValuesView(self)
+
+    def sorted_items(self, key=None, reverse=False):
+        return sorted(self.items(), key=key, reverse=reverse)
+
+    def __repr__(self):
+        return f"PersistentDict({dict(self.items())!r})"
+
+    # "Updating": every method returns a new PersistentDict.
+    def assoc(self, key, value):
+        root, added = _assoc(self._root, 0, (_hash(key), key, value))
+        if root is self._root:
+            return self
+        return self._make(root, self._length + added)
+
+    def dissoc(self, key):
+        root, removed = _dissoc(self._root, 0, _hash(key), key)
+        if removed is _MISSING:
+            return self
+        return self._make(root, self._length - 1)
+
+    # Returns (value, new_dict), like dict.pop() plus the dictionary without the key.
+    def pop(self, key, default=_MISSING):
+        root, removed = _dissoc(self._root, 0, _hash(key), key)
+        if removed is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default, self
+        return removed, self._make(root, self._length - 1)
+
+    # Returns (value, new_dict), like dict.setdefault() plus the dictionary that holds the key.
+    def setdefault(self, key, default=None):
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value, self
+        return default, self.assoc(key, default)
+
+    def merge(self, other):
+        if not isinstance(other, PersistentDict):
+            other = PersistentDict(other)
+        if not other:
+            return self
+        if not self:
+            return other
+        root, duplicates = _merge(self._root, other._root, 0)
+        return self._make(root, self._length + other._length - duplicates)
+
+    def update(self, mapping=(), **kwargs):
+        result = self.merge(mapping)
+        return result.merge(kwargs) if kwargs else result
+
+    __or__ = merge
+
+    # Snapshots are free, the dictionary can never change.
+    def copy(self):
+        return self
+
+
+# Example usage of the persistent dictionary:
+if __name__ == "__main__":
+    my_dict = PersistentDict({"name": "Alice", "age": 30, "city": "New York"})
+
+    # Adding and updating return new dictionaries, the original is unchanged
+    updated = my_dict.assoc("profession", "Engineer").assoc("age", 31)
+    print(my_dict["age"], updated["age"])  # Output: 30 31
+    print("profession" in my_dict, "profession" in updated)  # Output: False True
+
+    # pop() and setdefault() return the value and the new dictionary
+    profession, without = updated.pop("profession")
+    print(profession, len(without))  # Output: Engineer 3
+    hobby, with_hobby = without.setdefault("hobby", "No hobby")
+    print(hobby, with_hobby.get("hobby"))  # Output: No hobby No hobby
+
+    # Merging shares structure with both inputs
+    other_dict = PersistentDict({"country": "USA", "hobby": "Reading"})
+    merged = with_hobby.merge(other_dict)
+    print(merged.sorted_items())  # Output: [('age', 31), ('city', 'New York'), ('country', 'USA'), ('hobby', 'Reading'), ('name', 'Alice')]
+
+    # A large config copied per request: each version costs only the changed path
+    config = PersistentDict((f"key{i}", i) for i in range(100_000))
+    per_request = [config.assoc("request_id", n) for n in range(1000)]
+    print(len(config), per_request[999]["request_id"], per_request[0]["key99999"])  # Output: 100000 999 99999
@@ -0,0 +1,221 @@
+# Filename: RecordTypes.py
+
+'''
+Record Types: make_record_type() turns a dictionary schema like {"name": str, "age": int} into a class with __slots__, one slot per key.
+
+Small Records: A slotted record has no per-instance __dict__, so it needs a fraction of the memory of an equivalent dict and attribute access is a fixed offset.
+
+Dictionary Behaviour: Records still behave like dictionaries: record["age"], get(), setdefault(), update(), pop(), keys(), values(), items(), iteration and 'in'.
+
+Fixed Keys: Only the schema keys are allowed. Assigning an unknown key raises KeyError, a key that was never set is simply missing (like a dict without that key).
+
+Columnar Tables: RecordTable stores many records column by column. int and float columns are packed into array.array buffers (8 bytes per value), bool columns into 1-byte values, other columns are plain lists.
+
+Table Rows: table[i] returns a light row view that reads and writes the columns directly and supports the same dictionary methods. table[i:j] returns a new RecordTable with a copy of those rows.
+'''
+
+from array import array
+from collections.abc import MutableMapping
+
+# Python types stored in a packed array column, and the array type code used for them.
+ARRAY_TYPECODES = {int: "q", float: "d", bool: "b"}
+
+
+# 1. The Record Base Class
+# MutableMapping provides get(), setdefault(), update(), pop(), keys(), values(), items() and ==.
+class Record(MutableMapping):
+    __slots__ = ()
+    fields = ()
+    types = {}
+
+    def __init__(self, mapping=(), **kwargs):
+        self.update(mapping, **kwargs)
+
+    def __getitem__(self, key):
+        if key not in self.types:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:  # The slot was never set.
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in self.types:
+            raise KeyError(f"{key!r} is not a field of {type(self).__name__}")
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self.types:
+            raise KeyError(key)
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        for field in self.fields:
+            if hasattr(self, field):
+                yield field
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def to_dict(self):
+        return dict(self.items())
+
+
+# 2. Creating a Record Type From a Schema
+# The schema values are either types ({"age": int}) or example values ({"age": 30}).
+def _schema_types(schema):
+    return {field: value if isinstance(value, type) else type(value) for field, value in schema.items()}
+
+
+def make_record_type(name, schema):
+    types = _schema_types(schema)
+    fields = tuple(types)
+    for field in fields:
+        if not field.isidentifier() or hasattr(Record, field):
+            raise ValueError(f"{field!r} cannot be used as a record field")
+    return type(name, (Record,), {"__slots__": fields, "fields": fields, "types": types})
+
+
+# 3. Rows of a Table
+# A row view is just (table, index); reading a key reads from the column.
+class RowView(MutableMapping):
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._table._read(key, self._index)
+
+    def __setitem__(self, key, value):
+        self._table._write(key, self._index, value)
+
+    def __delitem__(self, key):
+        raise TypeError("fields of a table row cannot be deleted")
+
+    def __iter__(self):
+        return iter(self._table.fields)
+
+    def __len__(self):
+        return len(self._table.fields)
+
+    def __repr__(self):
+        return f"RowView({dict(self.items())!r})"
+
+    def to_record(self):
+        return self._table.record_type(self.items())
+
+
+# 4. The Columnar Table
+class RecordTable:
+    def __init__(self, schema, rows=(), name="Row"):
+        self.record_type = schema if isinstance(schema, type) and issubclass(schema, Record) else make_record_type(name, schema)
+        self.fields = self.record_type.fields
+        self.types = self.record_type.types
+        self._columns = {}
+        for field, field_type in self.types.items():
+            typecode = ARRAY_TYPECODES.get(field_type)
+            self._columns[field] = array(typecode) if typecode else []
+        self._length = 0
+        self.extend(rows)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            table = RecordTable(self.record_type)
+            table._columns = {field: column[index] for field, column in self._columns.items()}
+            table._length = len(range(self._length)[index])
+            return table
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("table index out of range")
+        return RowView(self, index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield RowView(self, index)
+
+    def __repr__(self):
+        return f"RecordTable({self.record_type.__name__}, {self._length} rows)"
+
+    # Every row has to provide every field (a dict, a Record or a RowView).
+    def append(self, row):
+        missing = [field for field in self.fields if field not in row]
+        if missing:
+            raise KeyError(f"row is missing fields: {missing}")
+        unknown = [key for key in row if key not in self.types]
+        if unknown:
+            raise KeyError(f"row has unknown fields: {unknown}")
+        added = []
+        try:
+            for field in self.fields:
+                self._columns[field].append(row[field])
+                added.append(field)
+        except (TypeError, OverflowError):
+            for field in added:  # Keep the columns the same length.
+                self._columns[field].pop()
+            raise
+        self._length += 1
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    # Direct access to a whole column (an array.array for numeric fields).
+    def column(self, field):
+        return self._columns[field]
+
+    def _read(self, field, index):
+        try:
+            value = self._columns[field][index]
+        except KeyError:
+            raise KeyError(field) from None
+        return bool(value) if self.types[field] is bool else value
+
+    def _write(self, field, index, value):
+        if field not in self._columns:
+            raise KeyError(f"{field!r} is not a field of this table")
+        self._columns[field][index] = value
+
+
+# Example usage of record types:
+if __name__ == "__main__":
+    import sys
+
+    # The person dictionary from DictonaryOperations.py as a slotted record
+    Person = make_record_type("Person", {"name": "Alice", "age": 30, "city": "New York"})
+    person = Person(name="Alice", age=30, city="New York")
+    print(person["name"], person.age)  # Output: Alice 30
+    print("city" in person)  # Output: True
+
+    del person["city"]
+    print(person.get("city", "Not specified"))  # Output: Not specified
+    print(person.setdefault("city", "Paris"))  # Output: Paris
+    person.update({"age": 31})
+    print(person)  # Output: Person({'name': 'Alice', 'age': 31, 'city': 'Paris'})
+
+    # A slotted record is much smaller than the dict it replaces
+    as_dict = person.to_dict()
+    print(sys.getsizeof(person) < sys.getsizeof(as_dict))  # Output: True
+
+    # The nested_dict records stored column by column
+    nested_dict = {
+        "person1": {"name": "Alice", "age": 30},
+        "person2": {"name": "Bob", "age": 25}
+    }
+    people = RecordTable({"name": str, "age": int}, nested_dict.values(), name="Person")
+    print(people[1]["name"])  # Output: Bob
+    people[1]["age"] += 1
+    print(people.column("age"))  # Output: array('q', [30, 26])
+    print([dict(row) for row in people])  # Output: [{'name': 'Alice', 'age': 30}, {'name': 'Bob', 'age': 26}]
+    print(people[1:], people[::-1].column("name"))  # Output: RecordTable(Person, 1 rows) ['Bob', 'Alice']
@@ -0,0 +1,835 @@
+# Filename: SetOperations.py
+
+'''
+Integer Sets: A Python set stores every number as a separate object in a hash table, about 60-70 bytes per number. For large sets of IDs two specialized sets are much smaller and faster.
+
+Roaring Bitmap: RoaringBitmap splits the numbers into chunks of 65536 by their high bits. A chunk with at most 4096 numbers stores them as a sorted array of 2-byte values; a fuller chunk stores one bit per possible number (8 KB, kept as a Python int). Dense IDs cost about 1 bit each, sparse ones 2 bytes each. Values must be non-negative ints; other values in the set passed to &, -, issubset() and the like are simply never members, while adding one (add, |, ^) raises.
+
+Bitwise Set Operations: Union, intersection, difference and symmetric difference of two bitmap chunks are single |, &, & ~ and ^ operations on Python ints, which run in C over 8 KB at a time.
+
+Sorted-Array Set: SortedArraySet keeps the numbers in one sorted array.array('q') (8 bytes each, negative numbers allowed). Lookups use binary search, and intersecting a small set with a large one costs O(small * log(large)).
+
+Set API: Both support 'in', len(), iteration in sorted order, |, &, -, ^, ==, <=, <, union(), intersection(), difference(), symmetric_difference(), issubset(), issuperset() and isdisjoint(). RoaringBitmap is also mutable (add, discard, remove, add_range, |=, &=, -=, ^=).
+
+Counting Without Building: intersection_len(), union_len(), difference_len() and symmetric_difference_len() return the size of a result without creating the result set.
+
+make_int_set(values) picks the better of the two for the given numbers.
+
+Probabilistic Membership: A BloomFilter or CuckooFilter answers "was this key added?" in a fixed amount of memory (about 1-2 bytes per key), whatever the keys are. "No" is always correct; "yes" is wrong with a small, configurable probability (error_rate). They are used to skip expensive lookups for keys that are certainly absent.
+
+Bloom Filter: Each key sets k bits in a bit array; a key is reported present if all its k bits are set. Keys cannot be removed. Two filters of the same size merge with one bitwise OR.
+
+Cuckoo Filter: Each key stores a small fingerprint in one of two buckets. Unlike a Bloom filter it supports discard(). The fingerprints are bit-packed, so below an error rate of about 0.2% it also needs less memory than a Bloom filter (at 1% it needs about 10% more).
+
+Serialization: to_bytes() and from_bytes() store a filter as one compact byte string, for a file or the network.
+'''
+
+import math
+import pickle
+import random
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableSet, Set
+from hashlib import blake2b
+from itertools import chain, groupby
+
+# A chunk with more numbers than this is stored as a bitmap instead of an array.
+ARRAY_LIMIT = 4096
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+LOW_MASK = CHUNK_SIZE - 1
+
+_popcount = getattr(int, "bit_count", None) or (lambda bits: bin(bits).count("1"))
+
+# The positions of the set bits of every possible byte value.
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+# 1. Chunk Containers
+# A container is either a sorted array('H') (at most ARRAY_LIMIT numbers) or an int bitmap (more than ARRAY_LIMIT).
+def _array_to_bits(values):
+    data = bytearray(CHUNK_SIZE // 8)
+    for value in values:
+        data[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(data, "little")
+
+
+def _bits_to_array(bits):
+    values = array("H")
+    for index, byte in enumerate(bits.to_bytes(CHUNK_SIZE // 8, "little")):
+        if byte:
+            base = index << 3
+            values.extend(base + bit for bit in _BYTE_BITS[byte])
+    return values
+
+
+def _bit_tester(bits):
+    data = bits.to_bytes(CHUNK_SIZE // 8, "little")
+    return lambda value: data[value >> 3] >> (value & 7) & 1
+
+
+def _container_len(container):
+    return _popcount(container) if isinstance(container, int) else len(container)
+
+
+# Returns the container in the right representation, or None if it is empty.
+def _normalize(container):
+    if isinstance(container, int):
+        count = _popcount(container)
+        if count == 0:
+            return None
+        return _bits_to_array(container) if count <= ARRAY_LIMIT else container
+    if not container:
+        return None
+    return _array_to_bits(container) if len(container) > ARRAY_LIMIT else container
+
+
+# The values of the sorted array small that are also in the sorted array large. For each value the search gallops
+# forward from the previous match (1, 2, 4, ... places) and bisects the last step, so small values close
+# together in large cost only a few comparisons each.
+def _common(small, large):
+    start = 0
+    end = len(large)
+    for value in small:
+        if start == end:
+            return
+        if large[start] < value:
+            low, high, step = start, start + 1, 1
+            while high < end and large[high] < value:
+                low = high
+                step *= 2
+                high = low + step
+            start = bisect_left(large, value, low + 1, min(high, end))
+            if start == end:
+                return
+        if large[start] == value:
+            yield value
+
+
+def _and(a, b):
+    if isinstance(a, int) and isinstance(b, int):
+        return a & b
+    if isinstance(a, int):
+        a, b = b, a
+    if isinstance(b, int):
+        test = _bit_tester(b)
+        return array("H", [value for value in a if test(value)])
+    small, large = (a, b) if len(a) <= len(b) else (b, a)
+    return array("H", _common(small, large))
+
+
+def _or(a, b):
+    if isinstance(a, int) or isinstance(b, int) or len(a) + len(b) > ARRAY_LIMIT:
+        return (a if isinstance(a, int) else _array_to_bits(a)) | (b if isinstance(b, int) else _array_to_bits(b))
+    return array("H", sorted(set(a).union(b)))
+
+
+def _and_not(a, b):
+    if isinstance(a, int):
+        return a & ~(b if isinstance(b, int) else _array_to_bits(b))
+    if isinstance(b, int):
+        test = _bit_tester(b)
+        return array("H", [value for value in a if not test(value)])
+    b = set(b)
+    return array("H", [value for value in a if value not in b])
+
+
+def _xor(a, b):
+    if isinstance(a, int) or isinstance(b, int):
+        return (a if isinstance(a, int) else _array_to_bits(a)) ^ (b if isinstance(b, int) else _array_to_bits(b))
+    return array("H", sorted(set(a).symmetric_difference(b)))
+
+
+def _and_len(a, b):
+    if isinstance(a, int) and isinstance(b, int):
+        return _popcount(a & b)
+    if isinstance(a, int):
+        a, b = b, a
+    if isinstance(b, int):
+        test = _bit_tester(b)
+        return sum(map(test, a))
+    small, large = (a, b) if len(a) <= len(b) else (b, a)
+    return sum(1 for _ in _common(small, large))
+
+
+# <= and == against other kinds of sets test membership instead of converting the other set, so a set with
+# values these types can't hold ({-1}, {"a"}) compares as not equal instead of raising.
+def _is_subset(small, large):
+    return len(small) <= len(large) and all(value in large for value in small)
+
+
+def _copy(container):
+    return container if isinstance(container, int) else array("H", container)
+
+
+# 2. The Roaring Bitmap
+class RoaringBitmap(MutableSet):
+    def __init__(self, values=()):
+        self._containers = {}  # high bits -> container
+        if isinstance(values, RoaringBitmap):
+            self._containers = {high: _copy(container) for high, container in values._containers.items()}
+        elif isinstance(values, range) and values.step == 1:
+            self.add_range(values.start, values.stop)
+        else:
+            self._load(sorted(set(values)))
+
+    # The numbers of one chunk are a slice of the sorted list; bisect finds where the chunk ends.
+    def _load(self, ordered):
+        if ordered and ordered[0] < 0:
+            raise ValueError("RoaringBitmap only holds non-negative integers")
+        start = 0
+        while start < len(ordered):
+            high = ordered[start] >> CHUNK_BITS
+            end = bisect_left(ordered, (high + 1) << CHUNK_BITS, start)
+            self._containers[high] = _normalize(array("H", [value & LOW_MASK for value in ordered[start:end]]))
+            start = end
+
+    @classmethod
+    def _from_containers(cls, containers):
+        bitmap = cls.__new__(cls)
+        bitmap._containers = containers
+        return bitmap
+
+    @staticmethod
+    def _coerce(other):
+        return other if isinstance(other, RoaringBitmap) else RoaringBitmap(other)
+
+    # Splits another collection into a bitmap of the values a bitmap can hold and a set of the rest (negative
+    # numbers, non-ints). The rest is never in a bitmap, so intersections and comparisons can leave it out.
+    @staticmethod
+    def _split(other):
+        if isinstance(other, RoaringBitmap):
+            return other, set()
+        values, rest = [], set()
+        for value in other:
+            if isinstance(value, int) and value >= 0:
+                values.append(value)
+            else:
+                rest.add(value)
+        return RoaringBitmap(values), rest
+
+    # Reading
+    def __contains__(self, value):
+        if not isinstance(value, int) or value < 0:
+            return False
+        container = self._containers.get(value >> CHUNK_BITS)
+        if container is None:
+            return False
+        low = value & LOW_MASK
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        i = bisect_left(container, low)
+        return i < len(container) and container[i] == low
+
+    def __len__(self):
+        return sum(map(_container_len, self._containers.values()))
+
+    def __iter__(self):
+        for high in sorted(self._containers):
+            container = self._containers[high]
+            base = high << CHUNK_BITS
+            if isinstance(container, int):
+                container = _bits_to_array(container)
+            for low in container:
+                yield base + low
+
+    def __repr__(self):
+        return f"RoaringBitmap({list(self)!r})"
+
+    # Approximate memory used by the containers.
+    @property
+    def nbytes(self):
+        return sum(CHUNK_SIZE // 8 if isinstance(c, int) else 2 * len(c) for c in self._containers.values())
+
+    # Changing
+    def add(self, value):
+        if value < 0:
+            raise ValueError("RoaringBitmap only holds non-negative integers")
+        high, low = value >> CHUNK_BITS, value & LOW_MASK
+        container = self._containers.get(high)
+        if container is None:
+            self._containers[high] = array("H", [low])
+        elif isinstance(container, int):
+            self._containers[high] = container | (1 << low)
+        else:
+            i = bisect_left(container, low)
+            if i == len(container) or container[i] != low:
+                container.insert(i, low)
+                if len(container) > ARRAY_LIMIT:
+                    self._containers[high] = _array_to_bits(container)
+
+    def discard(self, value):
+        if not isinstance(value, int) or value < 0:
+            return
+        high, low = value >> CHUNK_BITS, value & LOW_MASK
+        container = self._containers.get(high)
+        if container is None:
+            return
+        if isinstance(container, int):
+            container = _normalize(container & ~(1 << low))
+        else:
+            i = bisect_left(container, low)
+            if i < len(container) and container[i] == low:
+                del container[i]
+            container = container or None
+        if container is None:
+            del self._containers[high]
+        else:
+            self._containers[high] = container
+
+    # Adds all numbers in range(start, stop), one chunk at a time.
+    def add_range(self, start, stop):
+        if start < 0:
+            raise ValueError("RoaringBitmap only holds non-negative integers")
+        while start < stop:
+            high = start >> CHUNK_BITS
+            base = high << CHUNK_BITS
+            low, high_end = start - base, min(stop - base, CHUNK_SIZE)
+            bits = ((1 << (high_end - low)) - 1) << low
+            container = self._containers.get(high)
+            self._containers[high] = _normalize(bits if container is None else _or(container, bits))
+            start = base + high_end
+
+    def clear(self):
+        self._containers.clear()
+
+    # Set operations, chunk by chunk
+    def _combine(self, other, operation, keep_left, keep_right):
+        other = self._coerce(other)
+        result = {}
+        for high, container in self._containers.items():
+            other_container = other._containers.get(high)
+            if other_container is not None:
+                combined = _normalize(operation(container, other_container))
+                if combined is not None:
+                    result[high] = combined
+            elif keep_left:
+                result[high] = _copy(container)
+        if keep_right:
+            for high, container in other._containers.items():
+                if high not in self._containers:
+                    result[high] = _copy(container)
+        return RoaringBitmap._from_containers(result)
+
+    def union(self, other):
+        return self._combine(other, _or, True, True)
+
+    def intersection(self, other):
+        return self._combine(self._split(other)[0], _and, False, False)
+
+    def difference(self, other):
+        return self._combine(self._split(other)[0], _and_not, True, False)
+
+    def symmetric_difference(self, other):
+        return self._combine(other, _xor, True, True)
+
+    __or__ = __ror__ = union
+    __and__ = __rand__ = intersection
+    __sub__ = difference
+    __xor__ = __rxor__ = symmetric_difference
+
+    def __rsub__(self, other):
+        return self._coerce(other).difference(self)
+
+    def _replace(self, result):
+        self._containers = result._containers
+        return self
+
+    def __ior__(self, other):
+        return self._replace(self.union(other))
+
+    def __iand__(self, other):
+        return self._replace(self.intersection(other))
+
+    def __isub__(self, other):
+        return self._replace(self.difference(other))
+
+    def __ixor__(self, other):
+        return self._replace(self.symmetric_difference(other))
+
+    # Sizes of results, without building them
+    def intersection_len(self, other):
+        other = self._split(other)[0]
+        return sum(_and_len(container, other._containers[high])
+                   for high, container in self._containers.items() if high in other._containers)
+
+    def union_len(self, other):
+        other, rest = self._split(other)
+        return len(self) + len(other) + len(rest) - self.intersection_len(other)
+
+    def difference_len(self, other):
+        return len(self) - self.intersection_len(other)
+
+    def symmetric_difference_len(self, other):
+        other, rest = self._split(other)
+        return len(self) + len(other) + len(rest) - 2 * self.intersection_len(other)
+
+    # Comparisons
+    def issubset(self, other):
+        other = self._split(other)[0]
+        if not self._containers.keys() <= other._containers.keys():
+            return False
+        return all(_and_len(container, other._containers[high]) == _container_len(container)
+                   for high, container in self._containers.items())
+
+    def issuperset(self, other):
+        other, rest = self._split(other)
+        return not rest and other.issubset(self)
+
+    def isdisjoint(self, other):
+        return self.intersection_len(other) == 0
+
+    def __le__(self, other):
+        if isinstance(other, RoaringBitmap):
+            return self.issubset(other)
+        return _is_subset(self, other) if isinstance(other, Set) else NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, RoaringBitmap):
+            return other.issubset(self)
+        return _is_subset(other, self) if isinstance(other, Set) else NotImplemented
+
+    # Containers are always in their normal form, so equal sets have equal containers.
+    def __eq__(self, other):
+        if isinstance(other, RoaringBitmap):
+            return self._containers == other._containers
+        return len(self) == len(other) and _is_subset(self, other) if isinstance(other, Set) else NotImplemented
+
+    __hash__ = None
+
+    def copy(self):
+        return RoaringBitmap(self)
+
+
+# 3. The Sorted-Array Set
+class SortedArraySet(Set):
+    def __init__(self, values=()):
+        if isinstance(values, SortedArraySet):
+            self._items = values._items
+        else:
+            self._items = array("q", sorted(set(values)))
+
+    @classmethod
+    def _from_sorted(cls, items):
+        result = cls.__new__(cls)
+        result._items = items if isinstance(items, array) else array("q", items)
+        return result
+
+    @staticmethod
+    def _coerce(other):
+        return other if isinstance(other, SortedArraySet) else SortedArraySet(other)
+
+    def _small_large(self, other):
+        return (self._items, other._items) if len(self._items) <= len(other._items) else (other._items, self._items)
+
+    def __contains__(self, value):
+        if not isinstance(value, int):
+            return False
+        i = bisect_left(self._items, value)
+        return i < len(self._items) and self._items[i] == value
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __repr__(self):
+        return f"SortedArraySet({self._items.tolist()!r})"
+
+    @property
+    def nbytes(self):
+        return len(self._items) * self._items.itemsize
+
+    # Sorting two sorted runs is a linear merge in Timsort; equal neighbours are the numbers in both sets.
+    def _merged(self, other):
+        return groupby(sorted(chain(self._items, other._items)))
+
+    def union(self, other):
+        other = self._coerce(other)
+        return SortedArraySet._from_sorted([value for value, _ in self._merged(other)])
+
+    def intersection(self, other):
+        other = self._coerce(other)
+        return SortedArraySet._from_sorted(list(_common(*self._small_large(other))))
+
+    def difference(self, other):
+        other = self._coerce(other)
+        items = other._items
+        if not items:
+            return SortedArraySet._from_sorted(array("q", self._items))
+        common = set(_common(*self._small_large(other)))
+        return SortedArraySet._from_sorted([value for value in self._items if value not in common])
+
+    def symmetric_difference(self, other):
+        other = self._coerce(other)
+        return SortedArraySet._from_sorted(
+            [value for value, group in self._merged(other) if len(list(group)) == 1]
+        )
+
+    __or__ = __ror__ = union
+    __and__ = __rand__ = intersection
+    __sub__ = difference
+    __xor__ = __rxor__ = symmetric_difference
+
+    def __rsub__(self, other):
+        return self._coerce(other).difference(self)
+
+    def intersection_len(self, other):
+        other = self._coerce(other)
+        return sum(1 for _ in _common(*self._small_large(other)))
+
+    def union_len(self, other):
+        other = self._coerce(other)
+        return len(self) + len(other) - self.intersection_len(other)
+
+    def difference_len(self, other):
+        return len(self) - self.intersection_len(other)
+
+    def symmetric_difference_len(self, other):
+        other = self._coerce(other)
+        return len(self) + len(other) - 2 * self.intersection_len(other)
+
+    def issubset(self, other):
+        other = self._coerce(other)
+        return len(self) <= len(other) and self.intersection_len(other) == len(self)
+
+    def issuperset(self, other):
+        return self._coerce(other).issubset(self)
+
+    def isdisjoint(self, other):
+        return self.intersection_len(other) == 0
+
+    def __le__(self, other):
+        if isinstance(other, SortedArraySet):
+            return self.issubset(other)
+        return _is_subset(self, other) if isinstance(other, Set) else NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, SortedArraySet):
+            return other.issubset(self)
+        return _is_subset(other, self) if isinstance(other, Set) else NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, SortedArraySet):
+            return self._items == other._items
+        return len(self) == len(other) and _is_subset(self, other) if isinstance(other, Set) else NotImplemented
+
+    __hash__ = None
+
+
+# 4. Choosing a Set Type
+# Bitmaps pay off once chunks hold a fair number of values; very sparse or negative numbers go into a sorted array.
+def make_int_set(values):
+    ordered = sorted(set(values))
+    if not ordered or ordered[0] < 0:
+        return SortedArraySet(ordered)
+    chunks = (ordered[-1] >> CHUNK_BITS) - (ordered[0] >> CHUNK_BITS) + 1
+    if len(ordered) >= 8 * chunks:
+        return RoaringBitmap(ordered)
+    return SortedArraySet._from_sorted(ordered)
+
+
+# 5. Probabilistic Membership: Key Hashing
+# Keys are hashed from their bytes: bytes-like keys as they are, str as UTF-8 and anything else pickled (as in
+# DiskDictionary.py). The hash does not depend on the process, so filters can be saved and loaded. A one-byte
+# tag for the kind of key goes first, so "a" and b"a" are different keys.
+def _key_hash(key):
+    if isinstance(key, str):
+        tag, data = b"s", key.encode()
+    elif isinstance(key, (bytes, bytearray, memoryview)):
+        tag, data = b"b", key
+    else:
+        tag, data = b"p", pickle.dumps(key, protocol=4)
+    digest = blake2b(tag, digest_size=16)
+    digest.update(data)
+    return int.from_bytes(digest.digest(), "little")
+
+
+# 6. The Bloom Filter
+# m bits and k hash positions per key; the positions are h1 + i * h2 (two halves of one 128-bit hash).
+class BloomFilter:
+    HEADER = struct.Struct("<4sQQI")
+    MAGIC = b"BLM2"
+
+    def __init__(self, capacity, error_rate=0.01):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0  # Number of add() calls
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = _key_hash(key)
+        first, step = digest & 0xFFFFFFFFFFFFFFFF, digest >> 64 | 1
+        size = self.size
+        return [(first + i * step) % size for i in range(self.hash_count)]
+
+    def add(self, key):
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, keys):
+        for key in keys:
+            self.add(key)
+
+    # False means "certainly not added"; True means "probably added".
+    def __contains__(self, key):
+        bits = self._bits
+        return all(bits[position >> 3] >> (position & 7) & 1 for position in self._positions(key))
+
+    def __len__(self):
+        return self.count
+
+    # The false-positive rate expected after count keys.
+    def expected_error_rate(self):
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
+
+    @property
+    def nbytes(self):
+        return len(self._bits)
+
+    # Filters built with the same size and hash count can be merged: the result contains the keys of both.
+    def merge(self, other):
+        if (self.size, self.hash_count) != (other.size, other.hash_count):
+            raise ValueError("can only merge Bloom filters with the same size and hash count")
+        merged = int.from_bytes(self._bits, "little") | int.from_bytes(other._bits, "little")
+        self._bits[:] = merged.to_bytes(len(self._bits), "little")
+        self.count += other.count
+        return self
+
+    def __or__(self, other):
+        return self.copy().merge(other)
+
+    def copy(self):
+        return BloomFilter.from_bytes(self.to_bytes())
+
+    def to_bytes(self):
+        return self.HEADER.pack(self.MAGIC, self.size, self.count, self.hash_count) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < cls.HEADER.size:
+            raise ValueError("not a serialized BloomFilter")
+        magic, size, count, hash_count = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or not size or not hash_count:
+            raise ValueError("not a serialized BloomFilter")
+        expected = cls.HEADER.size + (size + 7) // 8
+        if len(data) != expected:
+            raise ValueError(f"serialized BloomFilter should be {expected} bytes, got {len(data)}")
+        bloom = cls.__new__(cls)
+        bloom.size, bloom.count, bloom.hash_count = size, count, hash_count
+        bloom._bits = bytearray(data[cls.HEADER.size:])
+        return bloom
+
+
+# 7. The Cuckoo Filter
+# Every key leaves a small fingerprint in one of two buckets. The second bucket is a hash of the fingerprint minus
+# the first one (modulo the number of buckets), so a fingerprint can be moved between its buckets without knowing
+# its key; that is what makes deletion possible. A full bucket pair makes room by moving ("kicking") fingerprints
+# to their other bucket.
+# The fingerprints are bit-packed: slot i is bits i * fingerprint_bits ... of one little-endian bytearray, so a
+# 10-bit fingerprint costs 10 bits on every platform and to_bytes() is the bytearray itself.
+class CuckooFilter:
+    HEADER = struct.Struct("<4sQIIQ")
+    MAGIC = b"CKO2"
+    BUCKET_SIZE = 4
+    MAX_KICKS = 500
+    LOAD_FACTOR = 0.95
+    _WORD = 5  # A fingerprint of up to 32 bits starting anywhere in a byte fits in 5 bytes.
+
+    def __init__(self, capacity, error_rate=0.01):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+        # Two buckets of BUCKET_SIZE slots are checked, so 2 * BUCKET_SIZE fingerprints may collide by chance.
+        bits = min(32, max(4, math.ceil(math.log2(2 * self.BUCKET_SIZE / error_rate))))
+        buckets = max(2, math.ceil(capacity / (self.BUCKET_SIZE * self.LOAD_FACTOR)))
+        self._setup(buckets, bits, 0)
+
+    def _setup(self, buckets, fingerprint_bits, count):
+        self.buckets = buckets
+        self.fingerprint_bits = fingerprint_bits
+        self.count = count
+        self._mask = (1 << fingerprint_bits) - 1
+        self._data = bytearray(self._data_size(buckets, fingerprint_bits) + self._WORD - 1)
+        self._random = random.Random(buckets)
+
+    @classmethod
+    def _data_size(cls, buckets, fingerprint_bits):
+        return (buckets * cls.BUCKET_SIZE * fingerprint_bits + 7) // 8
+
+    def _get(self, slot):
+        position = slot * self.fingerprint_bits
+        start = position >> 3
+        return int.from_bytes(self._data[start:start + self._WORD], "little") >> (position & 7) & self._mask
+
+    def _set(self, slot, fingerprint):
+        position = slot * self.fingerprint_bits
+        start = position >> 3
+        shift = position & 7
+        word = int.from_bytes(self._data[start:start + self._WORD], "little")
+        word = word & ~(self._mask << shift) | fingerprint << shift
+        self._data[start:start + self._WORD] = word.to_bytes(self._WORD, "little")
+
+    # Fingerprint 0 marks an empty slot, so real fingerprints are 1 .. 2**bits - 1.
+    def _fingerprint_and_index(self, key):
+        digest = _key_hash(key)
+        fingerprint = (digest >> 64) & self._mask or 1
+        return fingerprint, (digest & 0xFFFFFFFFFFFFFFFF) % self.buckets
+
+    # (h - (h - i)) == i, so applying this twice leads back to the first bucket.
+    def _other_index(self, index, fingerprint):
+        return (fingerprint * 0x5BD1E995 - index) % self.buckets
+
+    def _put(self, index, fingerprint):
+        start = index * self.BUCKET_SIZE
+        for slot in range(start, start + self.BUCKET_SIZE):
+            if not self._get(slot):
+                self._set(slot, fingerprint)
+                return True
+        return False
+
+    def _find(self, index, fingerprint):
+        start = index * self.BUCKET_SIZE
+        for slot in range(start, start + self.BUCKET_SIZE):
+            if self._get(slot) == fingerprint:
+                return slot
+        return -1
+
+    def _insert(self, fingerprint, index):
+        other = self._other_index(index, fingerprint)
+        if self._put(index, fingerprint) or self._put(other, fingerprint):
+            self.count += 1
+            return
+        # Kick fingerprints to their other bucket. If no room is found, the moves are undone and nothing is lost.
+        moves = []
+        index = self._random.choice((index, other))
+        for _ in range(self.MAX_KICKS):
+            slot = index * self.BUCKET_SIZE + self._random.randrange(self.BUCKET_SIZE)
+            previous = self._get(slot)
+            moves.append((slot, previous))
+            self._set(slot, fingerprint)
+            fingerprint = previous
+            index = self._other_index(index, fingerprint)
+            if self._put(index, fingerprint):
+                self.count += 1
+                return
+        for slot, previous in reversed(moves):
+            self._set(slot, previous)
+        raise ValueError("CuckooFilter is full")
+
+    def add(self, key):
+        fingerprint, index = self._fingerprint_and_index(key)
+        self._insert(fingerprint, index)
+
+    def update(self, keys):
+        for key in keys:
+            self.add(key)
+
+    # False means "certainly not added"; True means "probably added".
+    def __contains__(self, key):
+        fingerprint, index = self._fingerprint_and_index(key)
+        return self._find(index, fingerprint) != -1 or self._find(self._other_index(index, fingerprint), fingerprint) != -1
+
+    # Only discard keys that were added; removing any other key may remove the fingerprint of a different one.
+    def discard(self, key):
+        fingerprint, index = self._fingerprint_and_index(key)
+        for bucket in (index, self._other_index(index, fingerprint)):
+            slot = self._find(bucket, fingerprint)
+            if slot != -1:
+                self._set(slot, 0)
+                self.count -= 1
+                return True
+        return False
+
+    def remove(self, key):
+        if not self.discard(key):
+            raise KeyError(key)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self):
+        return len(self._data)
+
+    # Adds every fingerprint of other; both filters need the same number of buckets and fingerprint size.
+    # The fingerprints go into a copy first, so a filter that runs full is left as it was.
+    def merge(self, other):
+        if (self.buckets, self.fingerprint_bits) != (other.buckets, other.fingerprint_bits):
+            raise ValueError("can only merge cuckoo filters with the same buckets and fingerprint size")
+        merged = self.copy()
+        for slot in range(self.buckets * self.BUCKET_SIZE):
+            fingerprint = other._get(slot)
+            if fingerprint:
+                merged._insert(fingerprint, slot // self.BUCKET_SIZE)
+        self._data, self.count = merged._data, merged.count
+        return self
+
+    def copy(self):
+        return CuckooFilter.from_bytes(self.to_bytes())
+
+    def to_bytes(self):
+        header = self.HEADER.pack(self.MAGIC, self.buckets, self.BUCKET_SIZE, self.fingerprint_bits, self.count)
+        return header + self._data[:self._data_size(self.buckets, self.fingerprint_bits)]
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < cls.HEADER.size:
+            raise ValueError("not a serialized CuckooFilter")
+        magic, buckets, bucket_size, fingerprint_bits, count = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or bucket_size != cls.BUCKET_SIZE or not buckets or not 1 <= fingerprint_bits <= 32:
+            raise ValueError("not a serialized CuckooFilter")
+        size = cls._data_size(buckets, fingerprint_bits)
+        if len(data) != cls.HEADER.size + size:
+            raise ValueError(f"serialized CuckooFilter should be {cls.HEADER.size + size} bytes, got {len(data)}")
+        cuckoo = cls.__new__(cls)
+        cuckoo._setup(buckets, fingerprint_bits, count)
+        cuckoo._data[:size] = data[cls.HEADER.size:]
+        return cuckoo
+
+
+# Example usage of the integer sets (same sets as Comprehensions.py) and the filters:
+if __name__ == "__main__":
+    squares_set = RoaringBitmap(x**2 for x in range(5))
+    even_set = RoaringBitmap(x for x in range(10) if x % 2 == 0)
+    print(squares_set, even_set)  # Output: RoaringBitmap([0, 1, 4, 9, 16]) RoaringBitmap([0, 2, 4, 6, 8])
+    print(squares_set & even_set, squares_set | even_set)  # Output: RoaringBitmap([0, 4]) RoaringBitmap([0, 1, 2, 4, 6, 8, 9, 16])
+    print(list(squares_set - even_set), list(squares_set ^ even_set))  # Output: [1, 9, 16] [1, 2, 6, 8, 9, 16]
+    print(squares_set.intersection_len(even_set), RoaringBitmap([0, 4]) <= squares_set)  # Output: 2 True
+
+    sparse = SortedArraySet([-5, 10**12, 3])
+    print(sparse & {3, 4}, 10**12 in sparse)  # Output: SortedArraySet([3]) True
+
+    # Ten million dense IDs: 1.2 MB as a bitmap versus hundreds of MB as a set
+    ids = RoaringBitmap(range(10_000_000))
+    odd = RoaringBitmap()
+    odd.add_range(0, 10_000_000)
+    odd -= RoaringBitmap(range(0, 10_000_000, 2))
+    print(len(ids), ids.nbytes, odd.intersection_len(ids))  # Output: 10000000 1253376 5000000
+    print(type(make_int_set(range(0, 1000))).__name__, type(make_int_set([1, 10**9])).__name__)  # Output: RoaringBitmap SortedArraySet
+
+    # Pre-screening membership checks (the fruits from ConditionalOperations.py)
+    fruits = BloomFilter(capacity=1000, error_rate=0.01)
+    fruits.update(["apple", "banana", "cherry"])
+    print("banana" in fruits, "mango" in fruits)  # Output: True False
+
+    seen = CuckooFilter(capacity=1000)
+    seen.update(["apple", "banana"])
+    seen.discard("banana")
+    print("apple" in seen, "banana" in seen, len(seen))  # Output: True False 1
+
+    # 200,000 keys in about 1.2 bytes each, and the filter survives a round trip through bytes
+    keys = BloomFilter(capacity=200_000, error_rate=0.01)
+    keys.update(range(200_000))
+    loaded = BloomFilter.from_bytes(keys.to_bytes())
+    false_positives = sum(1 for key in range(200_000, 300_000) if key in loaded)
+    print(keys.nbytes, 199_999 in loaded, false_positives < 1500)  # Output: 239627 True True
+    try:
+        BloomFilter.from_bytes(keys.to_bytes()[:-1])  # A truncated file
+    except ValueError as error:
+        print(error)  # Output: serialized BloomFilter should be 239651 bytes, got 239650
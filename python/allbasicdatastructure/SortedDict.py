@@ -0,0 +1,279 @@
+# Filename: SortedDict.py
+
+'''
+Sorted Dictionary: A dictionary that keeps its keys in sorted order all the time, so dict(sorted(my_dict.items())) is never needed.
+
+Blocked Sorted List: The keys live in a list of small sorted blocks (like the leaves of a B+tree) plus a list with the largest key of every block. bisect finds the block and the position inside it, so inserts and deletes cost O(log n) comparisons and only move one small block.
+
+Range Queries: irange(low, high) yields the keys between two bounds in order, costing O(log n + k) for k results.
+
+Floor and Ceiling: floor_key(x) is the largest key <= x, ceiling_key(x) the smallest key >= x (lower_key / higher_key are the strict versions).
+
+Value Index: With value_index=True the dictionary also keeps (value, key) pairs sorted, so items_by_value() and value_range() are available without sorting.
+'''
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+
+# Blocks are split when they grow past 2 * LOAD items.
+LOAD = 500
+
+_MISSING = object()
+
+
+# 1. The Blocked Sorted List
+class SortedKeyList:
+    def __init__(self, iterable=(), load=LOAD):
+        self._load = load
+        self._blocks = []
+        self._maxes = []
+        self._length = 0
+        values = sorted(iterable)
+        for start in range(0, len(values), load):
+            block = values[start:start + load]
+            self._blocks.append(block)
+            self._maxes.append(block[-1])
+        self._length = len(values)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __reversed__(self):
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    def __contains__(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        block = self._blocks[pos]
+        index = bisect_left(block, value)
+        return block[index] == value
+
+    def add(self, value):
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+        else:
+            pos = bisect_right(self._maxes, value)
+            if pos == len(self._maxes):
+                pos -= 1
+                self._blocks[pos].append(value)
+                self._maxes[pos] = value
+            else:
+                insort(self._blocks[pos], value)
+            self._split(pos)
+        self._length += 1
+
+    def remove(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            raise ValueError(f"{value!r} not in list")
+        block = self._blocks[pos]
+        index = bisect_left(block, value)
+        if block[index] != value:
+            raise ValueError(f"{value!r} not in list")
+        del block[index]
+        self._length -= 1
+        if not block:
+            del self._blocks[pos]
+            del self._maxes[pos]
+        elif index == len(block):
+            self._maxes[pos] = block[-1]
+
+    def _split(self, pos):
+        block = self._blocks[pos]
+        if len(block) > 2 * self._load:
+            half = block[self._load:]
+            del block[self._load:]
+            self._maxes[pos] = block[-1]
+            self._blocks.insert(pos + 1, half)
+            self._maxes.insert(pos + 1, half[-1])
+
+    # Position of the first value >= x (or > x when strict), as (block, index) or None.
+    def _locate(self, value, strict):
+        find = bisect_right if strict else bisect_left
+        pos = find(self._maxes, value)
+        if pos == len(self._maxes):
+            return None
+        return pos, find(self._blocks[pos], value)
+
+    # 2. Floor / Ceiling Lookups
+    def ceiling(self, value, default=None):
+        found = self._locate(value, strict=False)
+        return default if found is None else self._blocks[found[0]][found[1]]
+
+    def higher(self, value, default=None):
+        found = self._locate(value, strict=True)
+        return default if found is None else self._blocks[found[0]][found[1]]
+
+    def floor(self, value, default=None):
+        return self._before(self._locate(value, strict=True), default)
+
+    def lower(self, value, default=None):
+        return self._before(self._locate(value, strict=False), default)
+
+    def _before(self, found, default):
+        # The value just before a located position.
+        if found is None:
+            return self._blocks[-1][-1] if self._blocks else default
+        pos, index = found
+        if index > 0:
+            return self._blocks[pos][index - 1]
+        if pos > 0:
+            return self._blocks[pos - 1][-1]
+        return default
+
+    def first(self):
+        return self._blocks[0][0]
+
+    def last(self):
+        return self._blocks[-1][-1]
+
+    # 3. Range Queries
+    # Yields the values between low and high in order; None means unbounded.
+    def irange(self, low=None, high=None, inclusive=(True, True)):
+        if not self._blocks:
+            return
+        if low is None:
+            pos, index = 0, 0
+        else:
+            found = self._locate(low, strict=not inclusive[0])
+            if found is None:
+                return
+            pos, index = found
+        for block in self._blocks[pos:]:
+            for value in block[index:] if index else block:
+                if high is not None and (value > high or (value == high and not inclusive[1])):
+                    return
+                yield value
+            index = 0
+
+
+# 4. The Sorted Dictionary
+# Values live in a normal dict, the SortedKeyList only keeps the order of the keys.
+class SortedDict(MutableMapping):
+    def __init__(self, mapping=(), value_index=False, **kwargs):
+        self._data = dict(mapping, **kwargs)
+        self._keys = SortedKeyList(self._data)
+        self._by_value = SortedKeyList((value, key) for key, value in self._data.items()) if value_index else None
+
+    # Dictionary access
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        old = self._data.get(key, _MISSING)
+        if old is _MISSING:
+            self._keys.add(key)
+        elif self._by_value is not None:
+            self._by_value.remove((old, key))
+        self._data[key] = value
+        if self._by_value is not None:
+            self._by_value.add((value, key))
+
+    def __delitem__(self, key):
+        value = self._data.pop(key)
+        self._keys.remove(key)
+        if self._by_value is not None:
+            self._by_value.remove((value, key))
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    # Iteration is always in key order.
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __reversed__(self):
+        return reversed(self._keys)
+
+    def __repr__(self):
+        return f"SortedDict({dict(self.items())!r})"
+
+    def clear(self):
+        self._data.clear()
+        self._keys = SortedKeyList()
+        if self._by_value is not None:
+            self._by_value = SortedKeyList()
+
+    def copy(self):
+        return SortedDict(self._data, value_index=self._by_value is not None)
+
+    # Ordered lookups
+    def irange(self, low=None, high=None, inclusive=(True, True)):
+        return self._keys.irange(low, high, inclusive)
+
+    def irange_items(self, low=None, high=None, inclusive=(True, True)):
+        for key in self._keys.irange(low, high, inclusive):
+            yield key, self._data[key]
+
+    def floor_key(self, key, default=None):
+        return self._keys.floor(key, default)
+
+    def ceiling_key(self, key, default=None):
+        return self._keys.ceiling(key, default)
+
+    def lower_key(self, key, default=None):
+        return self._keys.lower(key, default)
+
+    def higher_key(self, key, default=None):
+        return self._keys.higher(key, default)
+
+    def peekitem(self, last=True):
+        if not self._data:
+            raise KeyError("dictionary is empty")
+        key = self._keys.last() if last else self._keys.first()
+        return key, self._data[key]
+
+    def popitem(self, last=True):
+        key, value = self.peekitem(last)
+        del self[key]
+        return key, value
+
+    # Value index (needs value_index=True)
+    def _value_index(self):
+        if self._by_value is None:
+            raise TypeError("this SortedDict was created without value_index=True")
+        return self._by_value
+
+    def items_by_value(self, reverse=False):
+        index = self._value_index()
+        for value, key in (reversed(index) if reverse else index):
+            yield key, value
+
+    def value_range(self, low, high):
+        # Items whose value is between low and high (both inclusive), ordered by value.
+        for value, key in self._value_index().irange((low,), None):
+            if value > high:
+                return
+            yield key, value
+
+
+# Example usage of the sorted dictionary:
+if __name__ == "__main__":
+    scores = SortedDict({"carol": 72, "alice": 90, "bob": 85}, value_index=True)
+    scores["dave"] = 60
+
+    # Always ordered by key, no re-sorting needed
+    print(list(scores))  # Output: ['alice', 'bob', 'carol', 'dave']
+
+    # Range queries and floor / ceiling lookups
+    print(list(scores.irange("b", "d")))  # Output: ['bob', 'carol']
+    print(scores.floor_key("bz"), scores.ceiling_key("bz"))  # Output: bob carol
+
+    # Secondary index sorted by value
+    print(list(scores.items_by_value(reverse=True))[:2])  # Output: [('alice', 90), ('bob', 85)]
+    print(list(scores.value_range(70, 86)))  # Output: [('carol', 72), ('bob', 85)]
+
+    # Updates keep both orders in sync
+    scores["dave"] = 95
+    del scores["alice"]
+    print(scores.peekitem(), next(scores.items_by_value(reverse=True)))  # Output: ('dave', 95) ('dave', 95)
@@ -0,0 +1,131 @@
+# Filename: StreamingComprehensions.py
+
+'''
+Streaming Flatten: iter_flatten() yields the items of a nested structure one at a time instead of building the flattened list.
+
+Arbitrary Depth: The flatten keeps its own stack of iterators, so any nesting depth works without hitting Python's recursion limit.
+
+Streaming Cartesian Product: iter_cartesian() yields the (x, y, ...) tuples one at a time, either with itertools.product or with a nested-loop mode that never copies its inputs.
+
+Chunked Output: chunked() groups any stream into blocks of N items, so large results can be processed (written, sent, summed) in bounded memory.
+'''
+
+from itertools import islice, product
+
+# Strings and bytes are iterable, but they are treated as single items when flattening.
+ATOMIC_TYPES = (str, bytes, bytearray)
+
+# Marker returned by next() when an iterator is used up.
+_EXHAUSTED = object()
+
+
+# 1. Chunking Any Stream
+# Yields lists of at most size items, the last block may be shorter.
+def chunked(iterable, size):
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(iterable)
+    while True:
+        block = list(islice(iterator, size))
+        if not block:
+            return
+        yield block
+
+
+# 2. Streaming Flatten
+# flattened = [item for sublist in matrix for item in sublist] without the list, and for any depth.
+# max_depth=1 gives exactly the one-level flatten of the comprehension; None flattens everything.
+def iter_flatten(nested, max_depth=None, atomic_types=ATOMIC_TYPES):
+    stack = [iter(nested)]
+    while stack:
+        for item in stack[-1]:
+            can_descend = max_depth is None or len(stack) <= max_depth
+            if can_descend and not isinstance(item, atomic_types):
+                try:
+                    stack.append(iter(item))
+                except TypeError:  # Not iterable, so it is a leaf value.
+                    yield item
+                else:
+                    break
+            else:
+                yield item
+        else:
+            stack.pop()
+
+
+def flatten_chunks(nested, size, max_depth=None):
+    return chunked(iter_flatten(nested, max_depth), size)
+
+
+# 3. Streaming Cartesian Product
+# cartesian_product = [(x, y) for x in range(2) for y in range(3)] without the list.
+# mode="product" uses itertools.product (fastest, but it keeps a copy of every input).
+# mode="nested" re-iterates the inputs instead, so ranges and other re-iterable inputs are never copied.
+def iter_cartesian(*iterables, mode="product"):
+    if mode == "product":
+        return product(*iterables)
+    if mode == "nested":
+        for iterable in iterables:
+            if iter(iterable) is iterable:
+                raise TypeError("mode='nested' needs re-iterable inputs (lists, ranges, ...), not iterators")
+        return _nested_product(iterables)
+    raise ValueError(f"unknown mode: {mode!r}")
+
+
+def _nested_product(iterables):
+    # An odometer: one live iterator per input, the rightmost one turns fastest.
+    if not iterables:
+        yield ()
+        return
+    iterators = [iter(iterable) for iterable in iterables]
+    current = []
+    for iterator in iterators:
+        value = next(iterator, _EXHAUSTED)
+        if value is _EXHAUSTED:
+            return  # One of the inputs is empty, so the product is empty.
+        current.append(value)
+    while True:
+        yield tuple(current)
+        position = len(iterators) - 1
+        while position >= 0:
+            value = next(iterators[position], _EXHAUSTED)
+            if value is not _EXHAUSTED:
+                current[position] = value
+                break
+            # This wheel is done, restart it and move the wheel on its left.
+            iterators[position] = iter(iterables[position])
+            current[position] = next(iterators[position])
+            position -= 1
+        if position < 0:
+            return
+
+
+def cartesian_chunks(*iterables, size, mode="product"):
+    return chunked(iter_cartesian(*iterables, mode=mode), size)
+
+
+# Example usage of the streaming comprehensions:
+if __name__ == "__main__":
+    matrix = [[1, 2], [3, 4], [5, 6]]
+    print(list(iter_flatten(matrix)))  # Output: [1, 2, 3, 4, 5, 6]
+
+    # Any depth, strings stay whole
+    print(list(iter_flatten([1, [2, [3, ["four", (5,)]]]])))  # Output: [1, 2, 3, 'four', 5]
+    print(list(iter_flatten([1, [2, [3, [4]]]], max_depth=1)))  # Output: [1, 2, [3, [4]]]
+
+    # Deeper than the recursion limit
+    deep = [0]
+    for _ in range(100_000):
+        deep = [deep]
+    print(list(iter_flatten(deep)))  # Output: [0]
+
+    print(list(iter_cartesian(range(2), range(3))))  # Output: [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+    print(list(iter_cartesian(range(2), range(3), mode="nested")))  # Output: [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+
+    # Blocks of N items
+    print(list(flatten_chunks(matrix, 4)))  # Output: [[1, 2, 3, 4], [5, 6]]
+    print(list(cartesian_chunks(range(2), range(3), size=4)))  # Output: [[(0, 0), (0, 1), (0, 2), (1, 0)], [(1, 1), (1, 2)]]
+
+    # A 10^12 element product processed one block at a time, only the first block is ever built
+    huge = cartesian_chunks(range(1_000_000), range(1_000_000), size=1000, mode="nested")
+    print(next(huge)[-1])  # Output: (0, 999)
@@ -0,0 +1,201 @@
+# Filename: StreamingSplit.py
+
+'''
+Lazy Splitting: str.split() builds the whole list of parts at once. iter_split() yields the parts one by one, so only the current part has to be in memory.
+
+Zero-Copy Parts: For bytes-like input (bytes, bytearray, memoryview, mmap) the parts are memoryview slices of the original buffer, no bytes are copied. Call bytes(part) or part.tobytes() to get a copy, or part.release() when done. A str input gives str parts.
+
+Separators: sep=None splits on runs of whitespace and drops empty parts, like str.split(). A string separator may be several characters long (", "). A compiled regular expression splits on every match, like re.split(), for example re.compile(r"\s*[,;]\s*").
+
+Memory-Mapped Files: iter_split() works directly on an mmap, so a multi-GB file can be split without reading it into memory. The operating system loads the pages as the parts are used.
+
+Streamed Files: iter_split_chunks() splits text that arrives in chunks (for example from a pipe) and split_file() reads a file in blocks. A separator that crosses a chunk boundary is still found; only the unfinished last part is carried over to the next chunk. With sep=None or a plain separator the parts are exactly those of str.split(), and each chunk is searched only once.
+
+Regular Expressions Over Chunks: A match that touches the end of the text read so far waits for the next chunk, and the unfinished part is searched again with every chunk. Capturing groups are yielded between the parts and empty matches (r"\b") split once, as in re.split(). That gives the same parts as re.split() for patterns whose matches don't depend on text beyond their end or before the previous split, but a pattern like r"ab*c|b" may match differently than on the whole text, and a very long unfinished part is rescanned many times.
+'''
+
+import re
+
+from MultiPatternSearch import CHUNK_SIZE, read_chunks
+
+_WORD_STR = re.compile(r"\S+")
+_WORD_BYTES = re.compile(rb"\S+")
+
+
+# 1. Splitting Text That Is Already in Memory (or Memory-Mapped)
+def iter_split(data, sep=None, maxsplit=-1):
+    text = isinstance(data, str)
+    view = data if text else memoryview(data)
+    if sep is None:
+        words = (_WORD_STR if text else _WORD_BYTES).finditer(data)
+        for count, word in enumerate(words):
+            if count == maxsplit:
+                yield view[word.start():]
+                return
+            yield view[word.start():word.end()]
+        return
+    if isinstance(sep, re.Pattern):
+        separators = ((found.start(), found.end()) for found in sep.finditer(data))
+    elif not sep:
+        raise ValueError("empty separator")
+    elif hasattr(data, "find"):  # str, bytes, bytearray and mmap search in C
+        separators = _find_all(data, sep)
+    else:
+        separators = ((found.start(), found.end()) for found in re.finditer(re.escape(sep), data))
+    position = 0
+    for count, (start, end) in enumerate(separators):
+        if count == maxsplit:
+            break
+        yield view[position:start]
+        position = end
+    yield view[position:]
+
+
+def _find_all(data, sep):
+    start = data.find(sep)
+    while start != -1:
+        yield start, start + len(sep)
+        start = data.find(sep, start + len(sep))
+
+
+# 2. Splitting Text That Arrives in Chunks
+# Parts are copies here, because each chunk is only kept until its parts have been yielded. The unfinished last
+# part is kept as a list of pieces and joined once, when it is finished, so a long part costs O(its length).
+def iter_split_chunks(chunks, sep=None):
+    if sep is not None and not isinstance(sep, re.Pattern) and not sep:
+        raise ValueError("empty separator")
+    chunks = (chunk.tobytes() if isinstance(chunk, memoryview) else chunk for chunk in chunks)
+    if sep is None:
+        return _split_words(chunks)
+    if isinstance(sep, re.Pattern):
+        return _split_pattern_chunks(chunks, sep)
+    return _split_plain_chunks(chunks, sep)
+
+
+# Whitespace is one character at a time, so each chunk is split on its own; a word continues into the next
+# chunk when the chunk does not end with whitespace.
+def _split_words(chunks):
+    pending = []
+    for chunk in chunks:
+        words = chunk.split()
+        if not words:
+            if chunk and pending:
+                yield chunk[:0].join(pending)
+                pending = []
+            continue
+        if pending:
+            if chunk[:1].isspace():
+                yield chunk[:0].join(pending)
+            else:
+                pending.append(words[0])
+                if len(words) == 1 and not chunk[-1:].isspace():
+                    continue  # The chunk is all one word, which still goes on.
+                words[0] = chunk[:0].join(pending)
+            pending = []
+        if not chunk[-1:].isspace():
+            pending.append(words.pop())
+        yield from words
+    if pending:
+        yield pending[0][:0].join(pending)
+
+
+# Only the last len(sep) - 1 characters of the unfinished part (the tail) are searched again together with the
+# next chunk, because a separator crossing the boundary starts at the earliest there.
+def _split_plain_chunks(chunks, sep):
+    empty = sep[:0]
+    keep = len(sep) - 1
+    pending = []
+    tail = empty
+    for chunk in chunks:
+        window = tail + chunk
+        found = window.find(sep)
+        if found == -1:
+            pending.append(chunk)
+            tail = window[-keep:] if keep else empty
+            continue
+        part = empty.join(pending)
+        if found < len(tail):  # The separator started in the previous chunk.
+            part = part[:len(part) - (len(tail) - found)]
+        else:
+            part += window[len(tail):found]
+        yield part
+        parts, rest = _split_plain(window, sep, found + len(sep))
+        yield from parts
+        pending = [rest]
+        tail = rest[-keep:] if keep else empty
+    yield empty.join(pending)
+
+
+# Returns the parts between the separators found from position on, and the unfinished rest of buffer.
+def _split_plain(buffer, sep, position):
+    parts = []
+    found = buffer.find(sep, position)
+    while found != -1:
+        parts.append(buffer[position:found])
+        position = found + len(sep)
+        found = buffer.find(sep, position)
+    return parts, buffer[position:]
+
+
+# A match touching the end of the buffer might continue in the next chunk, so it waits for that chunk.
+# A match can depend on text further ahead, so the unfinished part is searched again with every chunk.
+# after_empty records that the last split was an empty match where buffer starts, which must not split twice.
+def _split_pattern_chunks(chunks, sep):
+    buffer = sep.pattern[:0]
+    after_empty = False
+    for chunk in chunks:
+        buffer += chunk
+        parts, buffer, after_empty = _split_pattern(buffer, sep, after_empty, final=False)
+        yield from parts
+    parts, buffer, _ = _split_pattern(buffer, sep, after_empty, final=True)
+    yield from parts
+    yield buffer
+
+
+# Like re.split(), the text of capturing groups is yielded between the parts.
+def _split_pattern(buffer, pattern, after_empty, final):
+    parts = []
+    position = 0
+    for found in pattern.finditer(buffer):
+        start, end = found.span()
+        if after_empty and end == 0:
+            continue
+        if end == len(buffer) and not final:
+            break
+        parts.append(buffer[position:start])
+        parts.extend(found.groups())
+        position = end
+        after_empty = start == end
+    return parts, buffer[position:], after_empty
+
+
+def split_file(file, sep=None, chunk_size=CHUNK_SIZE):
+    return iter_split_chunks(read_chunks(file, chunk_size), sep)
+
+
+# Example usage of the lazy splitters (same data as StringOperations.py):
+if __name__ == "__main__":
+    import io
+    import mmap
+    import tempfile
+
+    my_string = "Hello, World!"
+    print(list(iter_split(my_string)), list(iter_split(my_string, ",")))  # Output: ['Hello,', 'World!'] ['Hello', ' World!']
+    print(list(iter_split("a, b,c ;d", re.compile(r"\s*[,;]\s*"))))  # Output: ['a', 'b', 'c', 'd']
+    print(list(iter_split("one::two::three", "::", maxsplit=1)))  # Output: ['one', 'two::three']
+
+    # Bytes give memoryview parts that share the original buffer
+    parts = list(iter_split(b"10,20,30", b","))
+    print(type(parts[0]).__name__, [bytes(part) for part in parts])  # Output: memoryview [b'10', b'20', b'30']
+
+    # A separator split across two chunks is still found
+    print(list(iter_split_chunks(["Hello,", " World!  Welcome", " to Python!"], ", ")))  # Output: ['Hello', 'World!  Welcome to Python!']
+    print(list(split_file(io.StringIO("Python is fun"), chunk_size=4)))  # Output: ['Python', 'is', 'fun']
+
+    # Splitting a memory-mapped file without reading it into memory
+    with tempfile.TemporaryFile() as f:
+        f.write(b"\n".join(b"row %d" % i for i in range(100_000)))
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            rows = sum(1 for row in iter_split(mapped, b"\n") if row[:3] == b"row")
+            print(rows)  # Output: 100000
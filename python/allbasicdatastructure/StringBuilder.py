@@ -0,0 +1,208 @@
+# Filename: StringBuilder.py
+
+'''
+String Builder: Strings are immutable, so text = text + part copies everything built so far on every step. In a loop that is quadratic. A StringBuilder collects the parts in a list and joins them once, at the end, with "".join().
+
+File-Like Writing: A StringBuilder has write(), so it can be passed to print(..., file=builder) or anything else that writes to a file.
+
+Repetition: builder.repeat(2) repeats the collected parts without copying any text until the final join.
+
+String Views: StrView(text)[0:5] or StrView(text)[::-1] does not copy any characters. A view only remembers the original string and a range of positions, and slicing a view gives another view. Characters are copied once, when str(view) is called.
+
+Searching Views: 'in', find(), count(), startswith() and endswith() on a view with step 1 search the original string between the view's bounds, without copying it.
+'''
+
+
+# 1. The String Builder
+class StringBuilder:
+    __slots__ = ("_parts", "_length")
+
+    def __init__(self, *parts):
+        self._parts = []
+        self._length = 0
+        self.extend(parts)
+
+    def append(self, text):
+        if not isinstance(text, (str, StrView)):
+            raise TypeError(f"can only append str or StrView, not {type(text).__name__}")
+        self._parts.append(text)
+        self._length += len(text)
+        return self
+
+    def extend(self, texts):
+        for text in texts:
+            self.append(text)
+        return self
+
+    def __iadd__(self, text):
+        return self.append(text)
+
+    # Like a file opened for writing.
+    def write(self, text):
+        self.append(text)
+        return len(text)
+
+    # The list of parts is repeated, not the text.
+    def repeat(self, count):
+        self._parts *= max(count, 0)
+        self._length *= max(count, 0)
+        return self
+
+    def __len__(self):
+        return self._length
+
+    def clear(self):
+        self._parts.clear()
+        self._length = 0
+
+    # Joins all parts once. The result replaces the parts, so building again (or appending more) stays cheap.
+    def build(self):
+        parts = self._parts
+        if len(parts) == 1 and type(parts[0]) is str:
+            return parts[0]
+        text = "".join([part if type(part) is str else str(part) for part in parts])
+        self._parts = [text] if text else []
+        return text
+
+    __str__ = build
+
+    def __repr__(self):
+        return f"StringBuilder({self.build()!r})"
+
+
+# 2. String Views
+# The positions of a view are kept as a range; range[slice] composes slices without touching the text.
+class StrView:
+    __slots__ = ("_source", "_range")
+
+    def __init__(self, source, start=None, stop=None, step=None):
+        if isinstance(source, StrView):
+            self._source = source._source
+            self._range = source._range[start:stop:step]
+        else:
+            self._source = source
+            self._range = range(len(source))[start:stop:step]
+
+    @classmethod
+    def _from_range(cls, source, positions):
+        view = cls.__new__(cls)
+        view._source = source
+        view._range = positions
+        return view
+
+    def __len__(self):
+        return len(self._range)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return StrView._from_range(self._source, self._range[index])
+        return self._source[self._range[index]]
+
+    def __iter__(self):
+        return map(self._source.__getitem__, self._range)
+
+    def reversed(self):
+        return StrView._from_range(self._source, self._range[::-1])
+
+    # Bounds of a step-1 view in the original string, or None for strided, reversed or empty views.
+    def _bounds(self):
+        positions = self._range
+        if not positions:
+            return None
+        if positions.step == 1 or len(positions) == 1:
+            return positions.start, positions.start + len(positions)
+        return None
+
+    # Copies the characters, once.
+    def __str__(self):
+        positions = self._range
+        if not positions:
+            return ""
+        stop = positions[-1] + positions.step
+        return self._source[positions.start:stop if stop >= 0 else None:positions.step]
+
+    def __repr__(self):
+        return f"StrView({str(self)!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, (str, StrView)):
+            return len(self) == len(other) and str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __add__(self, other):
+        if isinstance(other, (str, StrView)):
+            return StringBuilder(self, other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, (str, StrView)):
+            return StringBuilder(other, self)
+        return NotImplemented
+
+    # 3. Searching Without Copying
+    # start and end are relative to the view and handled like str.find() does (start is not clipped to the length).
+    @staticmethod
+    def _search_range(bounds, start, end):
+        first, last = bounds
+        length = last - first
+        start = 0 if start is None else max(start + length, 0) if start < 0 else start
+        end = length if end is None else max(end + length, 0) if end < 0 else min(end, length)
+        return first, start, end
+
+    def find(self, sub, start=None, end=None):
+        bounds = self._bounds()
+        if bounds is None:
+            return str(self).find(sub, start, end)
+        first, start, end = self._search_range(bounds, start, end)
+        found = self._source.find(sub, first + start, first + end)
+        return found if found == -1 else found - first
+
+    def __contains__(self, sub):
+        return self.find(sub) != -1
+
+    def count(self, sub, start=None, end=None):
+        bounds = self._bounds()
+        if bounds is None:
+            return str(self).count(sub, start, end)
+        first, start, end = self._search_range(bounds, start, end)
+        return self._source.count(sub, first + start, first + end)
+
+    def startswith(self, prefix):
+        bounds = self._bounds()
+        if bounds is None:
+            return str(self).startswith(prefix)
+        return self._source.startswith(prefix, *bounds)
+
+    def endswith(self, suffix):
+        bounds = self._bounds()
+        if bounds is None:
+            return str(self).endswith(suffix)
+        return self._source.endswith(suffix, *bounds)
+
+
+# Example usage of the builder and views (same data as StringOperations.py):
+if __name__ == "__main__":
+    my_string = "Hello, World!"
+
+    # Concatenation and repetition without intermediate strings
+    builder = StringBuilder(my_string)
+    builder += " Welcome to Python!"
+    print(builder.build())  # Output: Hello, World! Welcome to Python!
+    print(StringBuilder(my_string).repeat(2))  # Output: Hello, World!Hello, World!
+
+    # Slicing and reversing without copying
+    view = StrView(my_string)
+    sub_string = view[0:5]
+    reversed_string = view[::-1]
+    print(str(sub_string), str(reversed_string), str(reversed_string[1:6]))  # Output: Hello !dlroW ,olleH dlroW
+    print("World" in view[7:], view[7:].find("l"), sub_string.count("l"), sub_string.endswith("lo"))  # Output: True 3 2 True
+
+    # Log assembly: one join instead of a copy per line
+    log = StringBuilder()
+    for i in range(100_000):
+        print("request", i, "ok", file=log)
+    text = log.build()
+    print(len(text), text.count("\n"))  # Output: 1688890 100000
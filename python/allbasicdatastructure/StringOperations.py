@@ -113,6 +113,46 @@ is_digit = numeric_string.isdigit()  # Returns True
 alphanumeric_string = "Hello123"
 is_alnum = alphanumeric_string.isalnum()  # Returns True
 
+# 19. Building Strings and Slicing Without Copies (see StringBuilder.py)
+# A StringBuilder joins all parts once instead of copying on every +; a StrView slices or reverses without copying.
+from StringBuilder import StringBuilder, StrView
+
+builder = StringBuilder(my_string)
+builder += another_string
+built_string = builder.build()  # One join. Result: "Hello, World! Welcome to Python!"
+reversed_view = StrView(my_string)[::-1]  # No characters copied yet
+reversed_from_view = str(reversed_view)  # Copied once. Result: "!dlroW ,olleH"
+
+# 20. Searching for Many Patterns at Once (see MultiPatternSearch.py)
+# A MultiPatternMatcher finds, counts and replaces several substrings in one scan of the text.
+from MultiPatternSearch import MultiPatternMatcher
+
+matcher = MultiPatternMatcher(["World", "Hello"])
+pattern_counts = dict(matcher.count(my_string))  # One scan. Result: {'World': 1, 'Hello': 1}
+multi_replaced = matcher.replace(my_string, {"World": "Python", "Hello": "Hi"})  # Result: "Hi, Python!"
+
+# 21. Splitting Lazily (see StreamingSplit.py)
+# iter_split() yields the parts one at a time instead of building a list; bytes and mmap input give zero-copy memoryview parts.
+from StreamingSplit import iter_split
+
+first_word = next(iter_split(my_string))  # Stops after the first part. Result: 'Hello,'
+byte_parts = [bytes(part) for part in iter_split(my_string.encode(), b", ")]  # Result: [b'Hello', b'World!']
+
+# 22. Compiled Templates (see TemplateFormatter.py)
+# A template is parsed once and cached; render_many() formats a whole batch of rows in one call.
+from TemplateFormatter import render, render_many
+
+rendered_string = render("My name is {} and I am {} years old.", name, age)  # Result: "My name is Alice and I am 30 years old."
+rendered_rows = render_many("{} is {}", [(name, age), ("Bob", 25)])  # Result: ['Alice is 30', 'Bob is 25']
+
+# 23. Checking and Converting Many Strings at Once (see StringColumn.py)
+# A StringColumn keeps all strings in one buffer; isdigit(), upper(), strip() and friends run on the whole column.
+from StringColumn import StringColumn
+
+string_column = StringColumn([numeric_string, alphanumeric_string, whitespace_string])
+column_is_digit = string_column.isdigit()  # Result: [True, False, False]
+column_stripped_upper = string_column.strip().upper().to_list()  # Result: ['12345', 'HELLO123', 'HELLO, WORLD!']
+
 # Example string printout after operations:
 print(f"Original string: {my_string}")
 print(f"First character: {first_char}")
@@ -135,4 +175,14 @@ print(f"Ends with '!': {ends_with_exclamation}")
 print(f"Formatted string: {formatted_string}")
 print(f"Reversed string: {reversed_string}")
 print(f"Is numeric: {is_digit}")
-print(f"Is alphanumeric: {is_alnum}")
\ No newline at end of file
+print(f"Is alphanumeric: {is_alnum}")
+print(f"Built string: {built_string}")
+print(f"Reversed string (view): {reversed_from_view}")
+print(f"Pattern counts: {pattern_counts}")
+print(f"Replaced patterns: {multi_replaced}")
+print(f"First word (lazy split): {first_word}")
+print(f"Byte parts: {byte_parts}")
+print(f"Rendered string: {rendered_string}")
+print(f"Rendered rows: {rendered_rows}")
+print(f"Column is numeric: {column_is_digit}")
+print(f"Column stripped and upper-cased: {column_stripped_upper}")
\ No newline at end of file
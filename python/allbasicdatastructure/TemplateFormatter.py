@@ -0,0 +1,143 @@
+# Filename: TemplateFormatter.py
+
+'''
+Compiled Templates: "My name is {} and I am {} years old.".format(name, age) parses the template text on every call. compile_template() parses it once and turns it into a small Python function built around an f-string, which is what a hand-written f-string compiles to.
+
+Template Cache: Compiled templates are kept in an LRU cache keyed by the template text (functools.lru_cache), so render(template, ...) only compiles a template the first time it sees it. compile_template.cache_info() shows the hits and misses.
+
+Batch Rendering: render_many(template, rows) formats a whole list of rows in one call; the loop over the rows runs inside the compiled function. A row is a tuple (or list) for positional fields like {} and {0}, or a dictionary for named fields like {name}.
+
+Same Rules as str.format(): Automatic ({}) and manual ({0}) numbering, attributes ({0.real}), indexes ({0[1]}, {user[name]}), conversions (!r, !s, !a) and format specs ({:>10}, {:.2f}) work as with str.format(). Templates with nested fields inside a format spec ({:{width}}) are not compiled and simply use str.format().
+'''
+
+import _string  # The field-name parser used by string.Formatter
+from collections.abc import Mapping
+from functools import lru_cache
+from string import Formatter
+
+TEMPLATE_CACHE_SIZE = 256
+
+# Characters a format spec may not contain to be written directly into the generated f-string.
+_UNSAFE_SPEC_CHARACTERS = set("'\"\\{}\n\r")
+
+
+# 1. Generating the Renderer
+# Returns the lines that compute v0, v1, ... and the f-string that joins them, or None when the template
+# has to be left to str.format(). Numbered fields are read from positional, named fields from named:
+# "{0.real}" -> "getattr(args[0], 'real')", "{user[name]}" -> "kwargs['user']['name']".
+def _generate(template, positional, named):
+    numbering = None
+    next_number = 0
+    assignments = []
+    pieces = []
+    constants = {}
+    for literal, field_name, spec, conversion in Formatter().parse(template):
+        if literal:
+            pieces.append(repr(literal))
+        if field_name is None:
+            continue
+        if "{" in spec:
+            return None
+        if conversion not in (None, "r", "s", "a"):
+            raise ValueError(f"Unknown conversion specifier {conversion}")
+        first, rest = _string.formatter_field_name_split(field_name)
+        if first == "":
+            if numbering == "manual":
+                raise ValueError("cannot switch from manual field specification to automatic field numbering")
+            numbering = "automatic"
+            first = next_number
+            next_number += 1
+        elif isinstance(first, int):
+            if numbering == "automatic":
+                raise ValueError("cannot switch from automatic field numbering to manual field specification")
+            numbering = "manual"
+        expression = f"{positional}[{first}]" if isinstance(first, int) else f"{named}[{first!r}]"
+        for is_attribute, name in rest:
+            expression = f"getattr({expression}, {name!r})" if is_attribute else f"{expression}[{name!r}]"
+        variable = f"v{len(assignments)}"
+        assignments.append(f"{variable} = {expression}")
+        field = variable + (f"!{conversion}" if conversion else "")
+        if spec and _UNSAFE_SPEC_CHARACTERS.intersection(spec):
+            # Passed in as a constant instead of being written into the source.
+            constant = f"s{len(constants)}"
+            constants[constant] = spec
+            field += ":{" + constant + "}"
+        elif spec:
+            field += ":" + spec
+        pieces.append("f'{" + field + "}'")
+    return assignments, " ".join(pieces) or "''", constants
+
+
+class CompiledTemplate:
+    __slots__ = ("template", "_render", "_render_many")
+
+    def __init__(self, template):
+        self.template = template
+        generated = _generate(template, "args", "kwargs")
+        if generated is None:
+            self._render = lambda args, kwargs: template.format(*args, **kwargs)
+            self._render_many = lambda rows: [
+                template.format_map(row) if isinstance(row, Mapping) else template.format(*row) for row in rows
+            ]
+            return
+        assignments, joined, constants = generated
+        lines = ["def render(args, kwargs):"]
+        lines += [f"    {line}" for line in assignments]
+        lines.append(f"    return {joined}")
+        # For many rows, each row is the tuple or the dictionary the fields are read from.
+        row_assignments, row_joined, _ = _generate(template, "row", "row")
+        lines.append("def render_many(rows):")
+        lines.append("    result = []")
+        lines.append("    append = result.append")
+        lines.append("    for row in rows:")
+        lines += [f"        {line}" for line in row_assignments]
+        lines.append(f"        append({row_joined})")
+        lines.append("    return result")
+        namespace = dict(constants)
+        exec("\n".join(lines), namespace)
+        self._render = namespace["render"]
+        self._render_many = namespace["render_many"]
+
+    def render(self, *args, **kwargs):
+        return self._render(args, kwargs)
+
+    __call__ = render
+
+    def render_many(self, rows):
+        return self._render_many(rows)
+
+    def __repr__(self):
+        return f"CompiledTemplate({self.template!r})"
+
+
+# 2. The Cache and the Shortcuts
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(template):
+    return CompiledTemplate(template)
+
+
+def render(template, *args, **kwargs):
+    return compile_template(template)._render(args, kwargs)
+
+
+def render_many(template, rows):
+    return compile_template(template)._render_many(rows)
+
+
+# Example usage of the template formatter (same data as StringOperations.py):
+if __name__ == "__main__":
+    name = "Alice"
+    age = 30
+    print(render("My name is {} and I am {} years old.", name, age))  # Output: My name is Alice and I am 30 years old.
+    print(render("My name is {name} and I am {age} years old.", name=name, age=age))  # Output: My name is Alice and I am 30 years old.
+
+    # Format specs, conversions, attributes and indexes work as with str.format()
+    print(render("{0!r:>8}|{1.real:.2f}|{2[0]}", name, 2.5, (7, 8)))  # Output:  'Alice'|2.50|7
+
+    # Many rows in one call, the template is parsed once
+    rows = [("Alice", 30), ("Bob", 25)]
+    print(render_many("{} is {} years old", rows))  # Output: ['Alice is 30 years old', 'Bob is 25 years old']
+    print(render_many("{name:<6}{age:>3}", [{"name": "Carol", "age": 41}]))  # Output: ['Carol  41']
+
+    report = render_many("row {:>7} total {:.2f}", ((i, i * 1.5) for i in range(1_000_000)))
+    print(report[-1], compile_template.cache_info().misses)  # Output: row  999999 total 1499998.50 6
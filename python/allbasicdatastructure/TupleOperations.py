@@ -94,6 +94,28 @@ max_value = max(my_tuple)  # Result: 5
 # You can't sort a tuple directly since it's immutable, but you can convert it to a list, sort it, and then convert it back to a tuple.
 sorted_tuple = tuple(sorted(my_tuple))  # Result: (1, 2, 3, 4, 5)
 
+# 16. Indexed Tuples for Repeated Lookups (see IndexedSequence.py)
+# An IndexedTuple builds a value -> positions index once, so 'in', index() and count() no longer scan the tuple.
+from IndexedSequence import IndexedTuple
+
+indexed_tuple = IndexedTuple(my_tuple)  # Still a tuple: (1, 2, 3, 4, 5)
+indexed_index_of_four = indexed_tuple.index(4)  # Dictionary lookup. Result: 3
+
+# 17. Statistics and Top-k Without Sorting (see TupleStatistics.py)
+# summarize() finds min, max, count, sum and mean in one pass; top_k() and nth_element() avoid a full sort.
+from TupleStatistics import summarize, top_k, nth_element
+
+tuple_summary = summarize(my_tuple)  # One pass. Result: Summary(count=5, total=15, minimum=1, maximum=5, mean=3.0)
+largest_two = top_k(my_tuple, 2)  # Heap of size 2. Result: (5, 4)
+median_value = nth_element(my_tuple, len(my_tuple) // 2)  # Quickselect. Result: 3
+
+# 18. Interned (Hash-Consed) Tuples (see InternedTuples.py)
+# Equal tuples, nested ones included, are stored once and shared; comparing two of them is an identity check.
+from InternedTuples import intern_tuple
+
+interned_nested = intern_tuple(nested_tuple)
+shared_nested = intern_tuple((1, 2, (3, 4), (5, 6))) is interned_nested  # Same object. Result: True
+
 # Example tuple printout after operations:
 print(f"Original tuple: {my_tuple}")
 print(f"Subtuple (1:4): {sub_tuple}")
@@ -109,4 +131,9 @@ print(f"Modified list from tuple: {tuple_as_list}")
 print(f"New tuple from list: {new_tuple}")
 print(f"Minimum value: {min_value}")
 print(f"Maximum value: {max_value}")
+print(f"Index of 4 (indexed tuple): {indexed_index_of_four}")
+print(f"Summary: {tuple_summary}")
+print(f"Two largest values: {largest_two}")
+print(f"Median value: {median_value}")
+print(f"Interned nested tuple is shared: {shared_nested}")
 print(f"Sorted tuple: {sorted_tuple}")
\ No newline at end of file
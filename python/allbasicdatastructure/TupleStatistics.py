@@ -0,0 +1,114 @@
+# Filename: TupleStatistics.py
+
+'''
+Single-Pass Summary: summarize() computes count, sum, min, max and mean in one scan, instead of one pass each for len(), sum(), min() and max().
+
+Top-k: top_k(data, k) returns the k largest items and nsmallest(data, k) the k smallest, sorted. A heap of size k is used, so this costs O(n log k) instead of the O(n log n) of sorting everything.
+
+Quickselect: nth_element(data, n) returns the item that would be at position n after sorting, in O(n) on average, without sorting. NaN has no sorted position, so it raises ValueError.
+
+Partial Sort: partial_sort(data, k) returns a tuple whose first k items are the k smallest in order; the rest follow in no particular order.
+
+Any Iterable: All functions accept tuples, lists or generators; top_k, nsmallest, nth_element and partial_sort also accept key= like sorted().
+'''
+
+import heapq
+import random
+from collections import namedtuple
+
+Summary = namedtuple("Summary", ["count", "total", "minimum", "maximum", "mean"])
+
+
+# 1. Count, Sum, Min, Max and Mean in One Pass
+def summarize(data):
+    iterator = iter(data)
+    for first in iterator:
+        break
+    else:
+        raise ValueError("summarize() arg is an empty iterable")
+    count, total, minimum, maximum = 1, first, first, first
+    for value in iterator:
+        count += 1
+        total += value
+        if value < minimum:
+            minimum = value
+        elif value > maximum:
+            maximum = value
+    return Summary(count, total, minimum, maximum, total / count)
+
+
+# 2. Top-k With a Heap
+def top_k(data, k, key=None):
+    return tuple(heapq.nlargest(k, data, key=key))
+
+
+def nsmallest(data, k, key=None):
+    return tuple(heapq.nsmallest(k, data, key=key))
+
+
+# 3. Quickselect
+# Three-way partitioning around a random pivot; only the part that contains position n is kept.
+def nth_element(data, n, key=None):
+    items = list(data)
+    if n < 0:
+        n += len(items)
+    if not 0 <= n < len(items):
+        raise IndexError("nth_element index out of range")
+    if key is None:
+        keyed = items
+        values = items
+    else:
+        keyed = [(key(item), i) for i, item in enumerate(items)]
+        values = [value for value, _ in keyed]
+    # NaN is neither smaller than, equal to nor larger than anything, so it has no position in sorted order.
+    if any(value != value for value in values):
+        raise ValueError("nth_element() cannot order NaN values")
+    while True:
+        if not keyed:  # Only a comparison that is not a total order gets here.
+            raise ValueError("nth_element() needs values that are totally ordered")
+        pivot = keyed[random.randrange(len(keyed))]
+        smaller = [x for x in keyed if x < pivot]
+        if n < len(smaller):
+            keyed = smaller
+            continue
+        equal_count = sum(1 for x in keyed if x == pivot)
+        if n < len(smaller) + equal_count:
+            return pivot if key is None else items[pivot[1]]
+        n -= len(smaller) + equal_count
+        keyed = [x for x in keyed if pivot < x]
+
+
+# 4. Partial Sort
+# The k smallest come first in sorted order, followed by the remaining items.
+def partial_sort(data, k, key=None):
+    items = list(data)
+    if k >= len(items):
+        return tuple(sorted(items, key=key))
+    indexed = ((item if key is None else key(item), i) for i, item in enumerate(items))
+    chosen = heapq.nsmallest(k, indexed)
+    chosen_positions = {i for _, i in chosen}
+    head = [items[i] for _, i in chosen]
+    tail = (item for i, item in enumerate(items) if i not in chosen_positions)
+    return tuple(head) + tuple(tail)
+
+
+# Example usage of the tuple statistics (same data as TupleOperations.py):
+if __name__ == "__main__":
+    my_tuple = (1, 2, 3, 4, 5)
+    print(summarize(my_tuple))  # Output: Summary(count=5, total=15, minimum=1, maximum=5, mean=3.0)
+
+    print(top_k(my_tuple, 2), nsmallest(my_tuple, 2))  # Output: (5, 4) (1, 2)
+    print(nth_element(my_tuple, 2), nth_element((5, 1, 4, 2, 3), -1))  # Output: 3 5
+
+    words = ("banana", "kiwi", "apple", "fig")
+    print(top_k(words, 1, key=len), nth_element(words, 0, key=len))  # Output: ('banana',) fig
+    print(partial_sort((9, 3, 7, 1, 5), 2))  # Output: (1, 3, 9, 7, 5)
+
+    try:
+        nth_element((3.0, float("nan"), 1.0), 1)
+    except ValueError as error:
+        print(error)  # Output: nth_element() cannot order NaN values
+
+    # The median of a million values without sorting them
+    big = tuple(random.random() for _ in range(1_000_001))
+    print(nth_element(big, 500_000) == sorted(big)[500_000])  # Output: True
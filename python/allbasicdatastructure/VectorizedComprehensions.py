@@ -0,0 +1,192 @@
+# Filename: VectorizedComprehensions.py
+
+'''
+Array Backend: The numeric comprehensions from Comprehensions.py (squares, even_numbers, squares_dict, cube_dict, squares_set) computed with NumPy vectorized operations.
+
+Vectorized Operations: np.arange() replaces range(), ** works on the whole array at once, boolean masks replace the 'if' clause and np.unique() replaces the set.
+
+Compact Buffers: NumPy results are stored in one contiguous int64 buffer (8 bytes per value) instead of a list of boxed Python ints.
+
+Fallback Switch: NumPy is optional. Pass backend="python" (or set USE_NUMPY = False) to use the plain comprehensions; they are also used automatically when NumPy is not installed.
+
+Overflow Guard: Narrow inputs (array('h'), int8, float32, ...) are widened to int64 or float64 first. int64 can only hold values up to 2**63 - 1, larger results fall back to Python ints so the answers never silently wrap around.
+
+Number Sequences: squares() and even_numbers() also take a sequence of numbers (a list, an array.array or a NumPy array, floats included) instead of n, like [x**2 for x in values].
+
+Parity Check: check_parity() compares both backends on the same input; test_parity() asserts that both backends match the plain comprehensions, including empty input, floats, NaN, infinity, int64 overflow and narrow types like array('h') or int8.
+'''
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python comprehensions still work.
+    np = None
+
+USE_NUMPY = True
+
+PYTHON = "python"
+NUMPY = "numpy"
+
+_INT64_MAX = 2 ** 63 - 1
+
+
+# 1. Choosing a Backend
+# backend=None means "NumPy if it is installed and USE_NUMPY is True".
+# n is a count (range(n), as in Comprehensions.py) or a sequence of numbers.
+def _use_numpy(backend, n, exponent=1):
+    if backend is None:
+        backend = NUMPY if USE_NUMPY and np is not None else PYTHON
+    if backend == PYTHON:
+        return False
+    if backend != NUMPY:
+        raise ValueError(f"unknown backend: {backend!r}")
+    if np is None:
+        raise ImportError("the numpy backend requires NumPy to be installed")
+    if not isinstance(n, int):
+        return _fits(_numpy_values(n), exponent)
+    # The biggest value produced is (n - 1) ** exponent, it has to fit in int64.
+    return n <= 0 or (n - 1) ** exponent <= _INT64_MAX
+
+
+# Ints must stay within int64 and finite floats must not overflow, where Python would raise OverflowError
+# instead of returning inf. Anything else (for example ints too big for int64) stays in Python.
+def _fits(values, exponent):
+    if values.size == 0:
+        return True
+    if values.dtype.kind in "iu":
+        return max(-int(values.min()), int(values.max())) ** exponent <= _INT64_MAX
+    if values.dtype.kind != "f":
+        return False
+    finite = values[np.isfinite(values)]
+    try:
+        return finite.size == 0 or float(np.abs(finite).max()) ** exponent < float("inf")
+    except OverflowError:
+        return False
+
+
+# A NumPy array is turned into Python numbers too, so narrow types like uint8 don't wrap around here either.
+def _python_values(n):
+    return range(n) if isinstance(n, int) else _as_python(n)
+
+
+# Narrow types (array('h'), int8, float32, ...) are widened to int64 or float64 first, like Python numbers
+# they must not wrap around or overflow where Python would not. _fits() then checks the int64 range.
+def _numpy_values(n):
+    if isinstance(n, int):
+        return np.arange(n, dtype=np.int64)
+    values = np.asarray(n)
+    if values.dtype.kind in "iu":
+        return values.astype(np.int64, copy=False) if values.size == 0 or values.max() <= _INT64_MAX else values
+    if values.dtype.kind == "f":
+        return values.astype(np.float64, copy=False)
+    return values
+
+
+# 2. List Comprehensions
+# squares = [x**2 for x in range(n)]
+def squares(n, backend=None):
+    if _use_numpy(backend, n, 2):
+        return _numpy_values(n) ** 2
+    return [x**2 for x in _python_values(n)]
+
+
+# even_numbers = [x for x in range(n) if x % 2 == 0]; NaN and infinity are not even, as in Python.
+def even_numbers(n, backend=None):
+    if _use_numpy(backend, n):
+        values = _numpy_values(n)
+        with np.errstate(invalid="ignore"):
+            return values[values % 2 == 0]
+    return [x for x in _python_values(n) if x % 2 == 0]
+
+
+# 3. Dictionary Comprehensions
+# A dict has to hold Python objects, so the values are computed vectorized and then zipped in one step.
+def power_dict(n, exponent, backend=None):
+    if _use_numpy(backend, n, exponent):
+        keys = np.arange(n, dtype=np.int64)
+        return dict(zip(keys.tolist(), (keys ** exponent).tolist()))
+    return {x: x**exponent for x in range(n)}
+
+
+# squares_dict = {x: x**2 for x in range(n)}
+def squares_dict(n, backend=None):
+    return power_dict(n, 2, backend)
+
+
+# cube_dict = {x: x**3 for x in range(n)}
+def cube_dict(n, backend=None):
+    return power_dict(n, 3, backend)
+
+
+# 4. Set Comprehensions
+# squares_set = {x**2 for x in range(n)}; the NumPy version is a sorted array of unique values.
+def squares_set(n, backend=None):
+    if _use_numpy(backend, n, 2):
+        return np.unique(np.arange(n, dtype=np.int64) ** 2)
+    return {x**2 for x in range(n)}
+
+
+# 5. Parity Check
+# Converts both results to plain Python containers and compares them.
+def _as_python(value):
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    return value
+
+
+def check_parity(n):
+    if np is None:
+        return True
+    return (_as_python(squares(n, NUMPY)) == squares(n, PYTHON)
+            and _as_python(even_numbers(n, NUMPY)) == even_numbers(n, PYTHON)
+            and squares_dict(n, NUMPY) == squares_dict(n, PYTHON)
+            and cube_dict(n, NUMPY) == cube_dict(n, PYTHON)
+            and set(_as_python(squares_set(n, NUMPY))) == squares_set(n, PYTHON))
+
+
+# 6. Parity Tests
+# NaN never equals itself, so two results match when every pair of values is equal or both are NaN.
+def _same(a, b):
+    return len(a) == len(b) and all(x == y or (x != x and y != y) for x, y in zip(a, b))
+
+
+def test_parity():
+    backends = (PYTHON, NUMPY) if np is not None else (PYTHON,)
+    nan, inf = float("nan"), float("inf")
+    cases = [0, 1, 2, 5, 1000, [], [1.5, -2.0, 4.0, 3.0], [nan, 2.0, inf, -inf, -0.0, -3.5], [3, -4, 2**31], [2**40, 6],
+             array("h", [300, 2]), array("i", [50000, -7]), array("b", [-100]), array("B", [200]), array("f", [1e20, 2.5])]
+    if np is not None:
+        cases += [np.array([200], dtype=np.uint8), np.array([-100, 4], dtype=np.int8),
+                  np.array([1e20, 3.0], dtype=np.float32), np.array([2**63 + 5], dtype=np.uint64)]
+    for values in cases:
+        source = _python_values(values)
+        for backend in backends:
+            assert _same(_as_python(squares(values, backend)), [x**2 for x in source]), (values, backend)
+            assert _same(_as_python(even_numbers(values, backend)), [x for x in source if x % 2 == 0]), (values, backend)
+    for n in (0, 1, 5, 1000):
+        for backend in backends:
+            assert squares_dict(n, backend) == {x: x**2 for x in range(n)}, (n, backend)
+            assert cube_dict(n, backend) == {x: x**3 for x in range(n)}, (n, backend)
+            assert set(_as_python(squares_set(n, backend))) == {x**2 for x in range(n)}, (n, backend)
+    assert all(check_parity(n) for n in (0, 1, 2, 5, 1000))
+    return True
+
+
+# Example usage of the array backend:
+if __name__ == "__main__":
+    print(_as_python(squares(5)))  # Output: [0, 1, 4, 9, 16]
+    print(_as_python(even_numbers(10)))  # Output: [0, 2, 4, 6, 8]
+    print(squares_dict(5))  # Output: {0: 0, 1: 1, 2: 4, 3: 9, 4: 16}
+    print(cube_dict(5))  # Output: {0: 0, 1: 1, 2: 8, 3: 27, 4: 64}
+    print(sorted(_as_python(squares_set(5))))  # Output: [0, 1, 4, 9, 16]
+
+    # Forcing the pure Python fallback
+    print(squares(5, backend=PYTHON))  # Output: [0, 1, 4, 9, 16]
+
+    # Both backends must agree, including the edge cases
+    print(test_parity())  # Output: True
+    print(_as_python(even_numbers([1.5, 2.0, float("nan"), 4.0])))  # Output: [2.0, 4.0]
+
+    # Cubes above 2_097_151 no longer fit in int64, so this safely uses Python ints
+    print(cube_dict(3_000_000)[2_999_999])  # Output: 26999973000008999999
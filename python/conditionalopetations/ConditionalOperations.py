@@ -125,6 +125,24 @@ i = 10
 if i > 5:
     pass  # No action is taken, but the condition is valid
 
+# 15. Conditions as Data (see RuleEngine.py)
+# An if/elif/else ladder can be written as a list of rules and compiled into a DecisionTable, which finds the
+# first matching rule with dictionary and interval lookups instead of testing every condition in turn.
+from RuleEngine import DecisionTable, Rule, Eq, Range
+
+z_rules = DecisionTable([
+    Rule([Range("z", low=10, include_low=False)], "z is greater than 10"),
+    Rule([Eq("z", 8)], "z is equal to 8"),
+], default="z is less than 10 but not 8")
+print(z_rules.evaluate(z=z))  # Same result as the ladder in section 3: 'z is equal to 8'
+
+# 16. Conditions over Columns (see VectorizedConditions.py)
+# where() is the ternary operator and select() the if/elif/else ladder for a whole column of values at once.
+from VectorizedConditions import classify_sign, positive_or_not, to_list
+
+print(to_list(classify_sign([10, 0, -5])))  # Same as check_number() for each value: ['Positive', 'Zero', 'Negative']
+print(to_list(positive_or_not([c, 0])))  # Same as the ternary in section 6: ['Positive', 'Non-Positive']
+
 # Example conditional outputs:
 print(f"x is greater than 5: {x > 5}")
 print(f"y is greater than 5: {y > 5}")
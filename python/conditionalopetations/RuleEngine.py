@@ -0,0 +1,298 @@
+# Filename: RuleEngine.py
+
+'''
+Rules as Data: An if/elif/else ladder is a list of conditions checked in order, where the first true one decides the result. A DecisionTable holds the same thing as data: a list of Rule(conditions, result) and a default for when no rule matches.
+
+Conditions: Eq(field, value), In(field, values), Range(field, low, high) and Custom(func) test one field of a record (a dictionary). All conditions of a rule must hold (and); for "or", write several rules with the same result. A str or bytes given to In() is one value, not a collection of characters.
+
+Compiled Dispatch: Instead of trying the rules one by one, the table is compiled once into indexes. Each rule is one bit of a Python int. For every field with Eq/In conditions a dictionary maps a value to the bits of the rules that accept it (hash dispatch). For every field with Range conditions the sorted range boundaries cut the number line into elementary intervals, and each interval knows the bits of the rules whose ranges cover it; bisect finds the interval of a value. A record's candidate rules are the bitwise & of these masks, and the lowest remaining bit is the first matching rule.
+
+Selectivity Ordering: The field indexes are checked in the order that removes the most rules first, and the check stops as soon as no candidate is left. calibrate(records) measures that order on sample records; evaluate_many() does it automatically on the first records of a batch.
+
+Custom Conditions: Custom(func) conditions can't be indexed; they are only called for rules that passed all indexed conditions. Custom(func, field) gets None when the record has no such field.
+
+First Match Wins: The result is always the same as checking the rules in order with Rule.matches(record). Values the indexes can't place (NaN, unhashable values, values of another type than the range boundaries) are evaluated with that plain ladder.
+'''
+
+from bisect import bisect_left
+from collections import namedtuple
+from numbers import Real
+from itertools import chain, islice
+
+_MISSING = object()
+
+# How many records evaluate_many() uses to measure the selectivity of each field index.
+CALIBRATION_SIZE = 1000
+
+Eq = namedtuple("Eq", ["field", "value"])
+In = namedtuple("In", ["field", "values"])
+Range = namedtuple("Range", ["field", "low", "high", "include_low", "include_high"], defaults=(None, None, True, False))
+Custom = namedtuple("Custom", ["func", "field"], defaults=(None,))
+
+
+# 1. Checking Conditions One by One
+# In("country", "US") means the value "US", not the letters "U" and "S".
+def _in_values(values):
+    return (values,) if isinstance(values, (str, bytes)) else values
+
+
+def _test(condition, record):
+    if isinstance(condition, Custom):
+        return bool(condition.func(record if condition.field is None else record.get(condition.field)))
+    value = record.get(condition.field, _MISSING)
+    if value is _MISSING:
+        return False
+    if isinstance(condition, Eq):
+        return value == condition.value
+    if isinstance(condition, In):
+        return value in _in_values(condition.values)
+    try:
+        if condition.low is not None and not (value >= condition.low if condition.include_low else value > condition.low):
+            return False
+        return condition.high is None or (value <= condition.high if condition.include_high else value < condition.high)
+    except TypeError:
+        return False
+
+
+class Rule(namedtuple("Rule", ["conditions", "result"])):
+    __slots__ = ()
+
+    def matches(self, record):
+        return all(_test(condition, record) for condition in self.conditions)
+
+
+# 2. Combining the Conditions of One Rule per Field
+# Several Eq/In conditions on one field keep the values accepted by all of them; several ranges keep their overlap.
+def _tighter(a, a_included, b, b_included, prefer_larger):
+    if a is None:
+        return b, b_included
+    if b is None or a == b:
+        return a, a_included and (b_included if b is not None else True)
+    return (a, a_included) if (a > b) == prefer_larger else (b, b_included)
+
+
+def _field_constraints(rule):
+    values = {}  # field -> set of accepted values
+    ranges = {}  # field -> (low, include_low, high, include_high)
+    customs = []
+    for condition in rule.conditions:
+        if isinstance(condition, Custom):
+            customs.append(condition)
+        elif isinstance(condition, Range):
+            low, include_low, high, include_high = ranges.get(condition.field, (None, True, None, True))
+            low, include_low = _tighter(low, include_low, condition.low, condition.include_low, True)
+            high, include_high = _tighter(high, include_high, condition.high, condition.include_high, False)
+            ranges[condition.field] = (low, include_low, high, include_high)
+        else:
+            accepted = {condition.value} if isinstance(condition, Eq) else set(_in_values(condition.values))
+            values[condition.field] = values[condition.field] & accepted if condition.field in values else accepted
+    return values, ranges, customs
+
+
+# 3. Field Indexes
+# Each index turns a record into the bits of the rules it does not rule out, or None when it can't place the
+# value; the record is then evaluated with the plain ladder.
+def _is_nan(value):
+    return isinstance(value, float) and value != value
+
+
+# Ranges only bisect values of the same kind as their boundaries: any real number for numeric boundaries,
+# otherwise the boundaries' own type.
+def _kind(value):
+    return Real if isinstance(value, Real) else type(value)
+
+
+def _value_index(field, accepted_by_rule, all_rules):
+    unconstrained = all_rules
+    table = {}
+    for bit, accepted in accepted_by_rule:
+        unconstrained &= ~bit
+        for value in accepted:
+            table[value] = table.get(value, 0) | bit
+    for value in table:
+        table[value] |= unconstrained
+
+    def candidates(record):
+        value = record.get(field, _MISSING)
+        if _is_nan(value):  # NaN equals nothing, but the table would find the same NaN object
+            return None
+        try:
+            return table.get(value, unconstrained)
+        except TypeError:  # Unhashable value
+            return None
+    return candidates
+
+
+# With boundaries b0 < b1 < ... the intervals are numbered: 0 = below b0, 1 = exactly b0, 2 = between b0 and b1, ...
+# A rule's bit is switched on at its first interval and off after its last one (a difference array of XORs).
+def _range_index(field, range_by_rule, all_rules):
+    bounds = sorted({bound for _, (low, _, high, _) in range_by_rule for bound in (low, high) if bound is not None})
+    position = {bound: i for i, bound in enumerate(bounds)}
+    kinds = {_kind(bound) for bound in bounds}
+    toggles = [0] * (2 * len(bounds) + 2)
+    unconstrained = all_rules
+    for bit, (low, include_low, high, include_high) in range_by_rule:
+        unconstrained &= ~bit
+        first = 0 if low is None else 2 * position[low] + (1 if include_low else 2)
+        last = 2 * len(bounds) if high is None else 2 * position[high] + (1 if include_high else 0)
+        if first <= last:
+            toggles[first] ^= bit
+            toggles[last + 1] ^= bit
+    masks = []
+    mask = 0
+    for toggle in toggles[:-1]:
+        mask ^= toggle
+        masks.append(mask | unconstrained)
+
+    def candidates(record):
+        value = record.get(field, _MISSING)
+        if value is _MISSING:
+            return unconstrained
+        if not bounds:  # Only ranges without boundaries, which accept any value
+            return masks[0]
+        if _kind(value) not in kinds or _is_nan(value):
+            return None
+        i = bisect_left(bounds, value)
+        return masks[2 * i + 1 if i < len(bounds) and bounds[i] == value else 2 * i]
+    return candidates
+
+
+# 4. The Decision Table
+class DecisionTable:
+    def __init__(self, rules, default=None):
+        self.rules = [rule if isinstance(rule, Rule) else Rule(*rule) for rule in rules]
+        self.default = default
+        self._results = [rule.result for rule in self.rules]
+        self._all_rules = (1 << len(self.rules)) - 1
+        self._customs = []
+        value_constraints = {}  # field -> [(bit, accepted values)]
+        range_constraints = {}  # field -> [(bit, range)]
+        for number, rule in enumerate(self.rules):
+            bit = 1 << number
+            values, ranges, customs = _field_constraints(rule)
+            for field, accepted in values.items():
+                value_constraints.setdefault(field, []).append((bit, accepted))
+            for field, bounds in ranges.items():
+                range_constraints.setdefault(field, []).append((bit, bounds))
+            self._customs.append(customs)
+        # Until calibrate() measures them, indexes that constrain more rules are assumed to remove more.
+        indexes = [(len(constraints), _value_index(field, constraints, self._all_rules))
+                   for field, constraints in value_constraints.items()]
+        indexes += [(len(constraints), _range_index(field, constraints, self._all_rules))
+                    for field, constraints in range_constraints.items()]
+        indexes.sort(key=lambda item: -item[0])
+        self._indexes = [index for _, index in indexes]
+        self.calibrated = False
+
+    def __len__(self):
+        return len(self.rules)
+
+    # Orders the indexes by the average number of rules they leave over, fewest first.
+    def calibrate(self, records):
+        records = list(records)
+        if not records:
+            return
+
+        def remaining(index):
+            masks = (index(record) for record in records)
+            return sum(bin(self._all_rules if mask is None else mask).count("1") for mask in masks)
+        self._indexes.sort(key=remaining)
+        self.calibrated = True
+
+    def evaluate(self, record=None, **fields):
+        if record is None:
+            record = fields
+        candidates = self._all_rules
+        for index in self._indexes:
+            mask = index(record)
+            if mask is None:
+                return self.evaluate_linear(record)
+            candidates &= mask
+            if not candidates:
+                return self.default
+        while candidates:
+            lowest = candidates & -candidates
+            number = lowest.bit_length() - 1
+            customs = self._customs[number]
+            if not customs or all(_test(condition, record) for condition in customs):
+                return self._results[number]
+            candidates ^= lowest
+        return self.default
+
+    def evaluate_many(self, records):
+        records = iter(records)
+        if not self.calibrated:
+            sample = list(islice(records, CALIBRATION_SIZE))
+            self.calibrate(sample)
+            records = chain(sample, records)
+        evaluate = self.evaluate
+        return [evaluate(record) for record in records]
+
+    # The plain if/elif ladder, for comparison.
+    def evaluate_linear(self, record=None, **fields):
+        if record is None:
+            record = fields
+        for rule in self.rules:
+            if rule.matches(record):
+                return rule.result
+        return self.default
+
+
+# Example usage of the decision table (same conditions as ConditionalOperations.py):
+if __name__ == "__main__":
+    import random
+    import time
+
+    # check_number(n) as data
+    check_number = DecisionTable([
+        Rule([Range("n", low=0, include_low=False)], "Positive"),
+        Rule([Eq("n", 0)], "Zero"),
+    ], default="Negative")
+    print(check_number.evaluate(n=10), check_number.evaluate(n=0), check_number.evaluate(n=-5))  # Output: Positive Zero Negative
+
+    # if z > 10 ... elif z == 8 ... else ...
+    z_ladder = DecisionTable([
+        Rule([Range("z", low=10, include_low=False)], "z is greater than 10"),
+        Rule([Eq("z", 8)], "z is equal to 8"),
+    ], default="z is less than 10 but not 8")
+    print(z_ladder.evaluate(z=8))  # Output: z is equal to 8
+
+    # (e > 40 and e < 60) or (e == 100): "or" becomes two rules with the same result
+    e_rules = DecisionTable([
+        Rule([Range("e", 40, 60, include_low=False)], "in range"),
+        Rule([Eq("e", 100)], "in range"),
+    ], default="out of range")
+    print(e_rules.evaluate_many([{"e": 50}, {"e": 60}, {"e": 100}]))  # Output: ['in range', 'out of range', 'in range']
+
+    # The awkward cases agree with the ladder too: a string in In(), NaN, values of another type, missing fields
+    awkward = DecisionTable([
+        Rule([In("c", "US")], "us"),
+        Rule([Range("x", None, 5)], "lo"),
+        Rule([Range("x")], "any x"),
+        Rule([Custom(lambda y: y is None, "y")], "no y"),
+    ], default="d")
+    records = [{"c": "US"}, {"c": "U", "y": 1}, {"x": float("nan"), "y": 1}, {"x": 3}, {"x": "a", "y": 1}, {"x": [1]},
+               {"c": ["US"], "y": 1}, {"y": 1}]
+    print([awkward.evaluate(record) for record in records])  # Output: ['us', 'd', 'any x', 'lo', 'any x', 'any x', 'd', 'd']
+    print(all(awkward.evaluate(record) == awkward.evaluate_linear(record) for record in records))  # Output: True
+
+    # Routing: 2000 rules over country, amount and a custom check
+    countries = ["US", "DE", "IN", "BR", "JP", "FR"]
+    rules = []
+    for number in range(2000):
+        low = random.randrange(0, 10_000)
+        conditions = [In("country", random.sample(countries, 2)), Range("amount", low, low + random.randrange(1, 500))]
+        if number % 10 == 0:
+            conditions.append(Custom(lambda record: record["priority"] > 5))
+        rules.append(Rule(conditions, f"route-{number}"))
+    routing = DecisionTable(rules, default="manual-review")
+    events = [{"country": random.choice(countries), "amount": random.randrange(0, 10_500), "priority": random.randrange(10)}
+              for _ in range(20_000)]
+
+    start = time.perf_counter()
+    compiled = routing.evaluate_many(events)
+    compiled_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    linear = [routing.evaluate_linear(event) for event in events]
+    linear_seconds = time.perf_counter() - start
+    print(compiled == linear, linear_seconds > 10 * compiled_seconds)  # Output: True True
@@ -0,0 +1,218 @@
+# Filename: VectorizedConditions.py
+
+'''
+Conditions over Columns: check_number(n) and "Positive" if c > 0 else "Non-Positive" from ConditionalOperations.py decide one value per call. The functions here take a whole column of values (a list, an array.array or a NumPy array) and return a column of results, one per value.
+
+Masks: A comparison like greater(column, 0) gives a mask, a column of booleans with one entry per value. logical_and(), logical_or() and logical_not() combine masks the way 'and', 'or' and 'not' combine conditions.
+
+where(mask, if_true, if_false): The ternary operator for columns. Where the mask is True the result comes from if_true, otherwise from if_false. Both can be a single value or a column.
+
+select(masks, choices, default): The if/elif/else ladder for columns. Each value gets the choice of the first mask that is True for it, or the default if none is.
+
+Array Backend: With NumPy the comparisons, where() and select() are np.greater, np.where and np.select: a few passes over contiguous buffers in C instead of millions of Python calls. An array.array is read by NumPy without copying. NumPy results are NumPy arrays.
+
+Results: to_list() turns a result of either backend into a plain list of Python values.
+
+Fallback Switch: NumPy is optional. Pass backend="python" (or set USE_NUMPY = False) to get plain lists computed with map() and comprehensions; this is also used automatically when NumPy is not installed. Both backends give the same results as the scalar code, NaN included.
+'''
+
+import operator
+from array import array
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python version still works.
+    np = None
+
+USE_NUMPY = True
+
+PYTHON = "python"
+NUMPY = "numpy"
+
+
+# 1. Choosing a Backend
+# backend=None means "NumPy if it is installed and USE_NUMPY is True".
+def _use_numpy(backend):
+    if backend is None:
+        backend = NUMPY if USE_NUMPY and np is not None else PYTHON
+    if backend == PYTHON:
+        return False
+    if backend != NUMPY:
+        raise ValueError(f"unknown backend: {backend!r}")
+    if np is None:
+        raise ImportError("the numpy backend requires NumPy to be installed")
+    return True
+
+
+# An array.array of numbers already is a contiguous buffer, NumPy can use it as it is.
+def _as_array(values):
+    if isinstance(values, array) and values.typecode not in ("u", "w"):
+        return np.frombuffer(values, dtype=values.typecode)
+    return np.asarray(values)
+
+
+def _is_scalar(value):
+    return isinstance(value, (str, bytes)) or not hasattr(value, "__len__")
+
+
+# 2. Masks
+# The Python versions run operator.gt and friends through map(), so no Python-level loop is involved.
+# Columns of different lengths raise ValueError on both backends, like np.greater does.
+def _compare(numpy_name, python_function, column, value, backend):
+    if _use_numpy(backend):
+        return getattr(np, numpy_name)(_as_array(column), value)
+    if _is_scalar(value):
+        return list(map(python_function, column, repeat(value)))
+    return [python_function(a, b) for a, b in zip(column, value, strict=True)]
+
+
+def greater(column, value, backend=None):
+    return _compare("greater", operator.gt, column, value, backend)
+
+
+def greater_equal(column, value, backend=None):
+    return _compare("greater_equal", operator.ge, column, value, backend)
+
+
+def less(column, value, backend=None):
+    return _compare("less", operator.lt, column, value, backend)
+
+
+def less_equal(column, value, backend=None):
+    return _compare("less_equal", operator.le, column, value, backend)
+
+
+def equal(column, value, backend=None):
+    return _compare("equal", operator.eq, column, value, backend)
+
+
+def not_equal(column, value, backend=None):
+    return _compare("not_equal", operator.ne, column, value, backend)
+
+
+# low < value < high by default, like Range in RuleEngine.py the ends can be included.
+def between(column, low, high, include_low=False, include_high=False, backend=None):
+    above = (greater_equal if include_low else greater)(column, low, backend)
+    below = (less_equal if include_high else less)(column, high, backend)
+    return logical_and(above, below, backend)
+
+
+# value in values, for every value of the column.
+def isin(column, values, backend=None):
+    if _use_numpy(backend):
+        return np.isin(_as_array(column), list(values))
+    return list(map(frozenset(values).__contains__, column))
+
+
+def logical_and(mask, other, backend=None):
+    if _use_numpy(backend):
+        return np.logical_and(mask, other)
+    return [bool(a and b) for a, b in zip(mask, other, strict=True)]
+
+
+def logical_or(mask, other, backend=None):
+    if _use_numpy(backend):
+        return np.logical_or(mask, other)
+    return [bool(a or b) for a, b in zip(mask, other, strict=True)]
+
+
+def logical_not(mask, backend=None):
+    if _use_numpy(backend):
+        return np.logical_not(mask)
+    return list(map(operator.not_, mask))
+
+
+# 3. where() and select()
+def where(mask, if_true, if_false, backend=None):
+    if _use_numpy(backend):
+        return np.where(mask, if_true, if_false)
+    if _is_scalar(if_true) and _is_scalar(if_false):
+        return [if_true if flag else if_false for flag in mask]
+    if _is_scalar(if_true):
+        return [if_true if flag else b for flag, b in zip(mask, if_false, strict=True)]
+    if _is_scalar(if_false):
+        return [a if flag else if_false for flag, a in zip(mask, if_true, strict=True)]
+    return [a if flag else b for flag, a, b in zip(mask, if_true, if_false, strict=True)]
+
+
+# The choices are applied from the last mask to the first, so the first True mask is the one that stays.
+def select(masks, choices, default=0, backend=None):
+    masks = list(masks)
+    choices = list(choices)
+    if len(masks) != len(choices):
+        raise ValueError("list of cases must be same length as list of conditions")
+    if _use_numpy(backend):
+        return np.select(masks, choices, default)
+    if not masks:
+        raise ValueError("select with an empty condition list is not possible")
+    result = default
+    for mask, choice in zip(reversed(masks), reversed(choices)):
+        result = where(mask, choice, result, PYTHON)
+    return result
+
+
+# 4. The Conditionals from ConditionalOperations.py
+# check_number(n) for every n: "Positive" if n > 0, "Zero" if n == 0, otherwise "Negative".
+def classify_sign(column, backend=None):
+    if _use_numpy(backend):
+        column = _as_array(column)
+    return select([greater(column, 0, backend), equal(column, 0, backend)], ["Positive", "Zero"], "Negative", backend)
+
+
+# "Positive" if c > 0 else "Non-Positive" for every c.
+def positive_or_not(column, backend=None):
+    return where(greater(column, 0, backend), "Positive", "Non-Positive", backend)
+
+
+# 5. Parity Check
+# Compares both backends with the scalar code from ConditionalOperations.py.
+def _check_number(n):
+    if n > 0:
+        return "Positive"
+    elif n == 0:
+        return "Zero"
+    else:
+        return "Negative"
+
+
+# A result column as a plain list of Python values, whatever the backend.
+def to_list(column):
+    if np is not None and isinstance(column, np.ndarray):
+        return column.tolist()
+    return list(column)
+
+
+def check_parity(column):
+    expected_signs = [_check_number(n) for n in column]
+    expected_ternary = ["Positive" if c > 0 else "Non-Positive" for c in column]
+    backends = (PYTHON, NUMPY) if np is not None else (PYTHON,)
+    return all(to_list(classify_sign(column, backend)) == expected_signs
+               and to_list(positive_or_not(column, backend)) == expected_ternary
+               for backend in backends)
+
+
+# Example usage of the column conditionals (same values as ConditionalOperations.py):
+if __name__ == "__main__":
+    print(to_list(classify_sign([10, 0, -5])))  # Output: ['Positive', 'Zero', 'Negative']
+    print(to_list(positive_or_not([5, 0, -3])))  # Output: ['Positive', 'Non-Positive', 'Non-Positive']
+
+    # (e > 40 and e < 60) or (e == 100) for a column of e
+    e = [50, 60, 100, 7]
+    in_range = logical_or(between(e, 40, 60, backend=PYTHON), equal(e, 100, backend=PYTHON), backend=PYTHON)
+    print(where(in_range, "in range", "out of range", backend=PYTHON))  # Output: ['in range', 'out of range', 'in range', 'out of range']
+
+    # if z > 10 ... elif z == 8 ... else ..., with one result column per branch
+    z = array("q", [12, 8, 3])
+    print(select([greater(z, 10, PYTHON), equal(z, 8, PYTHON)], [z, 0], -1, backend=PYTHON))  # Output: [12, 0, -1]
+
+    # Membership: "banana" in fruits, for a column of words
+    print(isin(["banana", "grape"], ["apple", "banana", "cherry"], backend=PYTHON))  # Output: [True, False]
+
+    # Both backends agree with check_number(), including NaN and floats
+    print(check_parity([3, 0, -2, 0.5, -0.0, float("nan"), float("inf")]))  # Output: True
+
+    # Ten million values classified with a few passes over the column
+    values = array("q", range(-5_000_000, 5_000_000))
+    signs = classify_sign(values)
+    print(signs[0], signs[5_000_000], signs[-1])  # Output: Negative Zero Positive
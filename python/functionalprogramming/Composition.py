@@ -0,0 +1,104 @@
+# Filename: Composition.py
+
+'''
+compose(f, g, h): Returns one function that computes f(g(h(x))), the functions are applied right to left like in mathematics.
+
+pipe(h, g, f): The same chain written left to right, in the order the functions are applied.
+
+Single Frame: The chain is compiled into one generated function (x = h(x); x = g(x); return f(x)), so a chain of N functions costs one extra call frame instead of N nested lambdas.
+
+Flattening: Composing an already composed function splices its steps into the new chain instead of nesting it.
+
+Batch Application: Every composed function has a .batch(iterable) method that runs the whole chain over many values in one generated loop.
+'''
+
+# Attribute holding the flat list of steps (in application order) of a composed function.
+STEPS_ATTRIBUTE = "composed_steps"
+
+
+# 1. Flattening Nested Compositions
+def _flatten_steps(funcs):
+    steps = []
+    for func in funcs:
+        if not callable(func):
+            raise TypeError(f"{func!r} is not callable")
+        steps.extend(getattr(func, STEPS_ATTRIBUTE, (func,)))
+    return steps
+
+
+# 2. Generating the Composed Function
+# Every step gets a local name _f0, _f1, ... and the body applies them one after another.
+def _build(steps):
+    namespace = {f"_f{i}": step for i, step in enumerate(steps)}
+    body = "".join(f"    x = _f{i}(x)\n" for i in range(len(steps)))
+    source = (
+        "def composed(x):\n"
+        f"{body}"
+        "    return x\n"
+        "\n"
+        "def batch(items):\n"
+        "    results = []\n"
+        "    append = results.append\n"
+        "    for x in items:\n"
+        f"{_indent(body)}"
+        "        append(x)\n"
+        "    return results\n"
+    )
+    exec(compile(source, "<composed>", "exec"), namespace)
+    composed = namespace["composed"]
+    composed.batch = namespace["batch"]
+    setattr(composed, STEPS_ATTRIBUTE, tuple(steps))
+    names = [getattr(step, "__name__", repr(step)) for step in steps]
+    composed.__name__ = composed.__qualname__ = "pipe(" + ", ".join(names) + ")"
+    return composed
+
+
+def _indent(text):
+    return "".join("    " + line + "\n" for line in text.splitlines())
+
+
+# 3. compose() and pipe()
+def pipe(*funcs):
+    steps = _flatten_steps(funcs)
+    if not steps:
+        return _identity
+    return _build(steps)
+
+
+def compose(*funcs):
+    return pipe(*reversed(funcs))
+
+
+def _identity(x):
+    return x
+
+
+_identity.batch = list
+setattr(_identity, STEPS_ATTRIBUTE, ())
+
+
+# Example usage of compose() and pipe():
+if __name__ == "__main__":
+    def add_one(x):
+        return x + 1
+
+    def square_number(x):
+        return x ** 2
+
+    # The composed_function from FunctionalProgramming.py section 7
+    composed_function = compose(square_number, add_one)
+    print(composed_function(4))  # Output: 25 (4 + 1 = 5, 5^2 = 25)
+
+    # pipe() lists the steps in the order they run
+    print(pipe(add_one, square_number)(4))  # Output: 25
+
+    # Nested compositions are flattened into one chain
+    chain = pipe(composed_function, pipe(add_one, add_one))
+    print(len(chain.composed_steps))  # Output: 4
+    print(chain(4))  # Output: 27
+
+    # Batch application over many values
+    print(composed_function.batch(range(5)))  # Output: [1, 4, 9, 16, 25]
+
+    # A 1000-step chain is still a single call
+    print(pipe(*[add_one] * 1000)(0))  # Output: 1000
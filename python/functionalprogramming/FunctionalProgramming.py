@@ -141,6 +141,34 @@ print(result)  # Output: 64 (squares of 2 and 4: 4 * 16 = 64)
 result = reduce(lambda x, y: x + " " + y, filter(lambda name: len(name) > 3, map(lambda name: name.upper(), names)))
 print(result)  # Output: 'ALICE CHARLIE'
 
+# 10. Lazy Stream Pipelines (see StreamPipeline.py)
+# A Stream records map/filter stages lazily, fuses them and runs them in a single pass without intermediate lists.
+
+from StreamPipeline import Stream
+
+# Example: The same even-squares product as in section 9, written as a left-to-right pipeline
+result = Stream(numbers).filter(lambda x: x % 2 == 0).map(lambda x: x ** 2).reduce(lambda x, y: x * y)
+print(result)  # Output: 64
+
+# 11. Memoization (see Memoization.py)
+# A memoized function remembers its results, so repeated calls with the same arguments become cache lookups.
+
+from Memoization import memoize, memoize_partial
+
+memoized_power = memoize(power, max_entries=1000)
+memoized_square = memoize_partial(partial(memoized_power, exponent=2))
+print(memoized_square(5), memoized_square(5))  # Output: 25 25 (the second call is a cache hit)
+print(memoized_power.cache_info().hits)  # Output: 1
+
+# 12. Compiled Function Composition (see Composition.py)
+# compose() turns a chain of functions into one generated function instead of nested lambdas.
+
+from Composition import compose
+
+composed_function = compose(square_number, add_one)
+print(composed_function(4))  # Output: 25 (same as section 7)
+print(composed_function.batch(numbers))  # Output: [4, 9, 16, 25, 36]
+
 # Example outputs for each functional programming operation:
 print(f"Squares using map: {squared_numbers}")
 print(f"Even numbers using filter: {even_numbers}")
@@ -0,0 +1,262 @@
+# Filename: Memoization.py
+
+'''
+Memoization: Remembering the result of a function call so that calling it again with the same arguments is a dictionary lookup.
+
+Eviction Policies: When the cache is full an entry has to go. LRU drops the least recently used entry, LFU the least frequently used one, TTL the oldest one.
+
+Time To Live (ttl): Entries older than ttl seconds are treated as missing and recomputed, with any policy.
+
+Size Limits: max_entries bounds the number of entries (at least 1, None for no limit), max_bytes bounds their (shallow, sys.getsizeof) size in bytes.
+
+Statistics: Every cache counts hits, misses, evictions and expirations, see cache_info().
+
+Thread Safety: The cache is protected by a lock, so a memoized function can be shared between threads. The function itself runs outside the lock.
+
+Partial Functions: memoize_partial() memoizes a functools.partial keyed on all of its arguments (the bound ones plus the call ones), so partials of the same function can share one cache.
+'''
+
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from functools import partial, update_wrapper
+
+LRU = "lru"
+LFU = "lfu"
+TTL = "ttl"
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "expirations", "entries", "bytes"])
+
+# Separates positional from keyword arguments inside a cache key.
+_KWARGS_MARK = object()
+
+
+# 1. Building Cache Keys
+# Keyword arguments are sorted, so f(a=1, b=2) and f(b=2, a=1) share an entry.
+def make_key(args, kwargs):
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires", "frequency")
+
+    def __init__(self, value, size, expires):
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.frequency = 1
+
+
+# 2. The Cache
+# LRU and TTL keep entries in an OrderedDict (oldest first); LFU keeps one OrderedDict per use count.
+class MemoCache:
+    def __init__(self, policy=LRU, max_entries=128, max_bytes=None, ttl=None, sizeof=sys.getsizeof, clock=time.monotonic):
+        if policy not in (LRU, LFU, TTL):
+            raise ValueError(f"unknown eviction policy: {policy!r}")
+        if policy == TTL and ttl is None:
+            raise ValueError("the ttl policy needs a ttl")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1 (or None for no limit)")
+        self.policy = policy
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self._frequencies = {}  # LFU only: use count -> OrderedDict of keys with that count
+        self._min_frequency = 0
+        self._bytes = 0
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry)
+
+    # Returns (True, value) on a hit and (False, None) on a miss.
+    def lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+            if self._expired(entry):
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return False, None
+            self._hits += 1
+            self._touch(key, entry)
+            return True, entry.value
+
+    def store(self, key, value):
+        size = self._sizeof(key) + self._sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # Bigger than the whole cache, it would only evict everything else.
+        expires = self._clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._make_room(size)
+            entry = _Entry(value, size, expires)
+            self._entries[key] = entry
+            self._bytes += size
+            if self.policy == LFU:
+                self._frequencies.setdefault(1, OrderedDict())[key] = None
+                self._min_frequency = 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._frequencies.clear()
+            self._min_frequency = 0
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._expirations, len(self._entries), self._bytes)
+
+    # Internal helpers, always called with the lock held.
+    def _expired(self, entry):
+        return entry.expires is not None and entry.expires <= self._clock()
+
+    def _touch(self, key, entry):
+        if self.policy == LRU:
+            self._entries.move_to_end(key)
+        elif self.policy == LFU:
+            bucket = self._frequencies[entry.frequency]
+            del bucket[key]
+            if not bucket:
+                del self._frequencies[entry.frequency]
+                if self._min_frequency == entry.frequency:
+                    self._min_frequency += 1
+            entry.frequency += 1
+            self._frequencies.setdefault(entry.frequency, OrderedDict())[key] = None
+        # TTL keeps insertion order, a hit does not make an entry younger.
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        if self.policy == LFU:
+            bucket = self._frequencies[entry.frequency]
+            del bucket[key]
+            if not bucket:
+                del self._frequencies[entry.frequency]
+        return entry
+
+    def _victim(self):
+        if self.policy == LFU:
+            if self._min_frequency not in self._frequencies:
+                self._min_frequency = min(self._frequencies)
+            return next(iter(self._frequencies[self._min_frequency]))
+        return next(iter(self._entries))
+
+    def _make_room(self, size):
+        if self.policy == TTL:
+            # Entries are in expiry order, so the expired ones are all at the front.
+            while self._entries:
+                key, entry = next(iter(self._entries.items()))
+                if not self._expired(entry):
+                    break
+                self._remove(key)
+                self._expirations += 1
+        while self._entries and (
+                (self.max_entries is not None and len(self._entries) >= self.max_entries)
+                or (self.max_bytes is not None and self._bytes + size > self.max_bytes)):
+            self._remove(self._victim())
+            self._evictions += 1
+
+
+# 3. The memoize Decorator
+# Use as @memoize, @memoize(policy="lfu", max_entries=1000) or memoize(func, cache=shared_cache).
+def memoize(func=None, *, policy=LRU, max_entries=128, max_bytes=None, ttl=None, cache=None):
+    if func is None:
+        return partial(memoize, policy=policy, max_entries=max_entries, max_bytes=max_bytes, ttl=ttl, cache=cache)
+    if cache is None:
+        cache = MemoCache(policy, max_entries, max_bytes, ttl)
+
+    def wrapper(*args, **kwargs):
+        key = make_key(args, kwargs)
+        try:
+            found, value = cache.lookup(key)
+        except TypeError:  # Unhashable arguments cannot be cached.
+            return func(*args, **kwargs)
+        if found:
+            return value
+        value = func(*args, **kwargs)
+        cache.store(key, value)
+        return value
+
+    if not isinstance(func, partial):
+        update_wrapper(wrapper, func)
+    wrapper.__wrapped__ = func
+    wrapper.cache = cache
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+# 4. Memoizing Partial Functions
+# partial(power, exponent=2)(5) is cached as power(5, exponent=2), so the bound arguments are part of the key.
+# If the partial wraps an already memoized function, that function's cache is reused, so cache options
+# (policy=, max_entries=, ..., cache=) are only accepted for a function that is not memoized yet.
+def memoize_partial(partial_func, **cache_options):
+    inner = partial_func.func
+    if hasattr(inner, "cache"):
+        if cache_options:
+            raise TypeError(f"{inner.__name__} is already memoized, its cache options cannot be changed here")
+    else:
+        inner = memoize(inner, **cache_options)
+    return partial(inner, *partial_func.args, **partial_func.keywords)
+
+
+# Example usage of the memoization layer:
+if __name__ == "__main__":
+    # The higher-order helpers from FunctionalProgramming.py
+    @memoize
+    def create_multiplier(n):
+        return lambda x: x * n
+
+    @memoize(policy=LFU, max_entries=2)
+    def apply_function(func, value):
+        return func(value)
+
+    @memoize(max_bytes=10_000, ttl=60)
+    def power(base, exponent):
+        return base ** exponent
+
+    # The same multiplier is returned for the same n
+    print(create_multiplier(2) is create_multiplier(2))  # Output: True
+
+    square = lambda x: x ** 2
+    print(apply_function(square, 6))  # Output: 36
+    print(apply_function(square, 6))  # Output: 36 (from the cache)
+    print(apply_function.cache_info())  # Output: CacheInfo(hits=1, misses=1, evictions=0, expirations=0, entries=1, bytes=0)
+
+    # Partials of a memoized function share its cache
+    square_partial = memoize_partial(partial(power, exponent=2))
+    cube_partial = memoize_partial(partial(power, exponent=3))
+    print(square_partial(5), cube_partial(3), power(5, exponent=2))  # Output: 25 27 25
+    print(power.cache_info().hits)  # Output: 1
+    try:
+        memoize_partial(partial(power, exponent=4), max_entries=10)
+    except TypeError as error:
+        print(error)  # Output: power is already memoized, its cache options cannot be changed here
+
+    # LRU eviction with a small cache
+    @memoize(max_entries=2)
+    def slow_square(x):
+        return x * x
+
+    for x in (1, 2, 1, 3, 2):
+        slow_square(x)
+    print(slow_square.cache_info())  # Output: CacheInfo(hits=1, misses=4, evictions=2, expirations=0, entries=2, bytes=0)
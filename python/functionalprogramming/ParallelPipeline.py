@@ -0,0 +1,157 @@
+# Filename: ParallelPipeline.py
+
+'''
+Chunking: The input is cut into chunks of chunk_size elements, without copying the whole input up front. At most two chunks per worker are handed to the pool ahead of the results being collected, so a generator is read as the workers need more input.
+
+Process Pool: Every chunk is sent to a concurrent.futures.ProcessPoolExecutor worker which runs the map/filter stages over it.
+
+Partial Reduction: Each worker also reduces its own chunk, so only one value per chunk travels back to the parent process.
+
+Tree Reduction: Partial results are combined pairwise, level by level, which is correct for any associative function (it does not need to be commutative, chunk order is kept).
+
+Picklable Functions: Work is shipped to other processes with pickle, so map/filter/reduce functions must be module-level functions (not lambdas or closures).
+'''
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+from itertools import islice
+
+from StreamPipeline import Stream, run_stages
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Chunks submitted ahead per worker: enough to keep every worker busy, few enough to bound memory.
+CHUNKS_PER_WORKER = 2
+
+_MISSING = object()
+
+
+# 1. Chunking the Input
+# islice() pulls chunk_size elements at a time, so generators and ranges are never fully materialized here.
+def iter_chunks(iterable, chunk_size):
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# 2. Work Done Inside a Worker Process
+# These run in the worker processes, so they must live at module level to be picklable.
+def _collect_chunk(stages, chunk):
+    return list(run_stages(chunk, stages))
+
+
+def _reduce_chunk(stages, func, chunk):
+    # Returns (has_value, value) because a chunk may be filtered down to nothing.
+    iterator = run_stages(chunk, stages)
+    for first in iterator:
+        return True, reduce(func, iterator, first)
+    return False, None
+
+
+# Like executor.map(), but at most window chunks are submitted ahead of the result being collected.
+# executor.map() submits every chunk up front, which would read a whole generator into memory.
+def _bounded_map(executor, func, chunks, window):
+    pending = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(func, chunk))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _window(max_workers):
+    return CHUNKS_PER_WORKER * (max_workers or os.cpu_count() or 1)
+
+
+# 3. Tree Reduction
+# Combines neighbours pairwise: [a, b, c, d] -> [a*b, c*d] -> [a*b*c*d]. Order is preserved.
+def tree_reduce(func, values):
+    values = list(values)
+    if not values:
+        raise TypeError("tree_reduce() of empty sequence with no initial value")
+    while len(values) > 1:
+        paired = [func(values[i], values[i + 1]) for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+# 4. Parallel Map / Filter
+# Returns the mapped and filtered elements in their original order.
+def parallel_map(func, iterable, chunk_size=DEFAULT_CHUNK_SIZE, max_workers=None):
+    return parallel_collect(Stream(iterable).map(func), chunk_size, max_workers)
+
+
+def parallel_filter(predicate, iterable, chunk_size=DEFAULT_CHUNK_SIZE, max_workers=None):
+    return parallel_collect(Stream(iterable).filter(predicate), chunk_size, max_workers)
+
+
+def parallel_collect(stream, chunk_size=DEFAULT_CHUNK_SIZE, max_workers=None):
+    stages = stream.stages
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chunks = iter_chunks(stream.source, chunk_size)
+        results = []
+        for part in _bounded_map(executor, partial(_collect_chunk, stages), chunks, _window(max_workers)):
+            results.extend(part)
+        return results
+
+
+# 5. Parallel Reduce
+# Every chunk is reduced in a worker, then the partial results are tree-reduced in the parent.
+def parallel_reduce(func, stream, initial=_MISSING, chunk_size=DEFAULT_CHUNK_SIZE, max_workers=None):
+    if not isinstance(stream, Stream):
+        stream = Stream(stream)
+    stages = stream.stages
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chunks = iter_chunks(stream.source, chunk_size)
+        reduced = _bounded_map(executor, partial(_reduce_chunk, stages, func), chunks, _window(max_workers))
+        partials = [value for has_value, value in reduced if has_value]
+    if initial is not _MISSING:
+        partials.insert(0, initial)
+    return tree_reduce(func, partials)
+
+
+# Example usage of the parallel pipeline.
+# The functions are defined at module level so the worker processes can unpickle them.
+def square(x):
+    return x ** 2
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+def add(x, y):
+    return x + y
+
+
+def multiply(x, y):
+    return x * y
+
+
+# The __main__ guard is required: worker processes may import this module again on start-up.
+if __name__ == "__main__":
+    numbers = [1, 2, 3, 4, 5]
+
+    # Parallel version of list(map(lambda x: x ** 2, numbers))
+    print(parallel_map(square, numbers, chunk_size=2))  # Output: [1, 4, 9, 16, 25]
+
+    # Parallel version of reduce(lambda x, y: x * y, numbers)
+    print(parallel_reduce(multiply, numbers, chunk_size=2))  # Output: 120
+
+    # Filtering even numbers, squaring them, and then calculating their product, in parallel
+    pipeline = Stream(numbers).filter(is_even).map(square)
+    print(parallel_reduce(multiply, pipeline, chunk_size=2))  # Output: 64
+
+    # A large CPU-bound job split over all available cores
+    total = parallel_reduce(add, Stream(range(2_000_000)).map(square), chunk_size=100_000)
+    print(total == sum(x ** 2 for x in range(2_000_000)))  # Output: True
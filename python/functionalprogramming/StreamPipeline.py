@@ -0,0 +1,154 @@
+# Filename: StreamPipeline.py
+
+'''
+Lazy Stages: map() and filter() calls on a Stream only record a stage, nothing is computed until the stream is consumed.
+
+Stage Fusion: Adjacent map stages are composed into one function and adjacent filter stages into one predicate, so every element passes through the pipeline in a single loop.
+
+No Intermediate Lists: Elements flow one at a time from the source to the terminal operation (reduce, sum, count, to_list ...), so memory beyond the source stays O(1).
+
+Reusable Pipelines: A Stream is immutable, every stage returns a new Stream, so a partially built pipeline can be shared and extended.
+
+Terminal Operations: reduce(), to_list(), sum(), count(), first() and plain iteration consume the stream.
+'''
+
+from functools import reduce
+
+MAP = "map"
+FILTER = "filter"
+
+# Marker for "no initial value" in reduce(), None is a valid initial value.
+_MISSING = object()
+
+
+# 1. Fusing Stages
+# Adjacent maps become one composed function and adjacent filters become one predicate.
+def _compose_maps(funcs):
+    if len(funcs) == 1:
+        return funcs[0]
+
+    def fused_map(item):
+        for func in funcs:
+            item = func(item)
+        return item
+    return fused_map
+
+
+def _combine_filters(predicates):
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def fused_filter(item):
+        for predicate in predicates:
+            if not predicate(item):
+                return False
+        return True
+    return fused_filter
+
+
+def fuse_stages(stages):
+    # Returns a new list of (kind, func) pairs where no two neighbours have the same kind.
+    fused = []
+    group_kind = None
+    group = []
+    for kind, func in stages:
+        if kind != group_kind and group:
+            fused.append((group_kind, _compose_maps(group) if group_kind == MAP else _combine_filters(group)))
+            group = []
+        group_kind = kind
+        group.append(func)
+    if group:
+        fused.append((group_kind, _compose_maps(group) if group_kind == MAP else _combine_filters(group)))
+    return fused
+
+
+# 2. Running the Fused Pipeline
+# One generator walks the source once and pushes each element through every fused stage.
+def run_stages(source, stages):
+    fused = fuse_stages(stages)
+
+    # Common shapes get a dedicated loop without the inner stage loop.
+    if not fused:
+        return iter(source)
+    if len(fused) == 1:
+        kind, func = fused[0]
+        return map(func, source) if kind == MAP else filter(func, source)
+
+    def pipeline():
+        for item in source:
+            for kind, func in fused:
+                if kind == MAP:
+                    item = func(item)
+                elif not func(item):
+                    break
+            else:
+                yield item
+    return pipeline()
+
+
+# 3. The Stream Class
+# A Stream remembers its source and the list of stages; every stage method returns a new Stream.
+class Stream:
+    __slots__ = ("source", "stages")
+
+    def __init__(self, source, stages=()):
+        self.source = source
+        self.stages = tuple(stages)
+
+    def __repr__(self):
+        return f"Stream({self.source!r}, stages={[kind for kind, _ in self.stages]})"
+
+    # Lazy stages
+    def map(self, func):
+        return Stream(self.source, self.stages + ((MAP, func),))
+
+    def filter(self, predicate):
+        return Stream(self.source, self.stages + ((FILTER, predicate),))
+
+    # Iterating a stream runs the fused pipeline once over the source.
+    def __iter__(self):
+        return run_stages(self.source, self.stages)
+
+    # Terminal operations
+    def reduce(self, func, initial=_MISSING):
+        if initial is _MISSING:
+            return reduce(func, iter(self))
+        return reduce(func, iter(self), initial)
+
+    def to_list(self):
+        return list(iter(self))
+
+    def sum(self, start=0):
+        return sum(iter(self), start)
+
+    def count(self):
+        total = 0
+        for _ in iter(self):
+            total += 1
+        return total
+
+    def first(self, default=None):
+        return next(iter(self), default)
+
+
+# Example usage of the Stream pipeline:
+if __name__ == "__main__":
+    numbers = [1, 2, 3, 4, 5]
+    names = ['alice', 'bob', 'charlie']
+
+    # Filtering even numbers, squaring them, and then calculating their product
+    product = Stream(numbers).filter(lambda x: x % 2 == 0).map(lambda x: x ** 2).reduce(lambda x, y: x * y)
+    print(product)  # Output: 64
+
+    # Converting names to uppercase, keeping the long ones and joining them
+    joined = Stream(names).map(lambda name: name.upper()).filter(lambda name: len(name) > 3).reduce(lambda x, y: x + " " + y)
+    print(joined)  # Output: 'ALICE CHARLIE'
+
+    # Stages are only recorded until the stream is consumed, so huge sources stay cheap.
+    big = Stream(range(5_000_000)).map(lambda x: x * 3).map(lambda x: x + 1).filter(lambda x: x % 2 == 0)
+    print(big.count())  # Output: 2500000
+
+    # A pipeline can be shared and extended without affecting the original.
+    evens = Stream(numbers).filter(lambda x: x % 2 == 0)
+    print(evens.to_list())  # Output: [2, 4]
+    print(evens.map(lambda x: x * 10).to_list())  # Output: [20, 40]